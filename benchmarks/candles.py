@@ -0,0 +1,55 @@
+# run it like PYTHONPATH=. python3 benchmarks/candles.py
+# Compare local candle aggregation from one `ticks` stream per symbol with one `candles` stream per granularity
+import json
+import time
+
+from deriv_api.candles import CandleAggregator
+
+SYMBOLS = [f'R_{i}' for i in range(50)]
+GRANULARITIES = [60, 300, 900]
+ROUNDS = 600  # one tick per symbol per round
+
+
+def tick_frame(symbol, epoch, quote):
+    return json.dumps({'echo_req': {'ticks': symbol, 'subscribe': 1}, 'msg_type': 'tick', 'req_id': 1,
+                       'subscription': {'id': 'a-subscription-id'},
+                       'tick': {'ask': quote, 'bid': quote, 'epoch': epoch, 'id': 'a-subscription-id',
+                                'pip_size': 2, 'quote': quote, 'symbol': symbol}})
+
+
+def ohlc_frame(symbol, granularity, epoch, quote):
+    return json.dumps({'echo_req': {'ticks_history': symbol, 'granularity': granularity, 'style': 'candles',
+                                    'end': 'latest', 'subscribe': 1},
+                       'msg_type': 'ohlc', 'req_id': 1, 'subscription': {'id': 'a-subscription-id'},
+                       'ohlc': {'close': str(quote), 'epoch': epoch, 'granularity': granularity,
+                                'high': str(quote), 'id': 'a-subscription-id', 'low': str(quote),
+                                'open': str(quote), 'open_time': epoch - epoch % granularity,
+                                'pip_size': 2, 'symbol': symbol}})
+
+
+def main():
+    epochs = range(1634000000, 1634000000 + ROUNDS * 2, 2)
+    tick_frames = [tick_frame(symbol, epoch, 1000.0 + epoch % 97) for epoch in epochs for symbol in SYMBOLS]
+    ohlc_frames = [ohlc_frame(symbol, granularity, epoch, 1000.0 + epoch % 97)
+                   for epoch in epochs for symbol in SYMBOLS for granularity in GRANULARITIES]
+
+    aggregator = CandleAggregator(GRANULARITIES)
+    start = time.process_time()
+    for frame in tick_frames:
+        aggregator.on_tick(json.loads(frame))
+    local = time.process_time() - start
+
+    latest = {}
+    start = time.process_time()
+    for frame in ohlc_frames:
+        ohlc = json.loads(frame)['ohlc']
+        latest[(ohlc['symbol'], ohlc['granularity'])] = ohlc
+    server = time.process_time() - start
+
+    print(f"local aggregation: {len(SYMBOLS):4} subscriptions, {len(tick_frames):7} frames, {local:.3f}s CPU")
+    print(f"server candles:    {len(SYMBOLS) * len(GRANULARITIES):4} subscriptions, {len(ohlc_frames):7} frames, "
+          f"{server:.3f}s CPU")
+
+
+if __name__ == '__main__':
+    main()
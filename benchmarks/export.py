@@ -0,0 +1,57 @@
+# run it like PYTHONPATH=. python3 benchmarks/export.py
+# Export the statement of a 1M rows account through DerivAPI, with an in-process connection serving the pages
+import asyncio
+import json
+import resource
+
+from deriv_api.deriv_api import DerivAPI
+from deriv_api.export import TransactionExport
+
+ROWS = 1000000
+LATENCY = 0.02  # seconds between a request and its response
+
+
+class Connection:
+    """Serves `statement` pages like the server, `LATENCY` seconds after the request"""
+
+    def __init__(self):
+        self.responses = asyncio.Queue()
+
+    async def send(self, message):
+        request = json.loads(message)
+        asyncio.get_event_loop().call_later(LATENCY, self.responses.put_nowait, self.page(request))
+
+    @staticmethod
+    def page(request):
+        offset, limit = request['offset'], request['limit']
+        rows = [{'action_type': 'buy', 'amount': -10, 'balance_after': 10000 - i % 1000, 'contract_id': i,
+                 'longcode': 'Win payout if Volatility 100 Index is strictly higher than entry spot at 5 ticks.',
+                 'payout': 19.5, 'reference_id': i, 'shortcode': f'CALL_R_100_19.5_{1634000000 + i}_5T_S0P_0',
+                 'transaction_id': i, 'transaction_time': 1634000000 + i}
+                for i in range(offset, min(offset + limit, ROWS))]
+        return json.dumps({'echo_req': request, 'msg_type': 'statement', 'req_id': request['req_id'],
+                           'statement': {'count': len(rows), 'transactions': rows}})
+
+    async def recv(self):
+        return await self.responses.get()
+
+    async def close(self):
+        pass
+
+
+async def main():
+    api = DerivAPI(connection=Connection())
+    for prefetch in (1, 4):
+        export = TransactionExport(api, 'statement', prefetch=prefetch)
+        rows = 0
+        async for row in export:
+            rows += 1
+        print(f"prefetch {prefetch}: {rows} rows, {export.pages} pages, {export.elapsed:.2f}s, "
+              f"{export.rows_per_second:,.0f} rows/s")
+    print(f"max RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB, "
+          f"cached responses: {len(api.cache.storage.store)}")
+    await api.clear()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
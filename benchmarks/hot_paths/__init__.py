@@ -0,0 +1,119 @@
+"""
+Benchmarks of the hot paths of DerivAPI
+---------------------------------------
+Repeatable micro benchmarks of the request and response paths, and end-to-end scenarios against an in-process
+connection. The results are saved as JSON and compared against a baseline, to flag slowdowns in CI.
+
+run it like
+PYTHONPATH=. python3 -m benchmarks.hot_paths --output results.json
+PYTHONPATH=. python3 -m benchmarks.hot_paths --baseline baseline.json --threshold 0.2
+
+A benchmark is a coroutine function registered with `benchmark`: it sets up what it needs, runs the number of
+operations it is given and returns the seconds they took, setup and cleanup excluded.
+"""
+import asyncio
+import contextlib
+import gc
+import io
+import json
+import platform
+import statistics
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+# registered benchmarks, by name
+benchmarks: Dict[str, Callable[[int], Awaitable[float]]] = {}
+# operations per run, by benchmark name
+operations: Dict[str, int] = {}
+
+
+def benchmark(name: str, ops: int):
+    """Register a benchmark running `ops` operations per run"""
+    def register(func):
+        benchmarks[name] = func
+        operations[name] = ops
+        return func
+
+    return register
+
+
+async def run_one(name: str, repeat: int) -> dict:
+    func, ops = benchmarks[name], operations[name]
+    runs = []
+    # the first run warms up the caches and the lazily generated code, it is not counted
+    for _ in range(repeat + 1):
+        # like timeit, the garbage collector does not run during the timing
+        gc.collect()
+        gc.disable()
+        try:
+            runs.append(await func(ops) / ops * 1e9)
+        finally:
+            gc.enable()
+    runs = runs[1:]
+    return {'ns_per_op': statistics.median(runs), 'min_ns_per_op': min(runs), 'ops': ops, 'repeat': repeat}
+
+
+async def run(names: List[str], repeat: int = 5) -> dict:
+    """Run benchmarks, returns the results with the environment they were measured in"""
+    results = {}
+    for name in names:
+        # DerivAPI prints its tasks, keep the report readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[name] = await run_one(name, repeat)
+    return {
+        'created_at': time.time(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[dict]:
+    """
+    Compare results with a baseline
+
+    param {dict} results - Results of `run`
+    param {dict} baseline - Results of a previous `run`
+    param {float} threshold - Relative slowdown above which a benchmark is a regression, 0.2 for 20%
+
+    returns {List[dict]} - The benchmarks of both, with their ratio new / baseline and regression flag
+    """
+    comparison = []
+    for name, result in results['results'].items():
+        base = baseline['results'].get(name)
+        if not base:
+            continue
+        # the fastest runs are the least disturbed by the machine
+        ratio = result['min_ns_per_op'] / base['min_ns_per_op']
+        comparison.append({'name': name, 'baseline_min_ns_per_op': base['min_ns_per_op'],
+                           'min_ns_per_op': result['min_ns_per_op'], 'ratio': ratio,
+                           'regression': ratio > 1 + threshold})
+    return comparison
+
+
+def load(path: str) -> dict:
+    with open(path) as file:
+        return json.load(file)
+
+
+def save(results: dict, path: str) -> None:
+    with open(path, 'w') as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+
+def run_sync(names: List[str], repeat: int = 5) -> dict:
+    return asyncio.run(run(names, repeat))
+
+
+def report(results: dict, comparison: Optional[List[dict]] = None) -> str:
+    lines = []
+    compared = {item['name']: item for item in comparison or []}
+    for name, result in results['results'].items():
+        line = f"{name:45} {result['ns_per_op']:12,.0f} ns/op  min {result['min_ns_per_op']:12,.0f}"
+        item = compared.get(name)
+        if item:
+            line += f"  {item['ratio']:6.2f}x baseline min" + ('  REGRESSION' if item['regression'] else '')
+        lines.append(line)
+    return '\n'.join(lines)
@@ -0,0 +1,41 @@
+import argparse
+import sys
+
+from benchmarks.hot_paths import benchmarks, compare, load, report, run_sync, save
+# registers the benchmarks
+from benchmarks.hot_paths import micro, scenarios  # noqa: F401
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python3 -m benchmarks.hot_paths',
+                                     description='Benchmarks of the hot paths of DerivAPI')
+    parser.add_argument('--filter', default='', help='only run the benchmarks whose name contains this')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per benchmark, the median is kept')
+    parser.add_argument('--output', help='save the results as JSON to this file')
+    parser.add_argument('--baseline', help='compare with the JSON results of a previous run')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='relative slowdown flagged as a regression, 0.2 for 20%%')
+    parser.add_argument('--list', action='store_true', help='list the benchmarks')
+    args = parser.parse_args(argv)
+
+    names = [name for name in benchmarks if args.filter in name]
+    if args.list:
+        print('\n'.join(names))
+        return 0
+
+    results = run_sync(names, args.repeat)
+    comparison = compare(results, load(args.baseline), args.threshold) if args.baseline else None
+    if comparison is not None:
+        results['comparison'] = comparison
+    if args.output:
+        save(results, args.output)
+    print(report(results, comparison))
+    if comparison and any(item['regression'] for item in comparison):
+        print(f'regressions above {args.threshold:.0%}: '
+              f"{', '.join(item['name'] for item in comparison if item['regression'])}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
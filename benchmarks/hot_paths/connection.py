@@ -0,0 +1,47 @@
+import asyncio
+import json
+from typing import Dict
+
+
+class Connection:
+    """
+    In-process connection answering every request at once, like the server would.
+    Tick subscriptions get a first tick, more ticks are sent with `push_ticks`.
+    """
+
+    def __init__(self) -> None:
+        self.frames: asyncio.Queue = asyncio.Queue()
+        # req_id of the tick subscription of every symbol
+        self.tick_req_ids: Dict[str, int] = {}
+        self.subscriptions = 0
+
+    async def send(self, message: str) -> None:
+        request = json.loads(message)
+        msg_type = next(iter(request))
+        req_id = request['req_id']
+        if msg_type == 'ticks':
+            self.subscriptions += 1
+            self.tick_req_ids[request['ticks']] = req_id
+            self.frames.put_nowait(self.tick(request, req_id, 1))
+            return
+        self.frames.put_nowait(json.dumps({'echo_req': request, 'msg_type': msg_type, 'req_id': req_id,
+                                           msg_type: 'pong' if msg_type == 'ping' else 1}))
+
+    def tick(self, request: dict, req_id: int, epoch: int) -> str:
+        return json.dumps({'echo_req': request, 'msg_type': 'tick', 'req_id': req_id,
+                           'subscription': {'id': f'subscription-{req_id}'},
+                           'tick': {'ask': 1.5, 'bid': 1.4, 'epoch': epoch, 'id': f'subscription-{req_id}',
+                                    'pip_size': 2, 'quote': 1.45, 'symbol': request['ticks']}})
+
+    def push_ticks(self, symbol: str, count: int) -> None:
+        """Send `count` ticks of a subscribed symbol"""
+        req_id = self.tick_req_ids[symbol]
+        request = {'ticks': symbol, 'subscribe': 1, 'req_id': req_id}
+        for epoch in range(count):
+            self.frames.put_nowait(self.tick(request, req_id, epoch))
+
+    async def recv(self) -> str:
+        return await self.frames.get()
+
+    async def close(self) -> None:
+        pass
@@ -0,0 +1,128 @@
+import asyncio
+import time
+
+from benchmarks.hot_paths import benchmark
+from benchmarks.hot_paths.connection import Connection
+from deriv_api.cache import Cache
+from deriv_api.deriv_api import DerivAPI
+from deriv_api.deriv_api_calls import DerivAPICalls
+from deriv_api.in_memory import InMemory
+from deriv_api.utils import dict_to_cache_key
+
+REQUEST = {'ticks_history': 'R_50', 'adjust_start_time': 1, 'count': 10, 'end': 'latest', 'start': 1,
+           'style': 'ticks'}
+
+
+class Calls(DerivAPICalls):
+    """The call layer alone, the requests are returned instead of sent"""
+
+    async def send(self, request):
+        return request
+
+
+class Api:
+    """Answers every request, for the cache"""
+
+    async def send(self, request):
+        return {'echo_req': request, 'msg_type': 'ticks_history', 'history': {}}
+
+
+def ticks_received(source, count: int, consumers: int = 1) -> asyncio.Future:
+    """A future resolved once every consumer of `source` received `count` ticks"""
+    done = asyncio.get_event_loop().create_future()
+    remaining = count * consumers
+
+    def on_tick(response):
+        nonlocal remaining
+        remaining -= 1
+        if not remaining and not done.done():
+            done.set_result(None)
+
+    for _ in range(consumers):
+        source.subscribe(on_tick)
+    return done
+
+
+@benchmark('dict_to_cache_key', 100000)
+async def cache_key(ops):
+    started_at = time.perf_counter()
+    for _ in range(ops):
+        dict_to_cache_key(REQUEST)
+    return time.perf_counter() - started_at
+
+
+@benchmark('dict_to_cache_key with req_id', 100000)
+async def cache_key_with_req_id(ops):
+    request = {**REQUEST, 'req_id': 1, 'passthrough': {'tag': 1}}
+    started_at = time.perf_counter()
+    for _ in range(ops):
+        dict_to_cache_key(request)
+    return time.perf_counter() - started_at
+
+
+@benchmark('process_request validated', 20000)
+async def process_request(ops):
+    calls = Calls()
+    started_at = time.perf_counter()
+    for _ in range(ops):
+        await calls.ticks_history(REQUEST)
+    return time.perf_counter() - started_at
+
+
+@benchmark('process_request trusted', 20000)
+async def process_request_trusted(ops):
+    calls = Calls()
+    started_at = time.perf_counter()
+    for _ in range(ops):
+        await calls.ticks_history(REQUEST, trusted=True)
+    return time.perf_counter() - started_at
+
+
+@benchmark('Cache.send hit', 20000)
+async def cache_send(ops):
+    cache = Cache(Api(), InMemory())
+    await cache.send(REQUEST)
+    started_at = time.perf_counter()
+    for _ in range(ops):
+        await cache.send(REQUEST)
+    return time.perf_counter() - started_at
+
+
+@benchmark('__wait_data dispatch', 20000)
+async def wait_data(ops):
+    connection = Connection()
+    api = DerivAPI(connection=connection)
+    source = await api.subscribe({'ticks': 'R_50'})
+    await ticks_received(source, 1)
+    received = ticks_received(source, ops)
+    started_at = time.perf_counter()
+    connection.push_ticks('R_50', ops)
+    await received
+    elapsed = time.perf_counter() - started_at
+    await api.clear()
+    return elapsed
+
+
+@benchmark('SubscriptionManager.subscribe existing', 20000)
+async def subscribe_existing(ops):
+    api = DerivAPI(connection=Connection())
+    request = {'ticks': 'R_50'}
+    await ticks_received(await api.subscribe(request), 1)
+    started_at = time.perf_counter()
+    for _ in range(ops):
+        await api.subscribe(request)
+    elapsed = time.perf_counter() - started_at
+    await api.clear()
+    return elapsed
+
+
+@benchmark('SubscriptionManager.subscribe new', 2000)
+async def subscribe_new(ops):
+    api = DerivAPI(connection=Connection())
+    started_at = time.perf_counter()
+    # until the first tick of every stream
+    first_ticks = [ticks_received(await api.subscribe({'ticks': f'R_{i}'}), 1) for i in range(ops)]
+    await asyncio.gather(*first_ticks)
+    elapsed = time.perf_counter() - started_at
+    await api.clear()
+    return elapsed
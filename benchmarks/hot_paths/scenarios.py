@@ -0,0 +1,83 @@
+import asyncio
+import time
+
+from benchmarks.hot_paths import benchmark
+from benchmarks.hot_paths.connection import Connection
+from benchmarks.hot_paths.micro import ticks_received
+from deriv_api.deriv_api import DerivAPI
+from benchmarks.mock_server import MockServer
+
+SYMBOLS = 100
+
+
+@benchmark('e2e ping sequential', 5000)
+async def ping_sequential(ops):
+    api = DerivAPI(connection=Connection())
+    await api.ping()
+    started_at = time.perf_counter()
+    for _ in range(ops):
+        await api.ping()
+    elapsed = time.perf_counter() - started_at
+    await api.clear()
+    return elapsed
+
+
+@benchmark('e2e ping concurrent', 5000)
+async def ping_concurrent(ops):
+    api = DerivAPI(connection=Connection())
+    await api.ping()
+    started_at = time.perf_counter()
+    await asyncio.gather(*(api.ping() for _ in range(ops)))
+    elapsed = time.perf_counter() - started_at
+    await api.clear()
+    return elapsed
+
+
+@benchmark('tick fan-out 1 stream x 100 consumers', 2000)
+async def fan_out_consumers(ops):
+    """ns per tick received by all the consumers"""
+    connection = Connection()
+    api = DerivAPI(connection=connection)
+    source = await api.subscribe({'ticks': 'R_50'})
+    await ticks_received(source, 1)
+    received = ticks_received(source, ops, consumers=100)
+    started_at = time.perf_counter()
+    connection.push_ticks('R_50', ops)
+    await received
+    elapsed = time.perf_counter() - started_at
+    await api.clear()
+    return elapsed
+
+
+@benchmark(f'tick fan-out {SYMBOLS} streams', 20000)
+async def fan_out_streams(ops):
+    """ns per tick, the ticks spread over the streams"""
+    connection = Connection()
+    api = DerivAPI(connection=connection)
+    sources = [await api.subscribe({'ticks': f'R_{i}'}) for i in range(SYMBOLS)]
+    await asyncio.gather(*(ticks_received(source, 1) for source in sources))
+    received = [ticks_received(source, ops // SYMBOLS) for source in sources]
+    started_at = time.perf_counter()
+    for i in range(SYMBOLS):
+        connection.push_ticks(f'R_{i}', ops // SYMBOLS)
+    await asyncio.gather(*received)
+    elapsed = time.perf_counter() - started_at
+    await api.clear()
+    return elapsed
+
+
+@benchmark(f'mock server loopback {SYMBOLS} streams', 20000)
+async def mock_server_loopback(ops):
+    """ns per tick from the mock server, over a loopback transport handing over the parsed frames"""
+    server = MockServer(symbols=SYMBOLS, seed=1)
+    api = DerivAPI(transport=server.loopback())
+    sources = [await api.subscribe({'ticks': f'R_{i}'}) for i in range(SYMBOLS)]
+    await asyncio.gather(*(ticks_received(source, 1) for source in sources))
+    received = [ticks_received(source, ops // SYMBOLS) for source in sources]
+    started_at = time.perf_counter()
+    for _ in range(ops // SYMBOLS):
+        server.step()
+    await asyncio.gather(*received)
+    elapsed = time.perf_counter() - started_at
+    await api.clear()
+    return elapsed
@@ -0,0 +1,52 @@
+# run it like PYTHONPATH=. python3 benchmarks/import_time.py
+# Import time and memory of deriv_api_calls in fresh interpreters, with and without cached bytecode
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+RUNS = 20
+
+# the dependencies of deriv_api_calls are imported first, only the module itself is measured
+TIME = '''
+import numbers, time
+start = time.perf_counter()
+import deriv_api.deriv_api_calls
+print(time.perf_counter() - start)
+'''
+
+MEMORY = '''
+import numbers, tracemalloc
+tracemalloc.start()
+import deriv_api.deriv_api_calls
+print(tracemalloc.get_traced_memory()[0])
+'''
+
+
+def run(code, env):
+    return float(subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True,
+                                check=True).stdout)
+
+
+def measure(env):
+    return (statistics.median(run(TIME, env) for _ in range(RUNS)),
+            statistics.median(run(MEMORY, env) for _ in range(RUNS)))
+
+
+def main():
+    env = {**os.environ, 'PYTHONPATH': os.getcwd()}
+    with tempfile.TemporaryDirectory() as cache:
+        results = {
+            'no bytecode cache': measure({**env, 'PYTHONDONTWRITEBYTECODE': '1', 'PYTHONPYCACHEPREFIX': cache}),
+        }
+        env = {key: value for key, value in env.items() if key != 'PYTHONDONTWRITEBYTECODE'}
+        subprocess.run([sys.executable, '-c', 'import deriv_api.deriv_api_calls'],
+                       env={**env, 'PYTHONPYCACHEPREFIX': cache}, check=True)
+        results['cached bytecode'] = measure({**env, 'PYTHONPYCACHEPREFIX': cache})
+    for name, (elapsed, allocated) in results.items():
+        print(f"{name:18} {elapsed * 1000:6.1f} ms, {allocated / 1024:6.0f} KB allocated")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,398 @@
+"""
+Mock API server
+---------------
+A local websocket server answering like the Deriv API, for load and latency tests without network access.
+It answers `ping`, `ticks`, `proposal`, `buy`, `proposal_open_contract`, `forget` and `forget_all`, other
+requests get an `UnrecognisedRequest` error.
+
+Every symbol ticks `tick_rate` times per second, the tick and proposal streams of a symbol are updated on its
+ticks, the open contracts too until they expire after `contract_ticks` ticks.
+Responses can be delayed by `latency` seconds, a request gets an error response with the probability
+`error_rate`, and connections can be closed after `disconnect_after` seconds.
+
+run it like
+PYTHONPATH=. python3 -m benchmarks.mock_server --port 8765 --symbols 100 --tick-rate 100
+
+api = DerivAPI(endpoint='ws://localhost:8765', app_id=1)
+
+or in the same process, without sockets
+api = DerivAPI(transport=server.loopback())
+
+Without `start`, the symbols only tick on `step`, for deterministic runs over a loopback transport.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+from typing import Dict, List, Optional
+
+import websockets
+
+from deriv_api.transport import LoopbackTransport
+
+LONGCODE = 'Win payout if {symbol} is strictly higher than entry spot at {ticks} ticks after contract start time.'
+
+
+class Subscription:
+    """A stream of one connection"""
+
+    __slots__ = ('id', 'msg_type', 'request', 'symbol', 'client', 'contract')
+
+    def __init__(self, subs_id: str, msg_type: str, request: dict, symbol: str, client: 'Client',
+                 contract: Optional[dict] = None) -> None:
+        self.id = subs_id
+        self.msg_type = msg_type
+        self.request = request
+        self.symbol = symbol
+        self.client = client
+        self.contract = contract
+
+
+class Client:
+    """A connection to the server, with its subscriptions and contracts"""
+
+    def __init__(self, server: 'MockServer', websocket, encode: bool = True) -> None:
+        self.server = server
+        self.websocket = websocket
+        # the messages are sent as JSON, or as they are to a loopback transport
+        self.encode = encode
+        self.outgoing: asyncio.Queue = asyncio.Queue()
+        self.subscriptions: Dict[str, Subscription] = {}
+        self.proposals: Dict[str, dict] = {}
+        self.contracts: Dict[int, dict] = {}
+
+    def send(self, message: dict, delayed: bool = True) -> None:
+        """Queue a message, after the latency of the server for the responses"""
+        data = json.dumps(message) if self.encode else message
+        if delayed and self.server.latency:
+            asyncio.get_event_loop().call_later(self.server.latency, self.outgoing.put_nowait, data)
+        else:
+            self.outgoing.put_nowait(data)
+
+    async def write(self) -> None:
+        while True:
+            data = await self.outgoing.get()
+            try:
+                await self.websocket.send(data)
+            except websockets.ConnectionClosed:
+                return
+            self.server.messages_sent += 1
+
+
+class MockServer:
+    """
+    param {str} host - Interface to listen on
+    param {int} port - Port to listen on, 0 for any free port
+    param {int} symbols - Number of symbols, named R_0, R_1...
+    param {float} tick_rate - Ticks per second of every symbol
+    param {float} latency - Seconds added before every response, the stream updates are not delayed
+    param {float} error_rate - Probability of an error response to a request
+    param {float} disconnect_after - Seconds after which connections are closed, None to keep them
+    param {int} contract_ticks - Ticks after which the contracts bought expire
+    param {int} seed - Seed of the random quotes and errors
+
+    property {int} messages_sent - Number of messages sent to all the connections
+    """
+
+    def __init__(self, host: str = 'localhost', port: int = 8765, symbols: int = 10, tick_rate: float = 1.0,
+                 latency: float = 0.0, error_rate: float = 0.0, disconnect_after: Optional[float] = None,
+                 contract_ticks: int = 5, seed: Optional[int] = None) -> None:
+        self.host = host
+        self.port = port
+        self.symbols = [f'R_{i}' for i in range(symbols)]
+        self.tick_rate = tick_rate
+        self.latency = latency
+        self.error_rate = error_rate
+        self.disconnect_after = disconnect_after
+        self.contract_ticks = contract_ticks
+        self.random = random.Random(seed)
+        self.quotes = {symbol: 1000.0 for symbol in self.symbols}
+        # streams updated on the ticks of a symbol
+        self.streams: Dict[str, Dict[str, Subscription]] = {symbol: {} for symbol in self.symbols}
+        self.ids = itertools.count(1)
+        self.messages_sent = 0
+        self.server = None
+        self.ticker: Optional[asyncio.Task] = None
+
+    @property
+    def url(self) -> str:
+        return f'ws://{self.host}:{self.port}'
+
+    async def start(self) -> 'MockServer':
+        self.server = await websockets.serve(self.serve, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.ticker = asyncio.ensure_future(self.tick())
+        return self
+
+    async def stop(self) -> None:
+        if self.ticker:
+            self.ticker.cancel()
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+
+    def loopback(self, encode: bool = False) -> LoopbackTransport:
+        """
+        An in-process connection to the server, without sockets, see `deriv_api.transport`
+
+        param {bool} encode - Send JSON, or the response dicts without serializing them
+
+        returns {LoopbackTransport} - The transport to give to DerivAPI
+        """
+        transport = LoopbackTransport()
+        asyncio.ensure_future(self.serve(transport.peer, encode=encode))
+        return transport
+
+    async def serve(self, websocket, path: str = '', encode: bool = True) -> None:
+        client = Client(self, websocket, encode)
+        writer = asyncio.ensure_future(client.write())
+        closer = asyncio.get_event_loop().call_later(
+            self.disconnect_after, lambda: asyncio.ensure_future(websocket.close(1011, 'Mock disconnect'))) \
+            if self.disconnect_after is not None else None
+        try:
+            async for data in websocket:
+                self.on_request(client, json.loads(data))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            writer.cancel()
+            if closer:
+                closer.cancel()
+            for subscription in client.subscriptions.values():
+                self.streams[subscription.symbol].pop(subscription.id, None)
+
+    def on_request(self, client: Client, request: dict) -> None:
+        msg_type = next((key for key in handlers if key in request), None)
+        if msg_type is None:
+            return client.send(self.error(request, next(iter(request), ''), 'UnrecognisedRequest',
+                                          'Unrecognised request'))
+        if self.error_rate and self.random.random() < self.error_rate:
+            return client.send(self.error(request, msg_type, 'MockError', 'Error injected by the mock server'))
+        handlers[msg_type](self, client, request)
+
+    def response(self, request: dict, msg_type: str, body, subscription: Optional[Subscription] = None) -> dict:
+        response = {'echo_req': request, 'msg_type': msg_type, msg_type: body}
+        if 'req_id' in request:
+            response['req_id'] = request['req_id']
+        if 'passthrough' in request:
+            response['passthrough'] = request['passthrough']
+        if subscription:
+            response['subscription'] = {'id': subscription.id}
+        return response
+
+    def error(self, request: dict, msg_type: str, code: str, message: str) -> dict:
+        response = {'echo_req': request, 'msg_type': msg_type, 'error': {'code': code, 'message': message}}
+        if 'req_id' in request:
+            response['req_id'] = request['req_id']
+        return response
+
+    def subscribe(self, client: Client, msg_type: str, request: dict, symbol: str,
+                  contract: Optional[dict] = None) -> Subscription:
+        subs_id = f'{next(self.ids):032x}'
+        subscription = Subscription(subs_id, msg_type, request, symbol, client, contract)
+        client.subscriptions[subs_id] = subscription
+        self.streams[symbol][subs_id] = subscription
+        return subscription
+
+    def unsubscribe(self, client: Client, subs_id: str) -> bool:
+        subscription = client.subscriptions.pop(subs_id, None)
+        if subscription:
+            self.streams[subscription.symbol].pop(subs_id, None)
+        return subscription is not None
+
+    def check_symbol(self, client: Client, request: dict, msg_type: str, symbol) -> bool:
+        if symbol not in self.quotes:
+            client.send(self.error(request, msg_type, 'InvalidSymbol', f'Symbol {symbol} is invalid.'))
+            return False
+        return True
+
+    # handlers of the requests
+
+    def on_ping(self, client: Client, request: dict) -> None:
+        client.send(self.response(request, 'ping', 'pong'))
+
+    def on_ticks(self, client: Client, request: dict) -> None:
+        symbol = request['ticks']
+        if not self.check_symbol(client, request, 'tick', symbol):
+            return
+        subscription = self.subscribe(client, 'tick', request, symbol) if request.get('subscribe') else None
+        client.send(self.response(request, 'tick', self.tick_body(symbol, subscription), subscription))
+
+    def on_proposal(self, client: Client, request: dict) -> None:
+        symbol = request.get('symbol')
+        if not self.check_symbol(client, request, 'proposal', symbol):
+            return
+        subscription = self.subscribe(client, 'proposal', request, symbol) if request.get('subscribe') else None
+        client.send(self.response(request, 'proposal', self.proposal_body(client, request, subscription),
+                                  subscription))
+
+    def on_buy(self, client: Client, request: dict) -> None:
+        parameters = request.get('parameters')
+        if parameters:
+            if not self.check_symbol(client, request, 'buy', parameters.get('symbol')):
+                return
+            proposal = client.proposals[self.proposal_body(client, parameters, None)['id']]
+        else:
+            proposal = client.proposals.get(request['buy'])
+        if proposal is None:
+            return client.send(self.error(request, 'buy', 'InvalidContractProposal',
+                                          'Unknown contract proposal'))
+        if float(request.get('price', 0)) < proposal['ask_price']:
+            return client.send(self.error(request, 'buy', 'PriceMoved', 'The underlying market has moved too much '
+                                                                        'since you priced the contract.'))
+        contract_id = next(self.ids)
+        now = int(time.time())
+        contract = {
+            'contract_id': contract_id, 'underlying': proposal['symbol'], 'contract_type': 'CALL',
+            'currency': proposal['currency'], 'buy_price': proposal['ask_price'], 'payout': proposal['payout'],
+            'bid_price': proposal['ask_price'], 'profit': 0.0, 'purchase_time': now, 'date_start': now,
+            'entry_spot': self.quotes[proposal['symbol']], 'longcode': proposal['longcode'],
+            'shortcode': f"CALL_{proposal['symbol']}_{proposal['payout']}_{now}_{self.contract_ticks}T_S0P_0",
+            'is_sold': 0, 'status': 'open', 'ticks': 0
+        }
+        client.contracts[contract_id] = contract
+        # with `subscribe`, the contract updates follow on the stream of the buy
+        subscription = self.subscribe(client, 'proposal_open_contract', request, proposal['symbol'], contract) \
+            if request.get('subscribe') else None
+        client.send(self.response(request, 'buy', {
+            'balance_after': 10000.0, 'buy_price': contract['buy_price'], 'contract_id': contract_id,
+            'longcode': contract['longcode'], 'payout': contract['payout'], 'purchase_time': now,
+            'shortcode': contract['shortcode'], 'start_time': now, 'transaction_id': next(self.ids)
+        }, subscription))
+
+    def on_proposal_open_contract(self, client: Client, request: dict) -> None:
+        contract_id = request.get('contract_id')
+        contracts = [client.contracts[contract_id]] if contract_id in client.contracts else \
+            [] if contract_id else [contract for contract in client.contracts.values() if not contract['is_sold']]
+        if not contracts:
+            return client.send(self.response(request, 'proposal_open_contract', {}))
+        for contract in contracts:
+            subscription = self.subscribe(client, 'proposal_open_contract', request, contract['underlying'],
+                                          contract) if request.get('subscribe') and not contract['is_sold'] else None
+            client.send(self.response(request, 'proposal_open_contract', self.contract_body(contract, subscription),
+                                      subscription))
+
+    def on_forget(self, client: Client, request: dict) -> None:
+        client.send(self.response(request, 'forget', int(self.unsubscribe(client, request['forget']))))
+
+    def on_forget_all(self, client: Client, request: dict) -> None:
+        types = request['forget_all']
+        types = [types] if isinstance(types, str) else types
+        # `ticks` subscriptions are forgotten with the msg_type `ticks`
+        msg_types = ['tick' if msg_type == 'ticks' else msg_type for msg_type in types]
+        forgotten = [subs_id for subs_id, subscription in client.subscriptions.items()
+                     if subscription.msg_type in msg_types]
+        for subs_id in forgotten:
+            self.unsubscribe(client, subs_id)
+        client.send(self.response(request, 'forget_all', forgotten))
+
+    # bodies of the responses
+
+    def tick_body(self, symbol: str, subscription: Optional[Subscription]) -> dict:
+        quote = round(self.quotes[symbol], 2)
+        body = {'ask': round(quote + 0.01, 2), 'bid': round(quote - 0.01, 2), 'epoch': int(time.time()),
+                'pip_size': 2, 'quote': quote, 'symbol': symbol}
+        if subscription:
+            body['id'] = subscription.id
+        return body
+
+    def proposal_body(self, client: Client, request: dict, subscription: Optional[Subscription]) -> dict:
+        symbol = request['symbol']
+        amount = float(request.get('amount', 10))
+        ask_price = round(amount if request.get('basis', 'payout') == 'stake' else amount * 0.52, 2)
+        payout = round(ask_price / 0.52 if request.get('basis') == 'stake' else amount, 2)
+        proposal_id = subscription.id if subscription else f'{next(self.ids):032x}'
+        now = int(time.time())
+        body = {'ask_price': ask_price, 'date_start': now, 'display_value': f'{ask_price:.2f}', 'id': proposal_id,
+                'longcode': LONGCODE.format(symbol=symbol, ticks=self.contract_ticks), 'payout': payout,
+                'spot': round(self.quotes[symbol], 2), 'spot_time': now}
+        client.proposals[proposal_id] = {**body, 'symbol': symbol, 'currency': request.get('currency', 'USD')}
+        return body
+
+    def contract_body(self, contract: dict, subscription: Optional[Subscription]) -> dict:
+        body = {key: value for key, value in contract.items() if key != 'ticks'}
+        body['current_spot'] = round(self.quotes[contract['underlying']], 2)
+        body['current_spot_time'] = int(time.time())
+        if subscription:
+            body['id'] = subscription.id
+        return body
+
+    # the ticks of all the symbols
+
+    async def tick(self) -> None:
+        loop = asyncio.get_event_loop()
+        interval = 1 / self.tick_rate
+        next_at = loop.time()
+        while True:
+            next_at += interval
+            self.step()
+            await asyncio.sleep(max(0.0, next_at - loop.time()))
+
+    def step(self) -> None:
+        """One tick of every symbol"""
+        for symbol in self.symbols:
+            self.quotes[symbol] = max(1.0, self.quotes[symbol] + self.random.gauss(0, 1))
+            # the stream may end while it is updated
+            for subscription in list(self.streams[symbol].values()):
+                self.update(subscription)
+
+    def update(self, subscription: Subscription) -> None:
+        client, request = subscription.client, subscription.request
+        if subscription.msg_type == 'tick':
+            body = self.tick_body(subscription.symbol, subscription)
+        elif subscription.msg_type == 'proposal':
+            body = self.proposal_body(client, request, subscription)
+        else:
+            contract = subscription.contract
+            contract['ticks'] += 1
+            change = self.quotes[contract['underlying']] - contract['entry_spot']
+            contract['bid_price'] = round(contract['payout'] if change > 0 else 0.0, 2)
+            contract['profit'] = round(contract['bid_price'] - contract['buy_price'], 2)
+            if contract['ticks'] >= self.contract_ticks:
+                contract.update(is_sold=1, status='won' if change > 0 else 'lost',
+                                sell_price=contract['bid_price'], sell_time=int(time.time()))
+            body = self.contract_body(contract, subscription)
+            if contract['is_sold']:
+                self.unsubscribe(client, subscription.id)
+        client.send(self.response(request, subscription.msg_type, body, subscription), delayed=False)
+
+
+handlers = {
+    'ping': MockServer.on_ping,
+    'ticks': MockServer.on_ticks,
+    'proposal_open_contract': MockServer.on_proposal_open_contract,
+    'proposal': MockServer.on_proposal,
+    'buy': MockServer.on_buy,
+    'forget_all': MockServer.on_forget_all,
+    'forget': MockServer.on_forget,
+}
+
+
+async def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog='python3 -m benchmarks.mock_server', description='Mock Deriv API server')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--symbols', type=int, default=10, help='number of symbols, named R_0, R_1...')
+    parser.add_argument('--tick-rate', type=float, default=1.0, help='ticks per second of every symbol')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added before every response')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='probability of an error response')
+    parser.add_argument('--disconnect-after', type=float, help='seconds after which connections are closed')
+    parser.add_argument('--contract-ticks', type=int, default=5, help='ticks after which contracts expire')
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args(argv)
+    server = await MockServer(args.host, args.port, args.symbols, args.tick_rate, args.latency, args.error_rate,
+                              args.disconnect_after, args.contract_ticks, args.seed).start()
+    print(f'listening on {server.url}')
+    try:
+        while True:
+            sent = server.messages_sent
+            await asyncio.sleep(1)
+            print(f'{server.messages_sent - sent} messages/s')
+    finally:
+        await server.stop()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
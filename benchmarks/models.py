@@ -0,0 +1,66 @@
+# run it like PYTHONPATH=. python3 benchmarks/models.py
+# Compare the memory and the attribute access time of decoded response dicts and slotted models
+import json
+import time
+import tracemalloc
+
+from deriv_api.models import to_model
+
+CONTRACTS = 10000
+READS = 1000000
+
+
+def contract_frame(contract_id):
+    return json.dumps({'echo_req': {'proposal_open_contract': 1, 'subscribe': 1}, 'msg_type': 'proposal_open_contract',
+                       'proposal_open_contract': {
+                           'account_id': 12345, 'barrier': '1000.50', 'barrier_count': 1, 'bid_price': 9.5,
+                           'buy_price': 10, 'contract_id': contract_id, 'contract_type': 'CALL', 'currency': 'USD',
+                           'current_spot': 1001.2, 'current_spot_display_value': '1001.20',
+                           'current_spot_time': 1634000010, 'date_expiry': 1634000020, 'date_settlement': 1634000020,
+                           'date_start': 1634000000, 'display_name': 'Volatility 100 Index',
+                           'entry_spot': 1000.5, 'entry_spot_display_value': '1000.50', 'entry_tick': 1000.5,
+                           'entry_tick_display_value': '1000.50', 'entry_tick_time': 1634000002,
+                           'expiry_time': 1634000020,
+                           'id': f'id-{contract_id}', 'is_expired': 0, 'is_forward_starting': 0, 'is_intraday': 1,
+                           'is_path_dependent': 0, 'is_settleable': 0, 'is_sold': 0, 'is_valid_to_cancel': 0,
+                           'is_valid_to_sell': 1, 'longcode': 'Win payout if Volatility 100 Index is strictly higher '
+                                                            'than entry spot at 10 ticks after contract start time.',
+                           'payout': 19.5, 'profit': -0.5, 'profit_percentage': -5, 'purchase_time': 1634000000,
+                           'shortcode': f'CALL_R_100_19.5_1634000000_10T_S0P_0', 'status': 'open', 'tick_count': 10,
+                           'underlying': 'R_100'},
+                       'subscription': {'id': 'a-subscription-id'}})
+
+
+def measure_memory(build):
+    frames = [contract_frame(i) for i in range(CONTRACTS)]
+    tracemalloc.start()
+    objects = [build(json.loads(frame)) for frame in frames]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / len(objects), objects
+
+
+def main():
+    dict_size, dicts = measure_memory(lambda response: response['proposal_open_contract'])
+    model_size, contracts = measure_memory(to_model)
+    print(f"memory per contract: dict {dict_size:6.0f} bytes, model {model_size:6.0f} bytes")
+
+    response, contract = json.loads(contract_frame(1)), contracts[1]
+    start = time.perf_counter()
+    for _ in range(READS):
+        response.get('proposal_open_contract').get('bid_price')
+    dict_read = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(READS):
+        contract.bid_price
+    model_read = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(CONTRACTS):
+        to_model(response)
+    build = (time.perf_counter() - start) / CONTRACTS
+    print(f"field read: dict {dict_read / READS * 1e9:5.0f} ns, model {model_read / READS * 1e9:5.0f} ns; "
+          f"model build {build * 1e6:.2f} us")
+
+
+if __name__ == '__main__':
+    main()
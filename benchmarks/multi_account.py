@@ -0,0 +1,46 @@
+# run it like PYTHONPATH=. python3 benchmarks/multi_account.py
+# Compare buying a contract for many accounts with one `buy` per account and with multiple accounts batches
+import asyncio
+import time
+
+from deriv_api.multi_account import MultiAccountTrader
+
+ACCOUNTS = 500
+LATENCY = 0.05  # seconds per request
+PARAMETERS = {'amount': 10, 'basis': 'stake', 'contract_type': 'CALL', 'currency': 'USD', 'duration': 5,
+              'duration_unit': 't', 'symbol': 'R_100'}
+
+
+class API:
+    """Answers every request after `LATENCY`, the time a buy for one or many accounts takes on the server"""
+
+    def __init__(self):
+        self.requests = 0
+
+    async def send(self, request, cache=True):
+        self.requests += 1
+        await asyncio.sleep(LATENCY)
+        if 'buy' in request:
+            return {'msg_type': 'buy', 'buy': {'contract_id': 1}}
+        return {'msg_type': 'buy_contract_for_multiple_accounts', 'buy_contract_for_multiple_accounts': {
+            'result': [{'token': token, 'contract_id': 1} for token in request['tokens']]}}
+
+
+async def main():
+    tokens = [f'token{i}' for i in range(ACCOUNTS)]
+
+    api = API()
+    start = time.perf_counter()
+    for _ in tokens:  # one authorized api per account, each calls `buy`
+        await api.send({'buy': '1', 'price': 10, 'parameters': PARAMETERS})
+    loop = time.perf_counter() - start
+    print(f"per-account loop: {api.requests:4} requests, {loop:.2f}s")
+
+    api = API()
+    trader = MultiAccountTrader(api, tokens)
+    results = await trader.buy(price=10, parameters=PARAMETERS)
+    print(f"batched:          {api.requests:4} requests, {trader.elapsed:.2f}s, {len(results)} results")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,42 @@
+# run it like PYTHONPATH=. python3 benchmarks/process_request.py
+# Calls per second of DerivAPICalls methods, through `process_request`, with a `send` returning immediately,
+# validated and in trusted mode
+import asyncio
+import time
+
+from deriv_api.deriv_api_calls import DerivAPICalls
+
+CALLS = 100000
+
+requests = {
+    'proposal': {'proposal': 1, 'amount': 10, 'basis': 'stake', 'contract_type': 'CALL', 'currency': 'USD',
+                 'duration': 5, 'duration_unit': 't', 'symbol': 'R_100', 'barrier': '+0.1'},
+    'buy': {'buy': 'a-proposal-id', 'price': 10},
+    'ticks_history': {'ticks_history': 'R_100', 'end': 'latest', 'count': 100, 'style': 'ticks'},
+}
+
+
+class API(DerivAPICalls):
+    async def send(self, request):
+        return request
+
+
+async def measure(call, request, trusted):
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        await call(request.copy(), trusted=trusted)
+    return (time.perf_counter() - start) / CALLS
+
+
+async def main():
+    api = API()
+    for method, request in requests.items():
+        call = getattr(api, method)
+        validated = await measure(call, request, False)
+        trusted = await measure(call, request, True)
+        print(f"{method:14} validated {1 / validated:10,.0f} calls/s, trusted {1 / trusted:10,.0f} calls/s, "
+              f"{(validated - trusted) * 1e6:.2f} us saved per call")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+# run it like PYTHONPATH=. python3 benchmarks/request_allocations.py
+# Memory allocated per request with tracemalloc: peak bytes allocated while a request is prepared or sent, and
+# bytes still allocated after it, against an in-process connection answering at once
+import asyncio
+import json
+import statistics
+import tracemalloc
+
+from deriv_api.deriv_api import DerivAPI
+from deriv_api.deriv_api_calls import get_validator
+from deriv_api.prepared_request import PreparedRequest
+
+RUNS = 2000
+REQUEST = {'ticks_history': 'R_50', 'adjust_start_time': 1, 'count': 10, 'end': 'latest', 'start': 1,
+           'style': 'ticks'}
+
+
+class Connection:
+    """Answers every request at once with its `echo_req`"""
+
+    def __init__(self):
+        self.responses = asyncio.Queue()
+
+    async def send(self, message):
+        request = json.loads(message)
+        msg_type = next(iter(request))
+        self.responses.put_nowait(json.dumps({'echo_req': request, 'msg_type': msg_type,
+                                              'req_id': request['req_id'], msg_type: {}}))
+
+    async def recv(self):
+        return await self.responses.get()
+
+    async def close(self):
+        pass
+
+
+def prepare():
+    request = PreparedRequest(get_validator('ticks_history')(REQUEST), 1)
+    return request.cache_key, request.message
+
+
+async def measure(call):
+    """Median peak bytes and mean retained bytes of a call"""
+    result = call()
+    if asyncio.iscoroutine(result):
+        await result
+    peaks = []
+    tracemalloc.start()
+    started_with = tracemalloc.get_traced_memory()[0]
+    for _ in range(RUNS):
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        result = call()
+        if asyncio.iscoroutine(result):
+            await result
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    retained = (tracemalloc.get_traced_memory()[0] - started_with) / RUNS
+    tracemalloc.stop()
+    return statistics.median(peaks), retained
+
+
+async def main():
+    api = DerivAPI(connection=Connection())
+    calls = {
+        'prepare (validate, cache key, JSON)': prepare,
+        'api.ticks_history': lambda: api.ticks_history(REQUEST),
+        'api.ticks_history trusted': lambda: api.ticks_history(REQUEST, trusted=True),
+        'api.send, not cached': lambda: api.send(REQUEST, cache=False),
+        'api.cache.ticks_history, cached': lambda: api.cache.ticks_history(REQUEST),
+    }
+    for name, call in calls.items():
+        peak, retained = await measure(call)
+        print(f'{name:35} peak {peak:8,.0f} B  retained {retained:8,.1f} B per request')
+    assert REQUEST == {'ticks_history': 'R_50', 'adjust_start_time': 1, 'count': 10, 'end': 'latest', 'start': 1,
+                       'style': 'ticks'}, 'the request is never changed'
+    await api.clear()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
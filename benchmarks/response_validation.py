@@ -0,0 +1,36 @@
+# run it like PYTHONPATH=. python3 benchmarks/response_validation.py
+# Cost per frame of the response validation in `__wait_data`: disabled, sampled and on every frame
+import timeit
+
+from rx.subject import Subject
+
+from deriv_api.response_validation import ResponseValidator
+
+FRAMES = 1000000
+tick = {'echo_req': {'ticks': 'R_50', 'subscribe': 1}, 'msg_type': 'tick', 'subscription': {'id': 'abc'},
+        'tick': {'ask': 1.5, 'bid': 1.4, 'epoch': 1634000000, 'id': 'abc', 'pip_size': 2, 'quote': 1.45,
+                 'symbol': 'R_50'}}
+
+
+class Api:
+    response_validator = None
+
+
+def main():
+    api = Api()
+
+    def on_frame():
+        # the check done by `__wait_data` for every frame
+        if api.response_validator is not None:
+            api.response_validator.check(tick)
+
+    for name, validator in (('disabled', None), ('1 in 1000', ResponseValidator(Subject(), 1000)),
+                            ('1 in 100', ResponseValidator(Subject(), 100)),
+                            ('every frame', ResponseValidator(Subject(), 1))):
+        api.response_validator = validator
+        seconds = timeit.timeit(on_frame, number=FRAMES)
+        print(f'{name:12} {seconds / FRAMES * 1e9:6.0f} ns per frame')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# run it like PYTHONPATH=. python3 benchmarks/shared_memory_fanout.py
+# Latency from a tick published by SharedTickPublisher to its read by 8 worker processes
+import multiprocessing
+import statistics
+import time
+
+from deriv_api.shared_ticks import SharedTickPublisher, SharedTickReader
+
+WORKERS = 8
+TICKS = 2000
+INTERVAL = 0.001
+
+
+def worker(reader_args, ready, results):
+    reader = SharedTickReader(**reader_args)
+    latencies = []
+    counts = reader.counts()
+    ready.wait()
+    while reader.count('R_100') < TICKS:
+        if not reader.wait(counts, timeout=5):
+            break
+        now = time.perf_counter()
+        counts = reader.counts()
+        # the quote carries the publish time
+        epochs, quotes = reader.last('R_100', 1)
+        latencies.append(now - quotes[0])
+        del epochs, quotes
+    reader.close()
+    results.put(latencies)
+
+
+def main():
+    publisher = SharedTickPublisher(['R_100'], capacity=TICKS + 1)
+    ready = multiprocessing.Event()
+    results = multiprocessing.Queue()
+    workers = [multiprocessing.Process(target=worker, args=(publisher.reader_args(), ready, results))
+               for _ in range(WORKERS)]
+    for process in workers:
+        process.start()
+    time.sleep(0.5)
+    ready.set()
+    for i in range(TICKS):
+        publisher.append('R_100', i, time.perf_counter())
+        time.sleep(INTERVAL)
+    latencies = sorted(latency for _ in workers for latency in results.get(timeout=10))
+    for process in workers:
+        process.join()
+    publisher.close()
+    print(f"{WORKERS} workers, {TICKS} ticks, {len(latencies)} reads")
+    print(f"fan-out latency: median {statistics.median(latencies) * 1e6:.1f}us, "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1e6:.1f}us, max {latencies[-1] * 1e6:.1f}us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+# run it like PYTHONPATH=. python3 benchmarks/tick_store.py
+# Compare the memory used by 1M ticks kept in a TickStore with a list of tick dicts
+import time
+import tracemalloc
+
+from deriv_api.tick_store import TickStore
+
+TICKS = 1000000
+
+
+def tick_response(i):
+    return {'msg_type': 'tick', 'tick': {'symbol': 'R_100', 'epoch': 1634000000 + i, 'quote': 1000.0 + i * 0.01,
+                                         'ask': 1000.0, 'bid': 1000.0, 'id': 'a-tick-id', 'pip_size': 2}}
+
+
+def measure(name, store, append):
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(TICKS):
+        append(store, tick_response(i))
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:>20}: {current / 1024 / 1024:8.1f} MB per 1M ticks, {TICKS / elapsed:10.0f} appends/sec")
+
+
+def main():
+    measure('list of tick dicts', [], lambda store, response: store.append(response['tick']))
+    measure('TickStore', TickStore(capacity=TICKS), TickStore.on_tick)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+import asyncio
+import time
+from array import array
+from typing import List, Optional, Tuple
+
+from deriv_api.rate_limiter import RateLimiter
+
+# maximum number of ticks returned by one `ticks_history` request
+MAX_TICKS_PER_PAGE = 5000
+
+
+class TickHistory:
+    """
+    Contiguous columnar ticks of one symbol: `epochs` (int64) and `quotes` (double) arrays, sorted by epoch
+
+    property {int} pages - Number of `ticks_history` requests sent
+    property {float} elapsed - Time spent by the backfill in seconds
+    """
+
+    def __init__(self, symbol: str) -> None:
+        self.symbol = symbol
+        self.epochs = array('q')
+        self.quotes = array('d')
+        self.pages = 0
+        self.elapsed = 0.0
+
+    def __len__(self) -> int:
+        return len(self.epochs)
+
+    @property
+    def ticks_per_second(self) -> float:
+        """Ingestion rate of the backfill"""
+        return len(self.epochs) / self.elapsed if self.elapsed else 0.0
+
+
+async def backfill_ticks(api, symbol: str, start: int, end: int, page_seconds: int = MAX_TICKS_PER_PAGE,
+                         concurrency: int = 4, rate_limiter: Optional[RateLimiter] = None) -> TickHistory:
+    """
+    Fetch all the ticks of a symbol between `start` and `end` (epochs, both included)
+
+    The range is split into pages of `page_seconds` that are fetched concurrently, at most `concurrency` at a time
+    and under `rate_limiter` if given. A page that hits the `ticks_history` count limit is split again.
+    Pages are stitched into contiguous arrays, ticks returned by two adjacent pages are kept once.
+    Responses are not saved into the api cache.
+
+    example
+    history = await backfill_ticks(api, 'R_100', start=1633046400, end=1635724800, rate_limiter=RateLimiter(5))
+    print(len(history), history.ticks_per_second)
+
+    param {DerivAPI} api - The api used to send the requests
+    param {String} symbol - The symbol to backfill
+    param {int} start - Epoch of the first tick
+    param {int} end - Epoch of the last tick
+    param {int} page_seconds - Duration covered by a page, choose it so a page has less than 5000 ticks
+    param {int} concurrency - Maximum number of requests in flight
+    param {RateLimiter} rate_limiter - Limits the number of requests per second
+
+    returns {TickHistory} - The ticks, as columns
+    """
+    if end < start:
+        raise ValueError('end should not be before start')
+
+    history = TickHistory(symbol)
+    semaphore = asyncio.Semaphore(concurrency)
+    pages: List[Tuple[list, list]] = []
+
+    async def fetch(page_start: int, page_end: int) -> None:
+        async with semaphore:
+            if rate_limiter:
+                await rate_limiter.acquire()
+            history.pages += 1
+            response = await api.send({'ticks_history': symbol, 'start': page_start, 'end': str(page_end),
+                                       'count': MAX_TICKS_PER_PAGE, 'style': 'ticks'}, cache=False)
+        times = response['history']['times']
+        pages.append((times, response['history']['prices']))
+        # a full page holds the latest ticks of its range, fetch the beginning of the range again
+        if len(times) >= MAX_TICKS_PER_PAGE and int(times[0]) > page_start:
+            await fetch(page_start, int(times[0]))
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(fetch(page_start, min(page_start + page_seconds, end))
+                           for page_start in range(start, end + 1, page_seconds + 1)))
+
+    epochs, quotes = history.epochs, history.quotes
+    last_epoch = start - 1
+    for times, prices in sorted(pages, key=lambda page: int(page[0][0]) if page[0] else 0):
+        for epoch, quote in zip(times, prices):
+            epoch = int(epoch)
+            if epoch > last_epoch:
+                epochs.append(epoch)
+                quotes.append(float(quote))
+                last_epoch = epoch
+    history.elapsed = time.perf_counter() - started_at
+    return history
@@ -0,0 +1,119 @@
+import asyncio
+import itertools
+import math
+import time
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+from deriv_api.deriv_api_calls import get_validator
+from deriv_api.errors import ResponseError
+from deriv_api.rate_limiter import RateLimiter
+
+
+class ProposalGrid:
+    """
+    Columnar results of `price_proposals`: row `i` holds the results of `requests[i]`.
+    Failed rows have NaN prices and their error in `errors`.
+
+    property {List[dict]} requests - The proposal requests sent
+    property {array} ask_prices - `ask_price` of every proposal
+    property {array} payouts - `payout` of every proposal
+    property {array} spots - `spot` of every proposal
+    property {List[str]} ids - Proposal id of every proposal, to buy it
+    property {List[Exception]} errors - Error of every failed proposal, None for the others
+    property {float} elapsed - Time spent pricing, in seconds
+    """
+
+    def __init__(self, requests: List[dict]) -> None:
+        size = len(requests)
+        self.requests = requests
+        self.ask_prices = array('d', [math.nan]) * size
+        self.payouts = array('d', [math.nan]) * size
+        self.spots = array('d', [math.nan]) * size
+        self.ids: List[Optional[str]] = [None] * size
+        self.errors: List[Optional[Exception]] = [None] * size
+        self.elapsed = 0.0
+
+    def __len__(self) -> int:
+        return len(self.requests)
+
+    def set_response(self, row: int, response: dict) -> None:
+        proposal = response['proposal']
+        self.ask_prices[row] = float(proposal['ask_price'])
+        self.payouts[row] = float(proposal['payout'])
+        self.spots[row] = float(proposal.get('spot', math.nan))
+        self.ids[row] = proposal['id']
+
+    @property
+    def failed(self) -> int:
+        return sum(error is not None for error in self.errors)
+
+
+def build_proposal_grid(base: dict, grid: Dict[str, Sequence] = None) -> List[dict]:
+    """
+    Expand a grid of proposal parameters into validated proposal requests
+
+    Every combination of the `grid` values is merged into `base`. The parameters are parsed and validated
+    once per distinct value, not once per request.
+
+    example
+    requests = build_proposal_grid({'amount': 10, 'basis': 'stake', 'currency': 'USD', 'symbol': 'R_100',
+                                    'duration_unit': 't'},
+                                   {'contract_type': ['CALL', 'PUT'], 'duration': [5, 10], 'barrier': ['+0.1', '+0.2']})
+
+    param {Object} base - Parameters shared by all the proposals
+    param {Object} grid - Values of every varying parameter
+
+    returns {List[dict]} - The proposal requests, in the order of `itertools.product` over the grid
+    """
+    parse = get_validator('proposal')
+    grid = grid or {}
+    names = list(grid.keys())
+    first = {name: values[0] for name, values in grid.items() if len(values)}
+
+    parsed_base = parse({**base, **first})
+    for name in names:
+        parsed_base.pop(name, None)
+    parsed_values = []
+    for name in names:
+        parsed_values.append([parse({**base, **first, name: value})[name] for value in grid[name]])
+
+    return [{**parsed_base, **dict(zip(names, combination))}
+            for combination in itertools.product(*parsed_values)]
+
+
+async def price_proposals(api, base: dict, grid: Dict[str, Sequence] = None, concurrency: int = 10,
+                          rate_limiter: Optional[RateLimiter] = None) -> ProposalGrid:
+    """
+    Price a grid of proposals, see `build_proposal_grid` for the parameters.
+
+    The requests are validated once, then sent directly, at most `concurrency` at a time and under
+    `rate_limiter` if given. Proposals are never cached. A failed proposal does not stop the others,
+    its error is returned in the results.
+
+    example
+    results = await price_proposals(api, base, {'duration': range(5, 11)}, rate_limiter=RateLimiter(20))
+    best = max(range(len(results)), key=lambda i: results.payouts[i] / results.ask_prices[i])
+
+    param {DerivAPI} api - The api used to send the requests
+    param {int} concurrency - Maximum number of proposals in flight
+    param {RateLimiter} rate_limiter - Limits the number of proposals per second
+
+    returns {ProposalGrid} - The results, as columns
+    """
+    results = ProposalGrid(build_proposal_grid(base, grid))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def price(row: int, request: dict) -> None:
+        async with semaphore:
+            if rate_limiter:
+                await rate_limiter.acquire()
+            try:
+                results.set_response(row, await api.send(request, cache=False))
+            except (ResponseError, KeyError, TypeError, ValueError) as err:
+                results.errors[row] = err
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(price(row, request) for row, request in enumerate(results.requests)))
+    results.elapsed = time.perf_counter() - started_at
+    return results
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from deriv_api.deriv_api_calls import DerivAPICalls
 from deriv_api.errors import ConstructionError
-from deriv_api.utils import dict_to_cache_key
+from deriv_api.prepared_request import PreparedRequest, cache_key, prepare
 from typing import Union
 from deriv_api.in_memory import InMemory
 
@@ -34,7 +34,9 @@ class Cache(DerivAPICalls):
         self.api = api
         self.storage = storage
 
-    async def send(self, request: dict) -> dict:
+    async def send(self, request: Union[dict, PreparedRequest]) -> dict:
+        # prepared once, the cache key is computed once for `has`, `get` and `set`
+        request = prepare(request)
         if await self.has(request):
             return await self.get(request)
 
@@ -42,18 +44,18 @@ class Cache(DerivAPICalls):
         self.set(request, response)
         return response
 
-    async def has(self, request: dict) -> bool:
+    async def has(self, request: Union[dict, PreparedRequest]) -> bool:
         """Redirected to the method defined by the storage"""
-        return self.storage.has(dict_to_cache_key(request))
+        return self.storage.has(cache_key(request))
 
-    async def get(self, request: dict) -> dict:
+    async def get(self, request: Union[dict, PreparedRequest]) -> dict:
         """Redirected to the method defined by the storage"""
-        return self.storage.get(dict_to_cache_key(request))
+        return self.storage.get(cache_key(request))
 
     async def get_by_msg_type(self, msg_type: str) -> dict:
         """Redirected to the method defined by the storage"""
         return self.storage.get_by_msg_type(msg_type)
 
-    def set(self, request, response: dict) -> None:
+    def set(self, request: Union[dict, PreparedRequest], response: dict) -> None:
         """Redirected to the method defined by the storage"""
-        return self.storage.set(dict_to_cache_key(request), response)
+        return self.storage.set(cache_key(request), response)
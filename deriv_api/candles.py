@@ -0,0 +1,207 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from rx.disposable import Disposable
+from rx.subject import Subject
+
+from deriv_api.ring_buffer import RingBuffer
+
+
+class CandleSeries:
+    """
+    OHLC candles of one symbol at one granularity, built incrementally from ticks.
+
+    Candles are aligned like the server ones: a candle opens at `epoch - epoch % granularity`.
+    Closed candles are kept in columnar ring buffers, the candle in progress is available with `current()`.
+
+    param {int} granularity - Candle duration in seconds
+    param {int} capacity - Maximum number of closed candles kept
+    """
+
+    def __init__(self, granularity: int, capacity: int = 1000) -> None:
+        if granularity <= 0:
+            raise ValueError('granularity should be a positive integer')
+        self.granularity = granularity
+        self.epochs = RingBuffer(capacity, 'q')
+        self.opens = RingBuffer(capacity, 'd')
+        self.highs = RingBuffer(capacity, 'd')
+        self.lows = RingBuffer(capacity, 'd')
+        self.closes = RingBuffer(capacity, 'd')
+        self.open_time: Optional[int] = None
+        self.open = self.high = self.low = self.close = 0.0
+
+    def add_tick(self, epoch: int, quote: float) -> Optional[dict]:
+        """
+        Add a tick to the series.
+
+        returns {Object|None} - The candle closed by this tick, if any
+        """
+        open_time = epoch - epoch % self.granularity
+        if open_time == self.open_time:
+            if quote > self.high:
+                self.high = quote
+            elif quote < self.low:
+                self.low = quote
+            self.close = quote
+            return None
+
+        closed = None
+        if self.open_time is not None:
+            if open_time < self.open_time:
+                # late tick of a closed candle
+                return None
+            closed = self.current()
+            self.epochs.append(self.open_time)
+            self.opens.append(self.open)
+            self.highs.append(self.high)
+            self.lows.append(self.low)
+            self.closes.append(self.close)
+
+        self.open_time = open_time
+        self.open = self.high = self.low = self.close = quote
+        return closed
+
+    def current(self) -> Optional[dict]:
+        """Return the candle in progress, in the shape of the `candles` stream `ohlc`"""
+        if self.open_time is None:
+            return None
+        return {'epoch': self.open_time, 'granularity': self.granularity, 'open': self.open, 'high': self.high,
+                'low': self.low, 'close': self.close}
+
+    def last(self, n: int = None) -> Tuple[memoryview, memoryview, memoryview, memoryview, memoryview]:
+        """Return zero-copy windows of the open times, opens, highs, lows and closes of the latest `n` closed candles"""
+        return self.epochs.last(n), self.opens.last(n), self.highs.last(n), self.lows.last(n), self.closes.last(n)
+
+    def __len__(self) -> int:
+        return len(self.epochs)
+
+
+class CandleAggregator:
+    """
+    Local OHLC aggregation of every requested granularity from a single `ticks` subscription per symbol.
+
+    Watching 3 granularities of 50 symbols with `candles` streams needs 150 server subscriptions,
+    the aggregator needs 50. Each symbol is seeded from one `ticks_history` backfill before subscribing.
+    Run `benchmarks/candles.py` to compare the CPU used by both approaches.
+
+    example
+    aggregator = CandleAggregator(granularities=[60, 300, 900])
+    await aggregator.track(api, 'R_100')
+    aggregator.closed.subscribe(lambda candle: print(candle)) # every closed candle, with its symbol
+    epochs, opens, highs, lows, closes = aggregator.series('R_100', 300).last(10)
+
+    param {List[int]} granularities - Candle durations in seconds
+    param {int} capacity - Maximum number of closed candles kept per symbol and granularity
+
+    property {Subject} closed - Stream of closed candles
+    """
+
+    def __init__(self, granularities: Iterable[int] = (60,), capacity: int = 1000) -> None:
+        self.granularities: List[int] = sorted(set(granularities))
+        self.capacity = capacity
+        self.symbols: Dict[str, List[CandleSeries]] = {}
+        self.last_epochs: Dict[str, int] = {}
+        self.subscriptions: Dict[str, Disposable] = {}
+        self.closed: Subject = Subject()
+
+    def add_symbol(self, symbol: str) -> List[CandleSeries]:
+        if symbol not in self.symbols:
+            self.symbols[symbol] = [CandleSeries(granularity, self.capacity) for granularity in self.granularities]
+        return self.symbols[symbol]
+
+    def add_tick(self, symbol: str, epoch: int, quote: float) -> None:
+        # ticks already seen, e.g. received by both the backfill and the subscription, are skipped
+        if epoch <= self.last_epochs.get(symbol, 0):
+            return
+        self.last_epochs[symbol] = epoch
+        for series in self.add_symbol(symbol):
+            closed = series.add_tick(epoch, quote)
+            if closed:
+                closed['symbol'] = symbol
+                self.closed.on_next(closed)
+
+    def on_tick(self, response: dict) -> None:
+        """Add the tick of a `ticks` subscription response"""
+        tick = response['tick']
+        self.add_tick(tick['symbol'], tick['epoch'], tick['quote'])
+
+    def on_history(self, symbol: str, response: dict) -> None:
+        """Add the ticks of a `ticks_history` response with `style: ticks`"""
+        history = response['history']
+        for epoch, quote in zip(history['times'], history['prices']):
+            self.add_tick(symbol, int(epoch), float(quote))
+
+    async def seed(self, api, symbol: str, count: int = 5000) -> None:
+        """Backfill the candles of the symbol from the latest `count` ticks"""
+        response = await api.ticks_history({'ticks_history': symbol, 'end': 'latest', 'count': count,
+                                            'style': 'ticks'})
+        self.on_history(symbol, response)
+
+    async def track(self, api, symbol: str, count: int = 5000) -> Disposable:
+        """
+        Seed the candles of the symbol, then keep them up to date with a `ticks` subscription.
+        The subscription starts first, its ticks are added after the backfill so none is missed in between.
+
+        param {DerivAPI} api - The api used to backfill and subscribe
+        param {String} symbol - The symbol to track
+        param {int} count - Number of ticks of the backfill, 0 to skip it
+
+        returns {Disposable} - Dispose it, or call `untrack`, to stop tracking the symbol
+        """
+        if symbol in self.subscriptions:
+            return self.subscriptions[symbol]
+
+        self.add_symbol(symbol)
+        source = await api.subscribe({'ticks': symbol})
+
+        def on_error(error: Exception) -> None:
+            self.on_error(api, symbol, error)
+
+        if not count:
+            subscription = self.subscriptions[symbol] = source.subscribe(self.on_tick, on_error)
+            return subscription
+
+        # ticks received during the backfill, None once it is added
+        buffered: Optional[List[dict]] = []
+
+        def on_tick(response: dict) -> None:
+            if buffered is None:
+                self.on_tick(response)
+            else:
+                buffered.append(response)
+
+        subscription = self.subscriptions[symbol] = source.subscribe(on_tick, on_error)
+        try:
+            await self.seed(api, symbol, count)
+        except Exception:
+            self.untrack(symbol)
+            raise
+        finally:
+            ticks, buffered = buffered, None
+        # the ticks also in the backfill are skipped by their epoch
+        for response in ticks:
+            self.on_tick(response)
+        # the stream may have failed during the backfill, its subscription is then disposed
+        return subscription
+
+    def on_error(self, api, symbol: str, error: Exception) -> None:
+        """The ticks stream of the symbol failed, e.g. on an invalid symbol: stop tracking it and report the error"""
+        self.untrack(symbol)
+        api.sanity_errors.on_next(error)
+
+    def untrack(self, symbol: str) -> None:
+        subscription = self.subscriptions.pop(symbol, None)
+        if subscription:
+            subscription.dispose()
+
+    def series(self, symbol: str, granularity: int) -> CandleSeries:
+        return self.symbols[symbol][self.granularities.index(granularity)]
+
+    @property
+    def server_subscriptions(self) -> int:
+        """Number of server subscriptions used by the aggregator"""
+        return len(self.subscriptions)
+
+    @property
+    def server_side_subscriptions(self) -> int:
+        """Number of `candles` subscriptions the same candles would need with server side aggregation"""
+        return len(self.subscriptions) * len(self.granularities)
@@ -0,0 +1,91 @@
+import asyncio
+from typing import Optional
+
+from rx import Observable
+
+from deriv_api.errors import APIError
+
+
+class ConflatedSource:
+    """
+    A latest-value view over a subscription stream.
+
+    Only one slot is kept: every new response overwrites the previous one, and a consumer that falls behind
+    receives only the newest response instead of every intermediate update. The consumer is woken up once,
+    no matter how many responses arrived while it was busy.
+
+    example
+    proposal = await api.subscribe_conflated({'proposal': 1, ...})
+    async for response in proposal:
+        await price(response)  # slow consumer, stale updates are skipped
+    print(proposal.coalesced)  # how many updates were overwritten before being consumed
+
+    param {Observable} source - A subscription stream, as returned by `SubscriptionManager.subscribe`
+
+    property {int} received - Number of responses received from the source
+    property {int} coalesced - Number of responses overwritten before the consumer read them
+    """
+
+    def __init__(self, source: Observable) -> None:
+        self.received = 0
+        self.coalesced = 0
+        self.latest: Optional[dict] = None
+        self.has_value = False
+        self.error: Optional[BaseException] = None
+        self.completed = False
+        self.wakeup = asyncio.Event()
+        self.disposable = source.subscribe(on_next=self.__on_next, on_error=self.__on_error,
+                                           on_completed=self.__on_completed)
+
+    def __on_next(self, response: dict) -> None:
+        self.received += 1
+        if self.has_value:
+            self.coalesced += 1
+        self.latest = response
+        self.has_value = True
+        self.wakeup.set()
+
+    def __on_error(self, error: BaseException) -> None:
+        self.error = error
+        self.wakeup.set()
+
+    def __on_completed(self) -> None:
+        self.completed = True
+        self.wakeup.set()
+
+    async def get(self) -> dict:
+        """
+        Wait for and return the newest response not yet consumed.
+        Raises the stream error if the stream failed, or APIError once the stream is completed and drained.
+        """
+        if not await self.__wait():
+            raise APIError('Subscription is completed')
+        return self.__take()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> dict:
+        if not await self.__wait():
+            raise StopAsyncIteration
+        return self.__take()
+
+    async def __wait(self) -> bool:
+        while not self.has_value:
+            if self.error:
+                raise self.error
+            if self.completed:
+                return False
+            self.wakeup.clear()
+            await self.wakeup.wait()
+        return True
+
+    def __take(self) -> dict:
+        response = self.latest
+        self.latest = None
+        self.has_value = False
+        return response
+
+    def dispose(self) -> None:
+        """Stop listening to the source, the subscription will be forgotten when it has no other listener"""
+        self.disposable.dispose()
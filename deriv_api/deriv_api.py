@@ -5,7 +5,6 @@ import re
 from asyncio import Future
 from typing import Dict, Optional, Union
 
-import websockets
 from rx import operators as op
 from rx.subject import Subject
 from websockets.legacy.client import WebSocketClientProtocol
@@ -16,8 +15,12 @@ from deriv_api.custom_future import CustomFuture
 from deriv_api.deriv_api_calls import DerivAPICalls
 from deriv_api.errors import APIError, ConstructionError, ResponseError, AddedTaskError
 from deriv_api.in_memory import InMemory
+from deriv_api.market_data_hub import MarketDataHub, is_public
+from deriv_api.prepared_request import PreparedRequest, prepare
+from deriv_api.response_validation import ResponseValidator
 from deriv_api.subscription_manager import SubscriptionManager
-from deriv_api.utils import dict_to_cache_key, is_valid_url
+from deriv_api.transport import Transport, WebsocketTransport
+from deriv_api.utils import is_valid_url
 
 # TODO NEXT subscribe is not calling deriv_api_calls. that's , args not verified. can we improve it ?
 # TODO list these features missed
@@ -40,11 +43,16 @@ class DerivAPI(DerivAPICalls):
 
     param {Object}     options
     param {WebSocketClientProtocol}  options.connection - A ready to use connection
+    param {Transport}  options.transport  - The transport to connect with, instead of a websocket to `endpoint`,
+                                            like an in-process `LoopbackTransport`
     param {String}     options.endpoint   - API server to connect to
     param {Number}     options.app_id     - Application ID of the API user
     param {String}     options.lang       - Language of the API communication
     param {String}     options.brand      - Brand name
     param {Object}     options.middleware - A middleware to call on certain API actions
+    param {MarketDataHub} options.hub     - A hub shared by several instances for the public streams
+    param {Boolean}    options.trusted    - Send the args of the API calls without parsing and validating them,
+                                            for callers building correct requests. Each call can override it.
 
     property {Cache} cache - Temporary cache default to {InMemory}
     property {Cache} storage - If specified, uses a more persistent cache (local storage, etc.)
@@ -57,11 +65,16 @@ class DerivAPI(DerivAPICalls):
         brand = options.get('brand', '')
         cache = options.get('cache', InMemory())
         storage = options.get('storage')
-        self.wsconnection: Optional[WebSocketClientProtocol] = None
+        self.hub: Optional[MarketDataHub] = options.get('hub')
+        self.wsconnection: Union[WebSocketClientProtocol, Transport, None] = None
         self.wsconnection_from_inside = True
+        self.transport: Optional[Transport] = None
         if options.get('connection'):
-            self.wsconnection: Optional[WebSocketClientProtocol] = options.get('connection')
+            self.wsconnection = options.get('connection')
             self.wsconnection_from_inside = False
+        elif options.get('transport'):
+            self.transport = options.get('transport')
+            self.shouldReconnect = True
         else:
             if not options.get('app_id'):
                 raise ConstructionError('An app_id is required to connect to the API')
@@ -73,6 +86,7 @@ class DerivAPI(DerivAPICalls):
                 'brand': brand
             }
             self.__set_apiURL(connection_argument)
+            self.transport = WebsocketTransport(self.api_url)
             self.shouldReconnect = True
 
         self.storage: Union[InMemory, Cache, None] = None
@@ -80,6 +94,9 @@ class DerivAPI(DerivAPICalls):
             self.storage = Cache(self, storage)
         # If we have the storage look that one up
         self.cache = Cache(self.storage if self.storage else self, cache)
+        self.trusted = self.cache.trusted = bool(options.get('trusted', False))
+        if self.storage:
+            self.storage.trusted = self.trusted
 
         self.req_id = 0
         self.pending_requests: Dict[str, Subject] = {}
@@ -89,6 +106,7 @@ class DerivAPI(DerivAPICalls):
         self.sanity_errors: Subject = Subject()
         self.subscription_manager = SubscriptionManager(self)
         self.expect_response_types = {}
+        self.response_validator: Optional[ResponseValidator] = None
         self.wait_data_task = CustomFuture().set_result(1)
         self.add_task(self.api_connect(), 'api_connect')
         self.add_task(self.__wait_data(), 'wait_data')
@@ -109,7 +127,10 @@ class DerivAPI(DerivAPICalls):
             except Exception as err:
                 self.sanity_errors.on_next(err)
                 continue
-            response = json.loads(data)
+            # the in-process transports can hand over the parsed frames
+            response = data if isinstance(data, dict) else json.loads(data)
+            if self.response_validator is not None:
+                self.response_validator.check(response)
             # TODO NEXT add self.events stream
 
             # TODO NEXT onopen onclose, can be set by await connection
@@ -129,7 +150,8 @@ class DerivAPI(DerivAPICalls):
             is_parent_subscription = request and request.get('proposal_open_contract') and not request.get(
                 'contract_id')
             if response.get('error') and not is_parent_subscription:
-                self.pending_requests[req_id].on_error(ResponseError(response))
+                # the request is over, no more response is sent after an error
+                self.pending_requests.pop(req_id).on_error(ResponseError(response))
                 continue
 
             # on_error will stop a subject object
@@ -141,6 +163,9 @@ class DerivAPI(DerivAPICalls):
                 continue
 
             self.pending_requests[req_id].on_next(response)
+            if not response.get('subscription') and not (request and request.get('subscribe')):
+                # the only response of the request
+                del self.pending_requests[req_id]
 
     def __set_apiURL(self, connection_argument: dict) -> None:
         self.api_url = connection_argument.get('endpoint_url') + "/websockets/v3?app_id=" + connection_argument.get(
@@ -163,50 +188,110 @@ class DerivAPI(DerivAPICalls):
 
         return url
 
-    async def api_connect(self) -> websockets.WebSocketClientProtocol:
+    async def api_connect(self) -> Union[WebSocketClientProtocol, Transport]:
         if not self.wsconnection and self.shouldReconnect:
-            self.wsconnection = await websockets.connect(self.api_url)
+            await self.transport.connect()
+            self.wsconnection = self.transport
         if self.connected.is_pending():
             self.connected.resolve(True)
         else:
             self.connected = CustomFuture().resolve(True)
         return self.wsconnection
 
-    async def send(self, request: dict) -> dict:
+    async def send(self, request: Union[dict, PreparedRequest], cache: bool = True) -> dict:
+        """
+        Send a request and return its response.
+        The response is saved in `cache` and `storage`, unless `cache` is False.
+        The request dict is not changed, see `PreparedRequest`
+        """
+        request = prepare(request)
         response_future = self.send_and_get_source(request).pipe(op.first(), op.to_future())
 
         response = await response_future
-        self.cache.set(request, response)
-        if self.storage:
-            self.storage.set(request, response)
+        if cache:
+            self.cache.set(request, response)
+            if self.storage:
+                self.storage.set(request, response)
         return response
 
     async def subscribe(self, request):
         return await self.subscription_manager.subscribe(request)
 
-    def send_and_get_source(self, request: dict):
+    def send_and_get_source(self, request: Union[dict, PreparedRequest]):
         pending = Subject()
-        if 'req_id' not in request:
-            self.req_id += 1
-            request['req_id'] = self.req_id
-        self.pending_requests[request['req_id']] = pending
+        request = prepare(request)
+        if request.req_id is None:
+            request.req_id = self.next_req_id()
+        self.pending_requests[request.req_id] = pending
 
         async def send_message():
             try:
                 await self.connected
-                await self.wsconnection.send(json.dumps(request))
+                await self.wsconnection.send(request.message)
             except Exception as err:
                 pending.on_error(err)
         self.add_task(send_message(), 'send_message')
         return pending
 
+    def next_req_id(self) -> int:
+        """Allocate a `req_id`, for requests serialized ahead of `send_serialized`"""
+        self.req_id += 1
+        return self.req_id
+
+    async def send_serialized(self, req_id: int, message: str) -> Future:
+        """
+        Send a request already serialized to JSON, without checking its arguments and without caching it.
+        The message is sent by the calling task instead of a new one.
+
+        param {int} req_id - The `req_id` of the message, from `next_req_id`
+        param {str} message - The JSON request
+
+        returns {Future} - The response, once the message is sent
+        """
+        pending = Subject()
+        self.pending_requests[req_id] = pending
+        response = pending.pipe(op.first(), op.to_future())
+        await self.connected
+        await self.wsconnection.send(message)
+        return response
+
+    def enable_response_validation(self, rate: int = 1000) -> ResponseValidator:
+        """
+        Validate one response in `rate` of every msg_type from now on, see `ResponseValidator`.
+        The violations are sent to `sanity_errors`, the other responses are not checked.
+
+        param {int} rate - Validate one response in `rate`, 1 to validate them all
+
+        returns {ResponseValidator} - The validator, with its counters
+        """
+        self.response_validator = ResponseValidator(self.sanity_errors, rate)
+        return self.response_validator
+
+    def disable_response_validation(self) -> None:
+        self.response_validator = None
+
     async def subscribe(self, request):
+        """
+        Subscribe to a stream, see `SubscriptionManager.subscribe`.
+        With the `hub` option, the public streams are shared through the hub: `forget` and `forget_all` complete the
+        subscriptions of this api only, the wire subscription is forgotten once no api listens to it anymore
+        """
+        if self.hub and is_public(request):
+            return await self.hub.subscribe(request, self)
         return await self.subscription_manager.subscribe(request)
 
+    async def subscribe_conflated(self, request):
+        return await self.subscription_manager.subscribe_conflated(request)
+
     async def forget(self, subs_id):
+        if self.hub and self.hub.forget(subs_id, self):
+            # the wire subscription is shared by the hub, not forgotten by this api
+            return {'echo_req': {'forget': subs_id}, 'forget': 1, 'msg_type': 'forget'}
         return await self.subscription_manager.forget(subs_id)
 
     async def forget_all(self, *types):
+        if self.hub:
+            self.hub.forget_all(types, self)
         return await self.subscription_manager.forget_all(*types);
 
     async def disconnect(self) -> None:
@@ -0,0 +1,1658 @@
+# This file was generated by scripts/regen_py.py, do not edit
+# declares the API methods generated on first access by deriv_api_calls.py
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+class LazyMethods(type): ...
+
+class DerivAPICalls(metaclass=LazyMethods):
+    trusted: bool
+    async def process_request(self, all_args: dict) -> Any: ...
+
+    async def account_closure(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.account_closure {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.reason {String}: Reason for closing off accounts.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def account_security(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.account_security {Number}: Must be `1`
+        param args.otp {String}: [Optional] OTP (one-time passcode) generated by a 2FA application like Authy, Google Authenticator or Yubikey.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.totp_action {String}: [Optional] Action to be taken for managing TOTP (time-based one-time password, RFC6238). Generate will create a secret key which is then returned in the secret_key response field, you can then enable by using that code in a 2FA application.
+        """
+        ...
+
+    async def account_statistics(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.account_statistics {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def active_symbols(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.active_symbols {String}: If you use `brief`, only a subset of fields will be returned.
+        param args.landing_company {String}: [Optional] If you specify this field, only symbols available for trading by that landing company will be returned. If you are logged in, only symbols available for trading by your landing company will be returned regardless of what you specify in this field.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.product_type {String}: [Optional] If you specify this field, only symbols that can be traded through that product type will be returned.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def affiliate_account_add(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.account_opening_reason {String}: [Optional] Purpose and reason for requesting the account opening.
+        param args.account_turnover {String}: [Optional] The anticipated account turnover.
+        param args.address_city {String}: [Optional] Within 100 characters.
+        param args.address_line_1 {String}: Within 70 characters, with no leading whitespaces and may contain letters/numbers and/or any of following characters '.,:;()@#/-
+        param args.address_line_2 {String}: [Optional] Within 70 characters.
+        param args.address_postcode {String}: [Optional] Within 20 characters and may not contain '+'.
+        param args.address_state {String}: [Optional] Possible value receive from `states_list` call.
+        param args.affiliate_account_add {Number}: Must be `1`
+        param args.affiliate_plan {String}: The affiliate plan the account will subscribe to
+        param args.affiliate_token {String}: [Optional] Affiliate token, within 32 characters.
+        param args.citizen {Any}: [Optional] Country of legal citizenship, 2-letter country code.
+        param args.client_type {String}: [Optional] Indicates whether this is for a client requesting an account with professional status.
+        param args.currency {String}: [Optional] To set currency of the account. List of supported currencies can be acquired with `payout_currencies` call.
+        param args.date_of_birth {String}: Date of birth format: `yyyy-mm-dd`.
+        param args.first_name {String}: Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes.
+        param args.last_name {String}: Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes.
+        param args.non_pep_declaration {Number}: [Optional] Indicates client's self-declaration of not being a PEP/RCA (Politically Exposed Person/Relatives and Close Associates).
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.phone {Any}: [Optional] Starting with `+` followed by 9-35 digits, hyphens or space.
+        param args.place_of_birth {String}: [Optional] Place of birth, 2-letter country code.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.residence {String}: 2-letter country code, possible value receive from `residence_list` call.
+        param args.salutation {String}: [Optional] Accept any value in enum list.
+        param args.secret_answer {String}: [Optional] Answer to secret question, within 4-50 characters. Required for new account and existing client details will be used if client open another account.
+        param args.secret_question {String}: [Optional] Accept any value in enum list. Required for new account and existing client details will be used if client open another account.
+        param args.tax_identification_number {String}: [Optional] Tax identification number. Only applicable for real money account. Required for `maltainvest` landing company.
+        param args.tax_residence {String}: [Optional] Residence for tax purpose. Comma separated iso country code if multiple jurisdictions. Only applicable for real money account. Required for `maltainvest` landing company.
+        """
+        ...
+
+    async def api_token(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.api_token {Number}: Must be `1`
+        param args.delete_token {String}: [Optional] The token to remove.
+        param args.new_token {String}: [Optional] The name of the created token.
+        param args.new_token_scopes {Any}: [Optional] List of permission scopes to provide with the token.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.valid_for_current_ip_only {Number}: [Optional] If you set this parameter during token creation, then the token created will only work for the IP address that was used to create the token
+        """
+        ...
+
+    async def app_delete(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.app_delete {Number}: Application app_id
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def app_get(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.app_get {Number}: Application app_id
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def app_list(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.app_list {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def app_markup_details(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.app_id {Number}: [Optional] Specific application `app_id` to report on.
+        param args.app_markup_details {Number}: Must be `1`
+        param args.client_loginid {String}: [Optional] Specific client loginid to report on, like CR12345
+        param args.date_from {String}: Start date (epoch or YYYY-MM-DD HH:MM:SS). Results are inclusive of this time.
+        param args.date_to {String}: End date (epoch or YYYY-MM-DD HH::MM::SS). Results are inclusive of this time.
+        param args.description {Number}: [Optional] If set to 1, will return `app_markup` transaction details.
+        param args.limit {Number}: [Optional] Apply upper limit to count of transactions received.
+        param args.offset {Number}: [Optional] Number of transactions to skip.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.sort {String}: [Optional] Sort direction on `transaction_time`. Other fields sort order is ASC.
+        param args.sort_fields {Any}: [Optional] One or more of the specified fields to sort on. Default sort field is by `transaction_time`.
+        """
+        ...
+
+    async def app_register(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.app_markup_percentage {Number}: [Optional] Markup to be added to contract prices (as a percentage of contract payout).
+        param args.app_register {Number}: Must be `1`
+        param args.appstore {String}: [Optional] Application's App Store URL (if applicable).
+        param args.github {String}: [Optional] Application's GitHub page (for open-source projects).
+        param args.googleplay {String}: [Optional] Application's Google Play URL (if applicable).
+        param args.homepage {String}: [Optional] Application's homepage URL.
+        param args.name {String}: Application name.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.redirect_uri {String}: [Optional] The URL to redirect to after a successful login. Required if charging markup percentage
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.scopes {Any}: List of permission scopes to grant the application.
+        param args.verification_uri {String}: [Optional] Used when `verify_email` called. If available, a URL containing the verification token will be sent to the client's email, otherwise only the token will be sent.
+        """
+        ...
+
+    async def app_update(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.app_markup_percentage {Number}: [Optional] Markup to be added to contract prices (as a percentage of contract payout).
+        param args.app_update {Number}: Application app_id.
+        param args.appstore {String}: [Optional] Application's App Store URL (if applicable).
+        param args.github {String}: [Optional] Application's GitHub page (for open-source projects).
+        param args.googleplay {String}: [Optional] Application's Google Play URL (if applicable).
+        param args.homepage {String}: [Optional] Application's homepage URL.
+        param args.name {String}: Application name.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.redirect_uri {String}: [Optional] The URL to redirect to after a successful login. Required if charging markup percentage.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.scopes {Any}: Change scopes will revoke all user's grants and log them out.
+        param args.verification_uri {String}: [Optional] Used when `verify_email` called. If available, a URL containing the verification token will send to the client's email, otherwise only the token will be sent.
+        """
+        ...
+
+    async def asset_index(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.asset_index {Number}: Must be `1`
+        param args.landing_company {String}: [Optional] If specified, will return only the underlyings for the specified landing company.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def authorize(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.add_to_login_history {Number}: [Optional] Send this when you use api tokens for authorization and want to track activity using `login_history` call.
+        param args.authorize {String}: Authentication token. May be retrieved from https://www.binary.com/en/user/security/api_tokenws.html
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def balance(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.account {String}: [Optional] If set to `all`, return the balances of all accounts one by one; if set to `current`, return the balance of current account; if set as an account id, return the balance of that account.
+        param args.balance {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.subscribe {Number}: [Optional] If set to 1, will send updates whenever the balance changes.
+        """
+        ...
+
+    async def buy(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.buy {String}: Either the ID received from a Price Proposal (`proposal` call), or `1` if contract buy parameters are passed in the `parameters` field.
+        param args.parameters {Any}: 
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.price {Number}: Maximum price at which to purchase the contract.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.subscribe {Number}: [Optional] `1` to stream.
+        """
+        ...
+
+    async def buy_contract_for_multiple_accounts(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.buy_contract_for_multiple_accounts {String}: Either the ID received from a Price Proposal (`proposal` call), or `1` if contract buy parameters are passed in the `parameters` field.
+        param args.parameters {Any}: 
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.price {Number}: Maximum price at which to purchase the contract.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.tokens {Any}: List of API tokens identifying the accounts for which the contract is bought. Note: If the same token appears multiple times or if multiple tokens designate the same account, the contract is bought multiple times for this account.
+        """
+        ...
+
+    async def cancel(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.cancel {Number}: Value should be the `contract_id` which received from the `portfolio` call.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def cashier(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.address {String}: [Optional] Address for crypto withdrawal. Only applicable for `api` type.
+        param args.amount {Number}: [Optional] Amount for crypto withdrawal. Only applicable for `api` type.
+        param args.cashier {String}: Operation which needs to be requested from cashier
+        param args.dry_run {Number}: [Optional] If set to `1`, only validation is performed. Only applicable for `withdraw` using `crypto` provider and `api` type.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.provider {String}: [Optional] Cashier provider. `crypto` will be default option for crypto currency accounts.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.type {String}: [Optional] Data need to be returned from cashier. `api` is supported only for `crypto` provider.
+        param args.verification_code {String}: [Optional] Email verification code (received from a `verify_email` call, which must be done first)
+        """
+        ...
+
+    async def cashier_payments(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.cashier_payments {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.provider {String}: [Optional] Cashier provider. `crypto` will be default option for crypto currency accounts.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.subscribe {Number}: [Optional] If set to 1, will send updates whenever there is update to crypto payments.
+        param args.transaction_type {String}: [Optional] Type of transactions to receive.
+        """
+        ...
+
+    async def cashier_withdrawal_cancel(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.cashier_withdrawal_cancel {Number}: Must be `1`
+        param args.id {String}: The unique identifier for the transaction.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def change_password(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.change_password {Number}: Must be `1`
+        param args.new_password {String}: New password (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address)
+        param args.old_password {String}: Old password for validation (non-empty string, accepts any printable ASCII character)
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def contract_update(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.contract_id {Number}: Internal unique contract identifier.
+        param args.contract_update {Number}: Must be `1`
+        param args.limit_order {Any}: 
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def contract_update_history(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.contract_id {Number}: Internal unique contract identifier.
+        param args.contract_update_history {Number}: Must be `1`
+        param args.limit {Number}: [Optional] Maximum number of historical updates to receive.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def contracts_for(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.contracts_for {String}: The short symbol name (obtained from `active_symbols` call).
+        param args.currency {String}: [Optional] Currency of the contract's stake and payout (obtained from `payout_currencies` call).
+        param args.landing_company {String}: [Optional] Indicates which landing company to get a list of contracts for. If you are logged in, your account's landing company will override this field.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.product_type {String}: [Optional] If you specify this field, only contracts tradable through that contract type will be returned.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def copy_start(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.assets {Any}: [Optional] Used to set assets to be copied. E.x ["frxUSDJPY", "R_50"]
+        param args.copy_start {String}: API tokens identifying the accounts of trader which will be used to copy trades
+        param args.max_trade_stake {Number}: [Optional] Used to set maximum trade stake to be copied.
+        param args.min_trade_stake {Number}: [Optional] Used to set minimal trade stake to be copied.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.trade_types {Any}: [Optional] Used to set trade types to be copied. E.x ["CALL", "PUT"]
+        """
+        ...
+
+    async def copy_stop(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.copy_stop {String}: API tokens identifying the accounts which needs not to be copied
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def copytrading_list(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.copytrading_list {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def copytrading_statistics(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.copytrading_statistics {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.trader_id {String}: The ID of the target trader.
+        """
+        ...
+
+    async def document_upload(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.document_format {String}: Document file format
+        param args.document_id {String}: [Optional] Document ID (required for Passport, Proof of ID and Driver's License)
+        param args.document_issuing_country {String}: [Optional] 2-letter country code
+        param args.document_type {String}: Document type
+        param args.document_upload {Number}: Must be `1`
+        param args.expected_checksum {String}: The checksum of the file to be uploaded
+        param args.expiration_date {String}: [Optional] Document expiration date (required for Passport, Proof of ID and Driver's License)
+        param args.file_size {Number}: Document size (should be less than 10MB)
+        param args.lifetime_valid {Number}: [Optional] Boolean value that indicates whether this document is lifetime valid (only applies to POI document types, cancels out the expiration_date given if any)
+        param args.page_type {String}: [Optional] To determine document side
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def economic_calendar(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.currency {String}: [Optional] Currency symbol.
+        param args.economic_calendar {Number}: Must be `1`
+        param args.end_date {Number}: [Optional] End date.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.start_date {Number}: [Optional] Start date.
+        """
+        ...
+
+    async def exchange_rates(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.base_currency {String}: Base currency (can be obtained from `payout_currencies` call)
+        param args.exchange_rates {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def forget(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.forget {String}: ID of the real-time stream of messages to cancel.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def forget_all(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.forget_all {Any}: Cancel all streams by type. The value can be either a single type e.g. `"ticks"`, or an array of multiple types e.g. `["candles", "ticks"]`.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def get_account_status(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.get_account_status {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def get_financial_assessment(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.get_financial_assessment {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def get_limits(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.get_limits {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def get_self_exclusion(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.get_self_exclusion {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def get_settings(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.get_settings {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def identity_verification_document_add(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.document_number {String}: The identification number of the document.
+        param args.document_type {String}: The type of the document based on provided `issuing_country` (can obtained from `residence_list` call).
+        param args.identity_verification_document_add {Number}: Must be `1`
+        param args.issuing_country {String}: 2-letter country code (can obtained from `residence_list` call).
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def landing_company(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.landing_company {String}: Client's 2-letter country code (obtained from `residence_list` call).
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def landing_company_details(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.landing_company_details {String}: Landing company shortcode.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def link_wallet(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.client_id {String}: The unique identifier for this trading account.
+        param args.link_wallet {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.wallet_id {String}: The unique identifier for this wallet.
+        """
+        ...
+
+    async def login_history(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.limit {Number}: [Optional] Apply limit to count of login history records.
+        param args.login_history {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def logout(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.logout {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def mt5_deposit(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.amount {Number}: Amount to deposit (in the currency of from_binary); min = $1 or an equivalent amount, max = $20000 or an equivalent amount
+        param args.from_binary {String}: Binary account loginid to transfer money from
+        param args.mt5_deposit {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.to_mt5 {String}: MT5 account login to deposit money to
+        """
+        ...
+
+    async def mt5_get_settings(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.login {String}: MT5 user login
+        param args.mt5_get_settings {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def mt5_login_list(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.mt5_login_list {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def mt5_new_account(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.account_type {String}: Account type. If set to 'financial', setting 'mt5_account_type' is also required.
+        param args.address {String}: [Optional] The address of the user. The maximum length of this address field is 128 characters.
+        param args.city {String}: [Optional] User's city of residence.
+        param args.company {String}: [Optional] Name of the client's company. The maximum length of the company name is 64 characters.
+        param args.country {String}: [Optional] 2-letter country code (value received from `residence_list` call).
+        param args.currency {String}: [Optional] MT5 account currency, the default value will be the qualified account currency.
+        param args.dry_run {Number}: [Optional] If set to 1, only validation is performed.
+        param args.email {String}: Email address
+        param args.investPassword {String}: [Optional] The investor password of the account. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address).
+        param args.leverage {Number}: Client leverage (from 1 to 1000).
+        param args.mainPassword {String}: The master password of the account. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address). This field is required.
+        param args.mt5_account_category {String}: [Optional] To choose whether account is conventional or swap_free. Unavailable for financial_stp MT5_account_type
+        param args.mt5_account_type {String}: [Optional] Financial: Variable spreads, High leverage. Financial STP: Variable spreads, Medium Leverage, more products. If 'account_type' set to 'financial', setting 'mt5_account_type' is also required.
+        param args.mt5_new_account {Number}: Must be `1`
+        param args.name {String}: Client's name. The maximum length here is 101 characters.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.phone {String}: [Optional] User's phone number.
+        param args.phonePassword {String}: [Optional] The user's phone password.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.server {Any}: [Optional] Trade server.
+        param args.state {String}: [Optional] User's state (region) of residence.
+        param args.zipCode {String}: [Optional] User's zip code.
+        """
+        ...
+
+    async def mt5_password_change(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.login {String}: MT5 user login
+        param args.mt5_password_change {Number}: Must be `1`
+        param args.new_password {String}: New password of the account. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address).
+        param args.old_password {String}: Old password for validation (non-empty string, accepts any printable ASCII character)
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.password_type {String}: [Optional] Type of the password to change.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def mt5_password_check(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.login {String}: MT5 user login
+        param args.mt5_password_check {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.password {String}: The password of the account.
+        param args.password_type {String}: [Optional] Type of the password to check.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def mt5_password_reset(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.login {String}: MT5 user login
+        param args.mt5_password_reset {Number}: Must be `1`
+        param args.new_password {String}: New password of the account. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address).
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.password_type {String}: [Optional] Type of the password to reset.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.verification_code {String}: Email verification code (received from a `verify_email` call, which must be done first)
+        """
+        ...
+
+    async def mt5_withdrawal(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.amount {Number}: Amount to withdraw (in the currency of the MT5 account); min = $1 or an equivalent amount, max = $20000 or an equivalent amount.
+        param args.from_mt5 {String}: MT5 account login to withdraw money from
+        param args.mt5_withdrawal {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.to_binary {String}: Binary account loginid to transfer money to
+        """
+        ...
+
+    async def new_account_maltainvest(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.accept_risk {Number}: Show whether client has accepted risk disclaimer.
+        param args.account_opening_reason {String}: [Optional] Purpose and reason for requesting the account opening.
+        param args.account_turnover {String}: [Optional] The anticipated account turnover.
+        param args.address_city {String}: Within 100 characters
+        param args.address_line_1 {String}: Within 70 characters, with no leading whitespaces and may contain letters/numbers and/or any of following characters '.,:;()@#/-
+        param args.address_line_2 {String}: [Optional] Within 70 characters.
+        param args.address_postcode {String}: [Optional] Within 20 characters and may not contain '+'.
+        param args.address_state {String}: [Optional] Possible value receive from `states_list` call.
+        param args.affiliate_token {String}: [Optional] Affiliate token, within 32 characters.
+        param args.binary_options_trading_experience {String}: [Optional] Binary options trading experience.
+        param args.binary_options_trading_frequency {String}: [Optional] Binary options trading frequency.
+        param args.cfd_trading_experience {String}: [Optional] CFDs trading experience.
+        param args.cfd_trading_frequency {String}: [Optional] CFDs trading frequency.
+        param args.citizen {String}: [Optional] Country of legal citizenship, 2-letter country code. Possible value receive from `residence_list` call.
+        param args.client_type {String}: [Optional] Indicates whether this is for a client requesting an account with professional status.
+        param args.date_of_birth {String}: Date of birth format: yyyy-mm-dd.
+        param args.education_level {String}: Level of Education
+        param args.employment_industry {String}: Industry of Employment.
+        param args.employment_status {String}: [Optional] Employment Status.
+        param args.estimated_worth {String}: Estimated Net Worth.
+        param args.first_name {String}: Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes.
+        param args.forex_trading_experience {String}: [Optional] Forex trading experience.
+        param args.forex_trading_frequency {String}: [Optional] Forex trading frequency.
+        param args.income_source {String}: Income Source.
+        param args.last_name {String}: Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes.
+        param args.net_income {String}: Net Annual Income.
+        param args.new_account_maltainvest {Number}: Must be `1`
+        param args.non_pep_declaration {Number}: [Optional] Indicates client's self-declaration of not being a PEP/RCA.
+        param args.occupation {String}: Occupation.
+        param args.other_instruments_trading_experience {String}: [Optional] Trading experience in other financial instruments.
+        param args.other_instruments_trading_frequency {String}: [Optional] Trading frequency in other financial instruments.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.phone {Any}: [Optional] Starting with `+` followed by 9-35 digits, hyphens or space.
+        param args.place_of_birth {String}: [Optional] Place of birth, 2-letter country code.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.residence {String}: 2-letter country code, possible value receive from `residence_list` call.
+        param args.salutation {String}: Accept any value in enum list.
+        param args.secret_answer {String}: [Optional] Answer to secret question, within 4-50 characters.
+        param args.secret_question {String}: [Optional] Accept any value in enum list.
+        param args.source_of_wealth {String}: [Optional] Source of wealth.
+        param args.tax_identification_number {String}: Tax identification number. Only applicable for real money account. Required for `maltainvest` landing company.
+        param args.tax_residence {String}: Residence for tax purpose. Comma separated iso country code if multiple jurisdictions. Only applicable for real money account. Required for `maltainvest` landing company.
+        """
+        ...
+
+    async def new_account_real(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.account_opening_reason {String}: [Optional] Purpose and reason for requesting the account opening.
+        param args.account_turnover {String}: [Optional] The anticipated account turnover.
+        param args.address_city {String}: [Optional] Within 100 characters.
+        param args.address_line_1 {String}: Within 70 characters, with no leading whitespaces and may contain letters/numbers and/or any of following characters '.,:;()@#/-
+        param args.address_line_2 {String}: [Optional] Within 70 characters.
+        param args.address_postcode {String}: [Optional] Within 20 characters and may not contain '+'.
+        param args.address_state {String}: [Optional] Possible value receive from `states_list` call.
+        param args.affiliate_token {String}: [Optional] Affiliate token, within 32 characters.
+        param args.citizen {Any}: [Optional] Country of legal citizenship, 2-letter country code.
+        param args.client_type {String}: [Optional] Indicates whether this is for a client requesting an account with professional status.
+        param args.currency {String}: [Optional] To set currency of the account. List of supported currencies can be acquired with `payout_currencies` call.
+        param args.date_of_birth {String}: Date of birth format: `yyyy-mm-dd`.
+        param args.first_name {String}: Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes.
+        param args.last_name {String}: Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes.
+        param args.new_account_real {Number}: Must be `1`
+        param args.non_pep_declaration {Number}: [Optional] Indicates client's self-declaration of not being a PEP/RCA (Politically Exposed Person/Relatives and Close Associates).
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.phone {Any}: [Optional] Starting with `+` followed by 9-35 digits, hyphens or space.
+        param args.place_of_birth {String}: [Optional] Place of birth, 2-letter country code.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.residence {String}: 2-letter country code, possible value receive from `residence_list` call.
+        param args.salutation {String}: [Optional] Accept any value in enum list.
+        param args.secret_answer {String}: [Optional] Answer to secret question, within 4-50 characters. Required for new account and existing client details will be used if client open another account.
+        param args.secret_question {String}: [Optional] Accept any value in enum list. Required for new account and existing client details will be used if client open another account.
+        param args.tax_identification_number {String}: [Optional] Tax identification number. Only applicable for real money account. Required for `maltainvest` landing company.
+        param args.tax_residence {String}: [Optional] Residence for tax purpose. Comma separated iso country code if multiple jurisdictions. Only applicable for real money account. Required for `maltainvest` landing company.
+        """
+        ...
+
+    async def new_account_virtual(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.affiliate_token {String}: [Optional] Affiliate token, within 32 characters.
+        param args.client_password {String}: Password (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address).
+        param args.date_first_contact {String}: [Optional] Date of first contact, format: `yyyy-mm-dd` in GMT timezone.
+        param args.email_consent {Number}: [Optional] Boolean value: 1 or 0, indicating whether the client has given consent for marketing emails.
+        param args.gclid_url {String}: [Optional] Google Click Identifier to track source.
+        param args.new_account_virtual {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.residence {String}: 2-letter country code (obtained from `residence_list` call).
+        param args.signup_device {String}: [Optional] Show whether user has used mobile or desktop.
+        param args.type {String}: Account type
+        param args.utm_ad_id {Any}: [Optional] Identifier of particular ad. Value must match Regex pattern to be recorded
+        param args.utm_adgroup_id {Any}: [Optional] Identifier of ad group in the campaign. Value must match Regex pattern to be recorded
+        param args.utm_adrollclk_id {Any}: [Optional] Unique identifier of click on AdRoll ads platform. Value must match Regex pattern to be recorded
+        param args.utm_campaign {Any}: [Optional] Identifies a specific product promotion or strategic campaign such as a spring sale or other promotions. Value must match Regex pattern to be recorded
+        param args.utm_campaign_id {Any}: [Optional] Identifier of paid ad campaign. Value must match Regex pattern to be recorded
+        param args.utm_content {Any}: [Optional] Used to differentiate similar content, or links within the same ad. Value must match Regex pattern to be recorded
+        param args.utm_fbcl_id {Any}: [Optional] Unique identifier of click on Facebook ads platform. Value must match Regex pattern to be recorded
+        param args.utm_gl_client_id {Any}: [Optional] Unique visitor identifier on Google Ads platform. Value must match Regex pattern to be recorded
+        param args.utm_medium {Any}: [Optional] Identifies the medium the link was used upon such as: email, CPC, or other methods of sharing. Value must match Regex pattern to be recorded
+        param args.utm_msclk_id {Any}: [Optional] Unique click identifier on Microsoft Bing ads platform. Value must match Regex pattern to be recorded
+        param args.utm_source {Any}: [Optional] Identifies the source of traffic such as: search engine, newsletter, or other referral. Value must match Regex pattern to be recorded
+        param args.utm_term {Any}: [Optional] Used to send information related to the campaign term like paid search keywords. Value must match Regex pattern to be recorded
+        param args.verification_code {String}: Email verification code (received from a `verify_email` call, which must be done first).
+        """
+        ...
+
+    async def new_account_wallet(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.address_city {String}: [Optional] Within 35 characters.
+        param args.address_line_1 {String}: [Optional] Mailing address.
+        param args.address_line_2 {String}: [Optional] Within 70 characters.
+        param args.address_postcode {String}: [Optional] Within 20 characters and may not contain '+'.
+        param args.address_state {String}: [Optional] Possible value receive from `states_list` call.
+        param args.currency {String}: [Optional] To set currency of the account. List of supported currencies can be acquired with `payout_currencies` call.
+        param args.date_of_birth {String}: [Optional] Date of birth format: `yyyy-mm-dd`.
+        param args.first_name {String}: [Optional] Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes.
+        param args.last_name {String}: [Optional] Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes.
+        param args.new_account_wallet {Number}: Must be `1`
+        param args.non_pep_declaration {Number}: [Optional] Indicates client's self-declaration of not being a PEP/RCA (Politically Exposed Person/Relatives and Close Associates).
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.payment_method {String}: To set method which is used to transfer to/from wallet.
+        param args.phone {String}: [Optional] Starting with `+` followed by 8-35 digits, allowing hyphens or space.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def notification_event(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.args {Any}: 
+        param args.category {String}: The category or nature of the event.
+        param args.event {String}: The name of the event.
+        param args.notification_event {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def oauth_apps(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.oauth_apps {Number}: Must be `1`
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def p2p_advert_create(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.amount {Number}: The total amount of the advert, in advertiser's account currency.
+        param args.contact_info {String}: [Optional] Advertiser contact information. Only applicable for 'sell adverts'.
+        param args.description {String}: [Optional] General information about the advert.
+        param args.local_currency {String}: [Optional] Local currency for this advert. If not provided, will use the currency of client's residence by default.
+        param args.max_order_amount {Number}: Maximum allowed amount for the orders of this advert, in advertiser's `account_currency`. Should be less than or equal to total `amount` of the advert.
+        param args.min_order_amount {Number}: Minimum allowed amount for the orders of this advert, in advertiser's `account_currency`. Should be less than `max_order_amount`.
+        param args.p2p_advert_create {Number}: Must be 1
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.payment_info {String}: [Optional] Payment instructions. Only applicable for 'sell adverts'.
+        param args.payment_method {String}: Supported payment methods. Separate multiple values with a comma, maximum 3.
+        param args.payment_method_ids {Any}: IDs of payment methods, only applicable for sell ads.
+        param args.rate {Number}: Conversion rate from advertiser's account currency to `local_currency`.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.type {String}: Whether this is a buy or a sell.
+        """
+        ...
+
+    async def p2p_advert_info(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.id {String}: [Optional] The unique identifier for this advert. Optional when subscribe is 1. If not provided, all advertiser adverts will be subscribed.
+        param args.p2p_advert_info {Number}: Must be 1
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.subscribe {Number}: [Optional] If set to 1, will send updates when changes occur. Optional when id is provided.
+        param args.use_client_limits {Number}: [Optional] If set to 1, the maximum order amount will be adjusted to the current balance and turnover limits of the account.
+        """
+        ...
+
+    async def p2p_advert_list(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.advertiser_id {String}: [Optional] ID of the advertiser to list adverts for.
+        param args.advertiser_name {String}: [Optional] Search for advertiser by name. Partial matches will be returned.
+        param args.amount {Number}: [Optional] How much to buy or sell, used to calculate prices.
+        param args.counterparty_type {String}: [Optional] Filter the adverts by `counterparty_type`.
+        param args.favourites_only {Number}: [Optional] Only show adverts from favourite advertisers. Default is 0.
+        param args.limit {Number}: [Optional] Used for paging.
+        param args.local_currency {String}: [Optional] Currency to conduct payment transaction in, defaults to the main currency for the client's country.
+        param args.offset {Number}: [Optional] Used for paging.
+        param args.p2p_advert_list {Number}: Must be 1
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.payment_method {Any}: [Optional] Search by supported payment methods.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.sort_by {String}: [Optional] How the results are sorted: best rate, or advertiser completion rate.
+        param args.use_client_limits {Number}: [Optional] If set to 1, ads that exceed this account's balance or turnover limits will not be shown.
+        """
+        ...
+
+    async def p2p_advert_update(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.delete {Number}: [Optional] If set to 1, permanently deletes the advert.
+        param args.id {String}: The unique identifier for this advert.
+        param args.is_active {Number}: [Optional] Activate or deactivate the advert.
+        param args.p2p_advert_update {Number}: Must be 1
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.payment_method {String}: [Optional] Supported payment methods. Separate multiple values with a comma, maximum 3.
+        param args.payment_method_ids {Any}: [Optional] IDs of payment methods, only applicable for sell ads. Will replace exisiting methods.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def p2p_advertiser_adverts(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.limit {Number}: [Optional] Used for paging. This value will also apply to subsription responses.
+        param args.offset {Number}: [Optional] Used for paging. This value will also apply to subsription responses.
+        param args.p2p_advertiser_adverts {Number}: Must be 1
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def p2p_advertiser_create(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.contact_info {String}: [Optional] Advertiser's contact information, to be used as a default for new sell adverts.
+        param args.default_advert_description {String}: [Optional] Default description that can be used every time an advert is created.
+        param args.name {String}: The advertiser's displayed name.
+        param args.p2p_advertiser_create {Number}: Must be 1
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.payment_info {String}: [Optional] Advertiser's payment information, to be used as a default for new sell adverts.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.subscribe {Number}: [Optional] If set to 1, will send updates whenever there is an update to advertiser
+        """
+        ...
+
+    async def p2p_advertiser_info(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.id {String}: [Optional] The unique identifier for this advertiser. If not provided, returns advertiser information about the current account.
+        param args.p2p_advertiser_info {Number}: Must be 1
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.subscribe {Number}: [Optional] If set to 1, will send updates whenever there is an update to advertiser
+        """
+        ...
+
+    async def p2p_advertiser_payment_methods(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.create {Any}: Contains new payment method entries.
+        param args.delete {Any}: Contains payment methods to delete.
+        param args.p2p_advertiser_payment_methods {Number}: Must be 1
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.update {Any}: Contains payment methods to update.
+        """
+        ...
+
+    async def p2p_advertiser_relations(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.add_blocked {Any}: IDs of advertisers to block.
+        param args.add_favourites {Any}: IDs of advertisers to add as favourites.
+        param args.p2p_advertiser_relations {Number}: Must be 1
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.remove_blocked {Any}: IDs of advertisers to remove from blocked.
+        param args.remove_favourites {Any}: IDs of advertisers to remove from favourites.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def p2p_advertiser_update(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.contact_info {String}: [Optional] Advertiser's contact information, to be used as a default for new sell adverts.
+        param args.default_advert_description {String}: [Optional] Default description that can be used every time an advert is created.
+        param args.is_listed {Number}: [Optional] Used to set if the advertiser's adverts could be listed. When `0`, adverts won't be listed regardless of they are active or not. This doesn't change the `is_active` of each individual advert.
+        param args.p2p_advertiser_update {Number}: Must be 1
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.payment_info {String}: [Optional] Advertiser's payment information, to be used as a default for new sell adverts.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.show_name {Number}: [Optional] When `1`, the advertiser's real name will be displayed on to other users on adverts and orders.
+        """
+        ...
+
+    async def p2p_chat_create(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.order_id {String}: The unique identifier for the order to create the chat for.
+        param args.p2p_chat_create {Number}: Must be 1
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def p2p_order_cancel(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.id {String}: The unique identifier for this order.
+        param args.p2p_order_cancel {Number}: Must be 1
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def p2p_order_confirm(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.id {String}: The unique identifier for this order.
+        param args.p2p_order_confirm {Number}: Must be 1
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def p2p_order_create(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.advert_id {String}: The unique identifier for the advert to create an order against.
+        param args.amount {Number}: The amount of currency to be bought or sold.
+        param args.contact_info {String}: [Optional] Seller contact information. Only applicable for 'sell orders'.
+        param args.p2p_order_create {Number}: Must be 1
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.payment_info {String}: [Optional] Payment instructions, only applicable for sell orders.
+        param args.payment_method_ids {Any}: IDs of payment methods, only applicable for sell orders.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.subscribe {Number}: [Optional] If set to 1, will send updates whenever there is an update to the order.
+        """
+        ...
+
+    async def p2p_order_dispute(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.dispute_reason {String}: The predefined dispute reason
+        param args.id {String}: The unique identifier for this order.
+        param args.p2p_order_dispute {Number}: Must be 1
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def p2p_order_info(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.id {String}: The unique identifier for the order.
+        param args.p2p_order_info {Number}: Must be 1
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.subscribe {Number}: [Optional] If set to 1, will send updates whenever there is an update to order
+        """
+        ...
+
+    async def p2p_order_list(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.active {Number}: [Optional] Should be 1 to list active, 0 to list inactive (historical).
+        param args.advert_id {String}: [Optional] If present, lists orders applying to a specific advert.
+        param args.limit {Number}: [Optional] Used for paging.
+        param args.offset {Number}: [Optional] Used for paging.
+        param args.p2p_order_list {Number}: Must be 1
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.subscribe {Number}: [Optional] If set to 1, will send updates whenever there is a change to any order belonging to you.
+        """
+        ...
+
+    async def p2p_payment_methods(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.p2p_payment_methods {Number}: Must be 1
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def payment_methods(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.country {String}: [Optional] 2-letter country code (ISO standard).
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.payment_methods {Number}: Must be `1`
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def paymentagent_create(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.affiliate_id {String}: [Optional] Client's My Affiliate id, if exists.
+        param args.code_of_conduct_approval {Number}: Indicates client's agreement with the Code of Conduct.
+        param args.commission_deposit {Number}: Commission  (%) the agent wants to take on deposits
+        param args.commission_withdrawal {Number}: Commission  (%) the agent wants to take on withdrawals
+        param args.email {String}: Payment agent's email address.
+        param args.information {String}: [Optional] Information about payment agent and their proposed service.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.payment_agent_name {String}: The name with which the payment agent is going to be identified.
+        param args.paymentagent_create {Number}: Must be 1
+        param args.phone {String}: Payment agent's phone number with coutry code.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.supported_payment_methods {Any}: A list of supported payment methods.
+        param args.url {String}: The URL of payment agent's website.
+        """
+        ...
+
+    async def paymentagent_details(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.paymentagent_details {Number}: Must be 1
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def paymentagent_list(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.currency {String}: [Optional] If specified, only payment agents that supports that currency will be returned (obtained from `payout_currencies` call).
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.paymentagent_list {String}: Client's 2-letter country code (obtained from `residence_list` call).
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def paymentagent_transfer(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.amount {Number}: The amount to transfer.
+        param args.currency {String}: Currency code.
+        param args.description {String}: [Optional] Remarks about the transfer.
+        param args.dry_run {Number}: [Optional] If set to `1`, just do validation.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.paymentagent_transfer {Number}: Must be `1`
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.transfer_to {String}: The loginid of the recipient account.
+        """
+        ...
+
+    async def paymentagent_withdraw(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.amount {Number}: The amount to withdraw to the payment agent.
+        param args.currency {String}: The currency code.
+        param args.description {String}: [Optional] Remarks about the withdraw. Only letters, numbers, space, period, comma, - ' are allowed.
+        param args.dry_run {Number}: [Optional] If set to 1, just do validation.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.paymentagent_loginid {String}: The payment agent loginid received from the `paymentagent_list` call.
+        param args.paymentagent_withdraw {Number}: Must be `1`
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.verification_code {String}: Email verification code (received from a `verify_email` call, which must be done first)
+        """
+        ...
+
+    async def payout_currencies(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.payout_currencies {Number}: Must be `1`
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def ping(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.ping {Number}: Must be `1`
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def portfolio(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.contract_type {Any}: Return only contracts of the specified types
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.portfolio {Number}: Must be `1`
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def profit_table(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.contract_type {Any}: Return only contracts of the specified types
+        param args.date_from {String}: [Optional] Start date (epoch or YYYY-MM-DD)
+        param args.date_to {String}: [Optional] End date (epoch or YYYY-MM-DD)
+        param args.description {Number}: [Optional] If set to 1, will return full contracts description.
+        param args.limit {Number}: [Optional] Apply upper limit to count of transactions received.
+        param args.offset {Number}: [Optional] Number of transactions to skip.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.profit_table {Number}: Must be `1`
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.sort {String}: [Optional] Sort direction.
+        """
+        ...
+
+    async def proposal(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.amount {Number}: [Optional] Proposed contract payout or stake, or multiplier (for lookbacks).
+        param args.barrier {String}: [Optional] Barrier for the contract (or last digit prediction for digit contracts). Contracts less than 24 hours in duration would need a relative barrier (barriers which need +/-), where entry spot would be adjusted accordingly with that amount to define a barrier, except for Synthetic Indices as they support both relative and absolute barriers. Not needed for lookbacks.
+        param args.barrier2 {String}: [Optional] Low barrier for the contract (for contracts with two barriers). Contracts less than 24 hours in duration would need a relative barrier (barriers which need +/-), where entry spot would be adjusted accordingly with that amount to define a barrier, except for Synthetic Indices as they support both relative and absolute barriers. Not needed for lookbacks.
+        param args.basis {String}: [Optional] Indicates type of the `amount`.
+        param args.cancellation {String}: Cancellation duration option (only for `MULTUP` and `MULTDOWN` contracts).
+        param args.contract_type {String}: The proposed contract type
+        param args.currency {String}: This can only be the account-holder's currency (obtained from `payout_currencies` call).
+        param args.date_expiry {Number}: [Optional] Epoch value of the expiry time of the contract. Either date_expiry or duration is required.
+        param args.date_start {Number}: [Optional] Indicates epoch value of the starting time of the contract. If left empty, the start time of the contract is now.
+        param args.duration {Number}: [Optional] Duration quantity. Either date_expiry or duration is required.
+        param args.duration_unit {String}: [Optional] Duration unit - `s`: seconds, `m`: minutes, `h`: hours, `d`: days, `t`: ticks.
+        param args.limit_order {Any}: 
+        param args.multiplier {Number}: [Optional] The multiplier for non-binary options. E.g. lookbacks.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.product_type {String}: [Optional] The product type.
+        param args.proposal {Number}: Must be `1`
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.selected_tick {Number}: [Optional] The tick that is predicted to have the highest/lowest value - for `TICKHIGH` and `TICKLOW` contracts.
+        param args.subscribe {Number}: [Optional] 1 - to initiate a realtime stream of prices. Note that tick trades (without a user-defined barrier), digit trades and less than 24 hours at-the-money contracts for the following underlying symbols are not streamed: `R_10`, `R_25`, `R_50`, `R_75`, `R_100`, `RDBULL`, `RDBEAR` (this is because their price is constant).
+        param args.symbol {String}: The short symbol name (obtained from `active_symbols` call).
+        param args.trading_period_start {Number}: [Optional] Required only for multi-barrier trading. Defines the epoch value of the trading period start time.
+        """
+        ...
+
+    async def proposal_open_contract(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.contract_id {Number}: [Optional] Contract ID received from a `portfolio` request. If not set, you will receive stream of all open contracts.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.proposal_open_contract {Number}: Must be `1`
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.subscribe {Number}: [Optional] `1` to stream.
+        """
+        ...
+
+    async def reality_check(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.reality_check {Number}: Must be `1`
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        """
+        ...
+
+    async def request_report(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.date_from {Number}: Start date of the report
+        param args.date_to {Number}: End date of the report
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.report_type {String}: Type of report to be sent to client's registered e-mail address
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.request_report {Number}: Must be `1`
+        """
+        ...
+
+    async def reset_password(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.date_of_birth {String}: [Optional] Date of birth format: `yyyy-mm-dd`. Only required for clients with real-money accounts.
+        param args.new_password {String}: New password. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address).
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.reset_password {Number}: Must be `1`
+        param args.verification_code {String}: Email verification code (received from a `verify_email` call, which must be done first)
+        """
+        ...
+
+    async def residence_list(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.residence_list {Number}: Must be `1`
+        """
+        ...
+
+    async def revoke_oauth_app(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.revoke_oauth_app {Number}: The application ID to revoke.
+        """
+        ...
+
+    async def sell(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.price {Number}: Minimum price at which to sell the contract, or `0` for 'sell at market'.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.sell {Number}: Pass contract_id received from the `portfolio` call.
+        """
+        ...
+
+    async def sell_contract_for_multiple_accounts(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.price {Number}: Minimum price at which to sell the contract, or `0` for 'sell at market'.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.sell_contract_for_multiple_accounts {Number}: Must be `1`
+        param args.shortcode {String}: An internal ID used to identify the contract which was originally bought. This is returned from the `buy` and `buy_contract_for_multiple_accounts` calls.
+        param args.tokens {Any}: Authorisation tokens which select the accounts to sell use for the affected accounts.
+        """
+        ...
+
+    async def sell_expired(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.sell_expired {Number}: Must be `1`
+        """
+        ...
+
+    async def service_token(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.country {String}: [Optional] The 2-letter country code.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.referrer {String}: [Optional] The URL of the web page where the Web SDK will be used.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.server {String}: Server (dxtrade only).
+        param args.service {Any}: The service(s) to retrieve token(s) for.
+        param args.service_token {Number}: Must be `1`
+        """
+        ...
+
+    async def set_account_currency(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.set_account_currency {String}: Currency of the account. List of supported currencies can be acquired with `payout_currencies` call.
+        """
+        ...
+
+    async def set_financial_assessment(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.account_turnover {String}: [Optional] The anticipated account turnover.
+        param args.binary_options_trading_experience {String}: [Optional] Binary options trading experience.
+        param args.binary_options_trading_frequency {String}: [Optional] Binary options trading frequency.
+        param args.cfd_trading_experience {String}: [Optional] CFDs trading experience.
+        param args.cfd_trading_frequency {String}: [Optional] CFDs trading frequency.
+        param args.education_level {String}: Level of Education.
+        param args.employment_industry {String}: Industry of Employment.
+        param args.employment_status {String}: [Optional] Employment Status.
+        param args.estimated_worth {String}: Estimated Net Worth.
+        param args.forex_trading_experience {String}: [Optional] Forex trading experience.
+        param args.forex_trading_frequency {String}: [Optional] Forex trading frequency.
+        param args.income_source {String}: Income Source.
+        param args.net_income {String}: Net Annual Income.
+        param args.occupation {String}: Occupation.
+        param args.other_instruments_trading_experience {String}: [Optional] Trading experience in other financial instruments.
+        param args.other_instruments_trading_frequency {String}: [Optional] Trading frequency in other financial instruments.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.set_financial_assessment {Number}: Must be `1`
+        param args.source_of_wealth {String}: [Optional] Source of wealth.
+        """
+        ...
+
+    async def set_self_exclusion(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.exclude_until {Any}: [Optional] Exclude me from the website (for a minimum of 6 months, up to a maximum of 5 years). Note: uplifting this self-exclusion may require contacting the company.
+        param args.max_30day_deposit {Any}: [Optional] 7-day limit on deposits.
+        param args.max_30day_losses {Any}: [Optional] 30-day limit on losses.
+        param args.max_30day_turnover {Any}: [Optional] 30-day turnover limit.
+        param args.max_7day_deposit {Any}: [Optional] 7-day limit on deposits.
+        param args.max_7day_losses {Any}: [Optional] 7-day limit on losses.
+        param args.max_7day_turnover {Any}: [Optional] 7-day turnover limit.
+        param args.max_balance {Any}: [Optional] Maximum account cash balance.
+        param args.max_deposit {Any}: [Optional] Daily deposit limit.
+        param args.max_losses {Any}: [Optional] Daily limit on losses.
+        param args.max_open_bets {Any}: [Optional] Maximum number of open positions.
+        param args.max_turnover {Any}: [Optional] Daily turnover limit.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.session_duration_limit {Any}: [Optional] Session duration limit, in minutes.
+        param args.set_self_exclusion {Number}: Must be `1`
+        param args.timeout_until {Any}: [Optional] Exclude me from the website (for up to 6 weeks). Requires time in epoch format. Note: unlike `exclude_until`, this self-exclusion will be lifted automatically at the expiry of the timeout period.
+        """
+        ...
+
+    async def set_settings(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.account_opening_reason {String}: [Optional] Purpose and reason for requesting the account opening. Only applicable for real money account. Required for clients that have not set it yet. Can only be set once.
+        param args.address_city {String}: [Optional] Note: not applicable for virtual account. Required field for real money account.
+        param args.address_line_1 {String}: [Optional] Note: not applicable for virtual account. Required field for real money account.
+        param args.address_line_2 {Any}: [Optional] Note: not applicable for virtual account. Optional field for real money account.
+        param args.address_postcode {String}: [Optional] Note: not applicable for virtual account. Optional field for real money account.
+        param args.address_state {String}: [Optional] Note: not applicable for virtual account. Optional field for real money account.
+        param args.allow_copiers {Number}: [Optional] Boolean value 1 or 0, indicating permission to allow others to follow your trades. Note: not applicable for Virtual account. Only allow for real money account.
+        param args.citizen {Any}: [Optional] Country of legal citizenship, 2-letter country code.
+        param args.date_of_birth {String}: [Optional] Date of birth format: yyyy-mm-dd (can only be changed on unauthenticated svg accounts).
+        param args.email_consent {Number}: [Optional] Boolean value 1 or 0, indicating permission to use email address for any contact which may include marketing
+        param args.feature_flag {Any}: 
+        param args.first_name {String}: [Optional] Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes (can only be changed on unauthenticated svg accounts).
+        param args.last_name {String}: [Optional] Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes (can only be changed on unauthenticated svg accounts).
+        param args.non_pep_declaration {Number}: [Optional] Indicates client's self-declaration of not being a PEP/RCA (Politically Exposed Person/Relatives and Close Associates). Effective for real accounts only.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.phone {Any}: [Optional] Note: not applicable for virtual account. Starting with `+` followed by 9-35 digits, hyphens or space.
+        param args.place_of_birth {String}: [Optional] Place of birth, 2-letter country code.
+        param args.preferred_language {Any}: [Optional] User's preferred language, ISO standard language code
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.request_professional_status {Number}: [Optional] Required when client wants to be treated as professional. Applicable for financial accounts only.
+        param args.residence {Any}: [Optional] 2-letter country code. Note: not applicable for real money account. Only allow for Virtual account without residence set.
+        param args.salutation {String}: [Optional] Accept any value in enum list (can only be changed on unauthenticated svg accounts).
+        param args.secret_answer {String}: [Optional] Answer to secret question, within 4-50 characters. Required for new account and existing client details will be used if client opens another account.
+        param args.secret_question {String}: [Optional] Accept any value in enum list. Required for new account and existing client details will be used if client opens another account.
+        param args.set_settings {Number}: Must be `1`
+        param args.tax_identification_number {String}: [Optional] Tax identification number. Only applicable for real money account. Required for maltainvest landing company.
+        param args.tax_residence {String}: [Optional] Residence for tax purpose. Comma separated iso country code if multiple jurisdictions. Only applicable for real money account. Required for maltainvest landing company.
+        """
+        ...
+
+    async def statement(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.action_type {String}: [Optional] To filter the statement according to the type of transaction.
+        param args.date_from {Number}: [Optional] Start date (epoch)
+        param args.date_to {Number}: [Optional] End date (epoch)
+        param args.description {Number}: [Optional] If set to 1, will return full contracts description.
+        param args.limit {Number}: [Optional] Maximum number of transactions to receive.
+        param args.offset {Number}: [Optional] Number of transactions to skip.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.statement {Number}: Must be `1`
+        """
+        ...
+
+    async def states_list(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.states_list {String}: Client's 2-letter country code (obtained from `residence_list` call)
+        """
+        ...
+
+    async def ticks(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.subscribe {Number}: [Optional] If set to 1, will send updates whenever a new tick is received.
+        param args.ticks {Any}: The short symbol name or array of symbols (obtained from `active_symbols` call).
+        """
+        ...
+
+    async def ticks_history(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+                param args {Dict}
+                param args.adjust_start_time {Number}: [Optional] 1 - if the market is closed at the end time, or license limit is before end time, adjust interval backwards to compensate.
+                param args.count {Number}: [Optional] An upper limit on ticks to receive.
+                param args.end {String}: Epoch value representing the latest boundary of the returned ticks. If `latest` is specified, this will be the latest available timestamp.
+                param args.granularity {Number}: [Optional] Only applicable for style: `candles`. Candle time-dimension width setting. (default: `60`).
+                param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+                param args.req_id {Number}: [Optional] Used to map request to response.
+                param args.start {Number}: [Optional] Epoch value representing the earliest boundary of the returned ticks. 
+        - For `"style": "ticks"`: this will default to 1 day ago.
+        - For `"style": "candles"`: it will default to 1 day ago if count or granularity is undefined.
+                param args.style {String}: [Optional] The tick-output style.
+                param args.subscribe {Number}: [Optional] 1 - to send updates whenever a new tick is received.
+                param args.ticks_history {String}: Short symbol name (obtained from the `active_symbols` call).
+                
+        """
+        ...
+
+    async def time(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.time {Number}: Must be `1`
+        """
+        ...
+
+    async def tnc_approval(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.tnc_approval {Number}: Must be `1`
+        param args.ukgc_funds_protection {Number}: [Optional] For `ASK_UK_FUNDS_PROTECTION` in `cashier`.
+        """
+        ...
+
+    async def topup_virtual(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.topup_virtual {Number}: Must be `1`
+        """
+        ...
+
+    async def trading_durations(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.landing_company {String}: [Optional] If specified, will return only the underlyings for the specified landing company.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.trading_durations {Number}: Must be `1`
+        """
+        ...
+
+    async def trading_platform_accounts(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.platform {String}: Trading platform name
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.trading_platform_accounts {Number}: Must be `1`
+        """
+        ...
+
+    async def trading_platform_deposit(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.amount {Number}: Amount to deposit (in the currency of from_wallet).
+        param args.from_account {String}: Wallet account to transfer money from.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.platform {String}: Name of trading platform.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.to_account {String}: Trading account login to deposit money to.
+        param args.trading_platform_deposit {Number}: Must be `1`
+        """
+        ...
+
+    async def trading_platform_investor_password_change(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.account_id {String}: Trading account ID.
+        param args.new_password {String}: New investor password. Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address.
+        param args.old_password {String}: Old investor password for validation (non-empty string, accepts any printable ASCII character)
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.platform {String}: Name of trading platform.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.trading_platform_investor_password_change {Number}: Must be `1`
+        """
+        ...
+
+    async def trading_platform_investor_password_reset(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.account_id {String}: Trading account ID.
+        param args.new_password {String}: New password of the account. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address).
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.platform {String}: Name of trading platform.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.trading_platform_investor_password_reset {Number}: Must be `1`
+        param args.verification_code {String}: Email verification code (received from a `verify_email` call, which must be done first)
+        """
+        ...
+
+    async def trading_platform_new_account(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.account_type {String}: Account type.
+        param args.currency {String}: [Optional] Trading account currency, the default value will be the qualified account currency.
+        param args.dry_run {Number}: [Optional] If set to 1, only validation is performed.
+        param args.market_type {String}: Market type
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.password {String}: The master password of the account. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address). This field is required.
+        param args.platform {String}: Name of trading platform.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.sub_account_type {String}: [Optional] Sub account type.
+        param args.trading_platform_new_account {Number}: Must be `1`
+        """
+        ...
+
+    async def trading_platform_password_change(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.new_password {String}: New trading password. Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address.
+        param args.old_password {String}: Old password for validation. Must be empty if a password has not been set yet.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.platform {String}: Name of trading platform.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.trading_platform_password_change {Number}: Must be `1`
+        """
+        ...
+
+    async def trading_platform_password_reset(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.new_password {String}: New password of the account. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address).
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.platform {String}: Name of trading platform.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.trading_platform_password_reset {Number}: Must be `1`
+        param args.verification_code {String}: Email verification code (received from a `verify_email` call, which must be done first)
+        """
+        ...
+
+    async def trading_platform_withdrawal(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.amount {Number}: Amount to withdraw (in the currency of the Trading account).
+        param args.from_account {String}: Trading account login to withdraw money from.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.platform {String}: Name of trading platform.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.to_account {String}: Wallet account loginid to transfer money to.
+        param args.trading_platform_withdrawal {Number}: Must be `1`
+        """
+        ...
+
+    async def trading_servers(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.account_type {String}: [Optional] Trading account type.
+        param args.environment {String}: [Optional] Pass the environment (installation) instance. Currently, there are one demo and two real environments. Defaults to 'all'.
+        param args.market_type {String}: [Optional] Market type.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.platform {String}: [Optional] Pass the trading platform name, default to mt5
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.trading_servers {Number}: Must be `1`
+        """
+        ...
+
+    async def trading_times(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.trading_times {String}: Date to receive market opening times for. (`yyyy-mm-dd` format. `today` can also be specified).
+        """
+        ...
+
+    async def transaction(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.subscribe {Number}: If set to 1, will send updates whenever there is an update to transactions. If not to 1 then it will not return any records.
+        param args.transaction {Number}: Must be `1`
+        """
+        ...
+
+    async def transfer_between_accounts(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.account_from {String}: [Optional] The loginid of the account to transfer funds from.
+        param args.account_to {String}: [Optional] The loginid of the account to transfer funds to.
+        param args.accounts {String}: [Optional] To control the list of accounts returned when `account_from` or `account_to` is not provided. `brief` (default value) means that accounts with `mt5` account_type will be excluded; it will run faster. `all` means that all accounts with any account_type (including `mt5`) will be returned.
+        param args.amount {Number}: [Optional] The amount to transfer.
+        param args.currency {String}: [Optional] Currency code.
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.transfer_between_accounts {Number}: If `account_from` or `account_to` is not provided, it just returns the available accounts.
+        """
+        ...
+
+    async def verify_email(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.type {String}: Purpose of the email verification call.
+        param args.url_parameters {Any}: 
+        param args.verify_email {String}: Email address to be verified.
+        """
+        ...
+
+    async def website_status(self, args: Optional[dict] = None, trusted: Optional[bool] = None) -> dict:
+        """
+        param args {Dict}
+        param args.passthrough {Any}: [Optional] Used to pass data through the websocket, which may be retrieved via the `echo_req` output field.
+        param args.req_id {Number}: [Optional] Used to map request to response.
+        param args.subscribe {Number}: [Optional] `1` to stream the server/website status updates.
+        param args.website_status {Number}: Must be `1`
+        """
+        ...
+
+def make_method(method: str) -> Callable[..., Any]: ...
+def install_method(method: str) -> Callable[..., Any]: ...
+
+method_docs: Dict[str, str]
+
+ANY: dict
+NUMERIC: dict
+STRING: dict
+REQUIRED: dict
+REQUIRED_NUMERIC: dict
+REQUIRED_STRING: dict
+
+method_configs: Dict[str, dict]
+
+required_params: Dict[str, Tuple[str, ...]]
+
+def parse_args(all_args: dict) -> Optional[dict]: ...
+
+type_checkers: Dict[str, Callable[[Any], bool]]
+
+def validate_args(config: dict, args: Any) -> str: ...
+
+NO_COERCION: int
+TO_STRING: int
+TO_NUMBER: int
+
+def compile_validator(method: str, config: dict, needs_method_arg: Any = ...,
+                      required: Optional[Tuple[str, ...]] = ...) -> Callable[[Any], dict]: ...
+
+validators: Dict[str, Callable[[Any], dict]]
+
+def get_validator(method: str) -> Callable[[Any], dict]: ...
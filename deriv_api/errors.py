@@ -18,6 +18,14 @@ class APIError(error_factory('APIError')):
 class ConstructionError(error_factory('ConstructionError')):
     pass
 
+
+class ResponseValidationError(error_factory('ResponseValidationError')):
+    def __init__(self, response: dict, violations: list):
+        super().__init__(f"{response.get('msg_type')}: {' - '.join(violations)}")
+        self.response = response
+        self.violations = violations
+
+
 class ResponseError(Exception):
     def __init__(self, response: dict):
         super().__init__(response['error']['message'])
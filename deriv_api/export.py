@@ -0,0 +1,134 @@
+import asyncio
+import csv
+import time
+from collections import deque
+from typing import AsyncIterator, Deque, Dict, List, Optional, Sequence, TextIO
+
+from deriv_api.rate_limiter import RateLimiter
+
+# maximum `limit` of one page of every paginated call
+page_limits = {'statement': 999, 'profit_table': 500}
+
+
+class TransactionExport:
+    """
+    Streams all the rows of `statement` or `profit_table`, page by page
+
+    Pages are requested with `limit`/`offset`, `prefetch` pages ahead of the page being consumed, and are never
+    cached. Only the pages in flight are kept in memory, so exporting a whole account takes constant memory.
+    New transactions shift the offsets of `statement`, set `date_to` to export a stable range.
+
+    example
+    export = TransactionExport(api, 'statement', {'date_from': 1633046400, 'date_to': 1633132800})
+    async for row in export:
+        reconcile(row)
+    print(export.rows, export.rows_per_second)
+
+    with open('profit_table.csv', 'w', newline='') as file:
+        await TransactionExport(api, 'profit_table').write_csv(file)
+
+    param {DerivAPI} api - The api used to send the requests
+    param {str} msg_type - `statement` or `profit_table`
+    param {dict} request - Other arguments of the request, like `date_from`
+    param {int} page_size - Number of rows per page, defaults to the maximum `limit` of the call
+    param {int} prefetch - Number of pages requested ahead
+    param {RateLimiter} rate_limiter - Limits the number of requests per second
+
+    property {int} rows - Number of rows exported
+    property {int} pages - Number of requests sent
+    property {float} elapsed - Time spent exporting, in seconds
+    """
+
+    def __init__(self, api, msg_type: str, request: Optional[dict] = None, page_size: Optional[int] = None,
+                 prefetch: int = 2, rate_limiter: Optional[RateLimiter] = None) -> None:
+        if msg_type not in page_limits:
+            raise ValueError(f'{msg_type} is not a paginated call, use one of {", ".join(page_limits)}')
+        if prefetch < 1:
+            raise ValueError('prefetch should be at least 1')
+        self.api = api
+        self.msg_type = msg_type
+        self.request = request or {}
+        self.page_size = page_size or page_limits[msg_type]
+        self.prefetch = prefetch
+        self.rate_limiter = rate_limiter
+        self.rows = 0
+        self.pages = 0
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    async def fetch(self, offset: int) -> List[dict]:
+        if self.rate_limiter:
+            await self.rate_limiter.acquire()
+        self.pages += 1
+        response = await self.api.send({**self.request, self.msg_type: 1, 'limit': self.page_size,
+                                        'offset': offset}, cache=False)
+        return response[self.msg_type]['transactions']
+
+    async def iter_pages(self) -> AsyncIterator[List[dict]]:
+        """Yield the rows a page at a time"""
+        offset = self.request.get('offset', 0)
+        in_flight: Deque[asyncio.Future] = deque()
+        started_at = time.perf_counter()
+        try:
+            while True:
+                while len(in_flight) < self.prefetch:
+                    in_flight.append(asyncio.ensure_future(self.fetch(offset)))
+                    offset += self.page_size
+                page = await in_flight.popleft()
+                self.rows += len(page)
+                self.elapsed = time.perf_counter() - started_at
+                if page:
+                    yield page
+                if len(page) < self.page_size:
+                    return
+        finally:
+            for future in in_flight:
+                future.cancel()
+            self.elapsed = time.perf_counter() - started_at
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        # the pages are closed with the rows, the prefetched pages are cancelled as soon as the consumer stops
+        # (contextlib.aclosing needs python 3.10)
+        pages = self.iter_pages()
+        try:
+            async for page in pages:
+                for row in page:
+                    yield row
+        finally:
+            await pages.aclose()
+
+    async def iter_columns(self, columns: Sequence[str]) -> AsyncIterator[Dict[str, list]]:
+        """
+        Yield the rows a page at a time as columns, missing fields are None.
+        Every batch can be written as a row group of a columnar file, for example with `pyarrow.parquet`.
+        """
+        pages = self.iter_pages()
+        try:
+            async for page in pages:
+                yield {column: [row.get(column) for row in page] for column in columns}
+        finally:
+            await pages.aclose()
+
+    async def write_csv(self, file: TextIO, columns: Optional[Sequence[str]] = None) -> int:
+        """
+        Write the rows to a CSV file, returns the number of rows written
+
+        param {TextIO} file - The file, opened with `newline=''`
+        param {Sequence[str]} columns - The fields written, defaults to the fields of the first row
+        """
+        writer = None
+        written = 0
+        pages = self.iter_pages()
+        try:
+            async for page in pages:
+                if writer is None:
+                    writer = csv.DictWriter(file, fieldnames=columns or list(page[0].keys()), extrasaction='ignore')
+                    writer.writeheader()
+                writer.writerows(page)
+                written += len(page)
+        finally:
+            await pages.aclose()
+        return written
@@ -0,0 +1,299 @@
+import abc
+from array import array
+from math import sqrt
+from typing import Dict, Hashable, List, Optional, Sequence
+
+from rx import Observable
+from rx.disposable import Disposable
+from rx.subject import Subject
+
+from deriv_api.ring_buffer import RingBuffer
+
+"""
+Streaming technical indicators
+------------------------------
+Every indicator keeps its state for all the symbols of an engine in columns (one `array` per state variable,
+one slot per symbol), and updates a slot in O(1) per message. `update_many` updates many slots in one pass
+over the columns when many symbols update together.
+
+EMA(period)
+    exponential moving average, seeded with the first value
+RSI(period)
+    relative strength index with Wilder's smoothing
+Bollinger(period, k)
+    (middle, upper, lower) bands over a rolling window, from a running mean and sum of squared deviations
+"""
+
+
+class Indicator(abc.ABC):
+    """Base class of the indicators, see the module documentation"""
+    name = 'indicator'
+
+    def __init__(self, period: int) -> None:
+        if period <= 0:
+            raise ValueError('period should be a positive integer')
+        self.period = period
+        self.counts = array('q')
+
+    @property
+    def key(self) -> Hashable:
+        """Indicators with the same key compute the same values, and are shared by an engine"""
+        return self.name, self.period
+
+    def add_slot(self) -> None:
+        self.counts.append(0)
+
+    @abc.abstractmethod
+    def update(self, slot: int, value: float):
+        """Add a new value to the slot, returns the indicator value or None while the indicator is warming up"""
+
+    def update_many(self, slots: Sequence[int], values: Sequence[float]) -> list:
+        update = self.update
+        return [update(slot, value) for slot, value in zip(slots, values)]
+
+
+class EMA(Indicator):
+    name = 'ema'
+
+    def __init__(self, period: int) -> None:
+        super().__init__(period)
+        self.alpha = 2 / (period + 1)
+        self.values = array('d')
+
+    def add_slot(self) -> None:
+        super().add_slot()
+        self.values.append(0.0)
+
+    def update(self, slot: int, value: float) -> Optional[float]:
+        count = self.counts[slot]
+        if count:
+            previous = self.values[slot]
+            value = previous + self.alpha * (value - previous)
+        self.values[slot] = value
+        self.counts[slot] = count + 1
+        return value if count + 1 >= self.period else None
+
+    def update_many(self, slots: Sequence[int], values: Sequence[float]) -> List[Optional[float]]:
+        counts, states, alpha, period = self.counts, self.values, self.alpha, self.period
+        results = []
+        for slot, value in zip(slots, values):
+            count = counts[slot]
+            if count:
+                previous = states[slot]
+                value = previous + alpha * (value - previous)
+            states[slot] = value
+            counts[slot] = count = count + 1
+            results.append(value if count >= period else None)
+        return results
+
+
+class RSI(Indicator):
+    name = 'rsi'
+
+    def __init__(self, period: int = 14) -> None:
+        super().__init__(period)
+        self.previous = array('d')
+        self.gains = array('d')
+        self.losses = array('d')
+
+    def add_slot(self) -> None:
+        super().add_slot()
+        self.previous.append(0.0)
+        self.gains.append(0.0)
+        self.losses.append(0.0)
+
+    def update(self, slot: int, value: float) -> Optional[float]:
+        count = self.counts[slot]
+        previous = self.previous[slot]
+        self.previous[slot] = value
+        self.counts[slot] = count + 1
+        if not count:
+            return None
+
+        change = value - previous
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        period = self.period
+        if count <= period:
+            # simple average of the first `period` changes
+            self.gains[slot] += gain / period
+            self.losses[slot] += loss / period
+            if count < period:
+                return None
+        else:
+            self.gains[slot] = (self.gains[slot] * (period - 1) + gain) / period
+            self.losses[slot] = (self.losses[slot] * (period - 1) + loss) / period
+
+        average_loss = self.losses[slot]
+        if not average_loss:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + self.gains[slot] / average_loss)
+
+
+class Bollinger(Indicator):
+    """
+    Welford's update over the sliding window: the mean and the sum of squared deviations are updated in O(1),
+    without the cancellation of `squares / n - mean * mean` on large prices. The rounding errors left are
+    cleared by recomputing both from the window every `resync` updates.
+    """
+    name = 'bollinger'
+    resync = 1024
+
+    def __init__(self, period: int = 20, k: float = 2.0) -> None:
+        super().__init__(period)
+        self.k = k
+        self.windows: List[RingBuffer] = []
+        self.means = array('d')
+        self.deviations = array('d')
+
+    @property
+    def key(self) -> Hashable:
+        return self.name, self.period, self.k
+
+    def add_slot(self) -> None:
+        super().add_slot()
+        self.windows.append(RingBuffer(self.period))
+        self.means.append(0.0)
+        self.deviations.append(0.0)
+
+    def update(self, slot: int, value: float) -> Optional[tuple]:
+        window = self.windows[slot]
+        period = self.period
+        count = self.counts[slot] + 1
+        self.counts[slot] = count
+        mean = self.means[slot]
+        if count <= period:
+            delta = value - mean
+            mean += delta / count
+            deviations = self.deviations[slot] + delta * (value - mean)
+            window.append(value)
+        elif count % self.resync:
+            # the oldest value leaves the window as the new one enters it
+            oldest = window.last(period)[0]
+            new_mean = mean + (value - oldest) / period
+            deviations = self.deviations[slot] + (value - oldest) * (value - new_mean + oldest - mean)
+            mean = new_mean
+            window.append(value)
+        else:
+            window.append(value)
+            values = window.last(period)
+            mean = sum(values) / period
+            deviations = sum((item - mean) * (item - mean) for item in values)
+        self.means[slot] = mean
+        self.deviations[slot] = deviations
+        if count < period:
+            return None
+
+        deviation = self.k * sqrt(max(deviations / period, 0.0))
+        return mean, mean + deviation, mean - deviation
+
+
+class IndicatorEngine:
+    """
+    Incremental indicators over one price series per symbol, published as derived streams.
+
+    An engine is attached to upstream sources (`ticks` subscriptions, `candles` subscriptions, or the `closed`
+    stream of a `CandleAggregator`) and updates every registered indicator once per message. All derived streams
+    share the upstream subscription, and identical indicators are computed once.
+    Use one engine per timeframe, since all the sources of an engine feed the same series.
+
+    example
+    engine = IndicatorEngine()
+    ema = engine.stream(EMA(20))
+    ema.subscribe(lambda update: print(update['symbol'], update['value']))
+    await engine.track(api, 'R_100')
+
+    property {Dict[str, int]} slots - Slot of every symbol in the indicators columns
+    property {Subject} errors - Errors of the sources attached without an `errors` subject, they are detached
+    """
+
+    def __init__(self) -> None:
+        self.slots: Dict[str, int] = {}
+        self.indicators: Dict[Hashable, Indicator] = {}
+        self.streams: Dict[Hashable, Subject] = {}
+        self.upstreams: Dict[Hashable, Disposable] = {}
+        self.candles: Dict[str, dict] = {}
+        self.errors: Subject = Subject()
+
+    def slot(self, symbol: str) -> int:
+        slot = self.slots.get(symbol)
+        if slot is None:
+            slot = self.slots[symbol] = len(self.slots)
+            for indicator in self.indicators.values():
+                indicator.add_slot()
+        return slot
+
+    def add(self, indicator: Indicator) -> Indicator:
+        """Register the indicator, returns the registered one if an identical indicator is already registered"""
+        if indicator.key in self.indicators:
+            return self.indicators[indicator.key]
+        for _ in self.slots:
+            indicator.add_slot()
+        self.indicators[indicator.key] = indicator
+        self.streams[indicator.key] = Subject()
+        return indicator
+
+    def stream(self, indicator: Indicator) -> Observable:
+        """
+        Return the derived stream of the indicator, registering it if needed.
+        Every update is a dict with `symbol`, `epoch`, `indicator` (the indicator key) and `value`
+        """
+        return self.streams[self.add(indicator).key]
+
+    def update(self, symbol: str, epoch: int, price: float) -> None:
+        slot = self.slot(symbol)
+        for key, indicator in self.indicators.items():
+            value = indicator.update(slot, price)
+            if value is not None:
+                self.streams[key].on_next({'symbol': symbol, 'epoch': epoch, 'indicator': key, 'value': value})
+
+    def update_many(self, symbols: Sequence[str], epochs: Sequence[int], prices: Sequence[float]) -> None:
+        """Update many symbols at once, one pass over every indicator columns"""
+        slots = [self.slot(symbol) for symbol in symbols]
+        for key, indicator in self.indicators.items():
+            stream = self.streams[key]
+            for symbol, epoch, value in zip(symbols, epochs, indicator.update_many(slots, prices)):
+                if value is not None:
+                    stream.on_next({'symbol': symbol, 'epoch': epoch, 'indicator': key, 'value': value})
+
+    def on_message(self, message: dict) -> None:
+        """Update the indicators from a `tick` or `ohlc` response, or from a closed candle"""
+        msg_type = message.get('msg_type')
+        if msg_type == 'tick':
+            tick = message['tick']
+            self.update(tick['symbol'], tick['epoch'], tick['quote'])
+        elif msg_type == 'ohlc':
+            # the `candles` stream updates the candle in progress, the indicators get the close of every candle
+            ohlc = message['ohlc']
+            previous = self.candles.get(ohlc['symbol'])
+            self.candles[ohlc['symbol']] = ohlc
+            if previous and previous['open_time'] != ohlc['open_time']:
+                self.update(previous['symbol'], previous['open_time'], float(previous['close']))
+        else:
+            self.update(message['symbol'], message['epoch'], float(message['close']))
+
+    def attach(self, source: Observable, key: Hashable = None, errors: Optional[Subject] = None) -> Disposable:
+        """
+        Feed the engine with a source, once per key.
+        When the source fails, it is detached and its error is sent to `errors`, `self.errors` by default
+        """
+        if key is None:
+            key = id(source)
+
+        def on_error(error: Exception) -> None:
+            self.detach(key)
+            (self.errors if errors is None else errors).on_next(error)
+
+        if key not in self.upstreams:
+            upstream = self.upstreams[key] = source.subscribe(self.on_message, on_error)
+            return upstream
+        return self.upstreams[key]
+
+    async def track(self, api, symbol: str) -> Disposable:
+        """Subscribe to the ticks of the symbol and feed the engine with them, the errors go to `api.sanity_errors`"""
+        return self.attach(await api.subscribe({'ticks': symbol}), symbol, api.sanity_errors)
+
+    def detach(self, key: Hashable) -> None:
+        upstream = self.upstreams.pop(key, None)
+        if upstream:
+            upstream.dispose()
@@ -0,0 +1,183 @@
+import json
+import time
+from typing import Dict, List, Optional, Sequence
+
+import rx
+from rx import Observable
+from rx import operators as op
+from rx.disposable import Disposable
+
+from deriv_api.subscription_manager import get_msg_type
+from deriv_api.utils import dict_to_cache_key
+
+# streams that do not depend on the account, and can be shared by all the DerivAPI instances of a process
+public_streams = ['ticks', 'ticks_history', 'website_status']
+
+
+def is_public(request: dict) -> bool:
+    return get_msg_type(request) in public_streams
+
+
+class HubStream:
+    """A stream of the hub, with its consumers and the size of its frames"""
+
+    def __init__(self) -> None:
+        self.source: Optional[Observable] = None
+        self.msg_type: Optional[str] = None
+        self.subs_id: Optional[str] = None
+        # live subscriptions of every consumer, by consumer id
+        self.consumers: Dict[int, int] = {}
+        self.consumer_sources: Dict[int, Observable] = {}
+        # the observers of every consumer with their subscriptions, completed by `complete`
+        self.observers: Dict[int, List[tuple]] = {}
+        self.messages = 0
+        self.frame_bytes = 0
+        self.decode_seconds = 0.0
+
+    def on_message(self, response: dict) -> None:
+        if not self.messages:
+            self.subs_id = (response.get('subscription') or {}).get('id')
+            # measured once, used to estimate what every duplicated subscription would cost
+            frame = json.dumps(response)
+            self.frame_bytes = len(frame)
+            started_at = time.perf_counter()
+            json.loads(frame)
+            self.decode_seconds = time.perf_counter() - started_at
+        self.messages += 1
+
+    def consumer_source(self, consumer_id: int) -> Observable:
+        """The stream seen by one consumer, counting its subscriptions until they are disposed"""
+        source = self.consumer_sources.get(consumer_id)
+        if source is None:
+            def subscribe(observer, scheduler=None):
+                self.consumers[consumer_id] = self.consumers.get(consumer_id, 0) + 1
+                subscription = self.source.subscribe(observer, scheduler=scheduler)
+
+                def release():
+                    subscription.dispose()
+                    self.consumers[consumer_id] -= 1
+                    if not self.consumers[consumer_id]:
+                        del self.consumers[consumer_id]
+                    observers = self.observers[consumer_id]
+                    observers.remove(entry)
+                    if not observers:
+                        del self.observers[consumer_id]
+
+                entry = (observer, Disposable(release))
+                self.observers.setdefault(consumer_id, []).append(entry)
+                return entry[1]
+
+            source = self.consumer_sources[consumer_id] = rx.create(subscribe)
+        return source
+
+    def complete(self, consumer_id: int) -> bool:
+        """Complete the subscriptions of one consumer, the other consumers keep receiving the stream"""
+        observers = self.observers.get(consumer_id)
+        if not observers:
+            return False
+        for observer, disposable in list(observers):
+            disposable.dispose()
+            observer.on_completed()
+        return True
+
+
+class MarketDataHub:
+    """
+    A process-wide hub for the public market data streams of several DerivAPI instances
+
+    DerivAPI instances created with the `hub` option send their public subscriptions (`public_streams`) through
+    the hub. Identical subscriptions are deduplicated across instances: there is one wire subscription per unique
+    request, on the connection of the hub api, and its responses are fanned out to every consumer.
+    The subscription is forgotten when no consumer listens to it anymore, a consumer stops counting in `stats`
+    once its subscriptions to the stream are disposed, or completed by `forget` and `forget_all`.
+
+    example
+    hub = MarketDataHub(DerivAPI(app_id=1234))
+    api1 = DerivAPI(app_id=1234, hub=hub)
+    api2 = DerivAPI(app_id=1234, hub=hub)
+    ticks1 = await api1.subscribe({'ticks': 'R_100'})
+    ticks2 = await api2.subscribe({'ticks': 'R_100'}) # same wire subscription as ticks1
+    print(hub.stats())
+
+    param {DerivAPI} api - An api used for public streams only, it does not need to be authorized
+    """
+
+    def __init__(self, api) -> None:
+        self.api = api
+        self.streams: Dict[bytes, HubStream] = {}
+
+    async def subscribe(self, request: dict, consumer: object = None) -> Observable:
+        """
+        Subscribe to a public stream, sharing the wire subscription with the other consumers
+
+        param {Object} request - A request object acceptable by the API
+        param {Object} consumer - The consumer of the stream, usually a DerivAPI instance
+
+        returns {Observable} - An RxPY Observable
+        """
+        key = dict_to_cache_key(request)
+        stream = self.streams.get(key)
+        if stream is None:
+            source = await self.api.subscribe(request)
+            stream = self.streams.get(key)
+            if stream is None:
+                stream = HubStream()
+                stream.msg_type = get_msg_type(request)
+
+                def remove_stream():
+                    if self.streams.get(key) is stream:
+                        del self.streams[key]
+
+                stream.source = source.pipe(
+                    op.do_action(stream.on_message),
+                    op.finally_action(remove_stream),
+                    op.share()
+                )
+                self.streams[key] = stream
+        return stream.consumer_source(id(consumer))
+
+    def forget(self, subs_id: str, consumer: object = None) -> bool:
+        """
+        Complete the subscriptions of the consumer to the stream with the subscription id `subs_id`
+
+        param {String} subs_id - The id of the wire subscription, as in the responses of the stream
+        param {Object} consumer - The consumer of the stream, usually a DerivAPI instance
+
+        returns {bool} - Whether the consumer was subscribed to the stream
+        """
+        return any([stream.complete(id(consumer)) for stream in list(self.streams.values())
+                    if stream.subs_id == subs_id])
+
+    def forget_all(self, types: Sequence[str], consumer: object = None) -> List[str]:
+        """
+        Complete the subscriptions of the consumer to the streams of the given msg_types
+
+        param {List} types - The msg_types of the streams, like `ticks`
+        param {Object} consumer - The consumer of the streams, usually a DerivAPI instance
+
+        returns {List} - The subscription ids of the streams the consumer was subscribed to
+        """
+        return [stream.subs_id for stream in list(self.streams.values())
+                if stream.msg_type in types and stream.complete(id(consumer))]
+
+    def stats(self) -> dict:
+        """
+        Return the wire subscriptions used by the hub, and an estimate of what the consumers would use without it.
+        `saved_bytes` and `saved_decode_seconds` are estimated from the first frame of every stream
+        """
+        stats = {
+            'wire_subscriptions': len(self.streams),
+            'consumer_subscriptions': 0,
+            'messages': 0,
+            'saved_messages': 0,
+            'saved_bytes': 0,
+            'saved_decode_seconds': 0.0
+        }
+        for stream in self.streams.values():
+            duplicates = len(stream.consumers) - 1
+            stats['consumer_subscriptions'] += len(stream.consumers)
+            stats['messages'] += stream.messages
+            stats['saved_messages'] += stream.messages * duplicates
+            stats['saved_bytes'] += stream.messages * duplicates * stream.frame_bytes
+            stats['saved_decode_seconds'] += stream.messages * duplicates * stream.decode_seconds
+        return stats
@@ -0,0 +1,122 @@
+from typing import Callable, Dict, Tuple, Type
+
+import rx
+from rx import Observable
+
+"""
+Slotted response models
+-----------------------
+Optional `__slots__` classes for the responses received in large numbers. A model holds the fields of the body
+of one response (`response[msg_type]`) as attributes, and takes a fraction of the memory of the decoded dict.
+Fields missing from the response are None, unknown fields are kept in `extra`. Nested objects stay dicts.
+
+Responses are still dicts by default: models are only built by `to_model`, or by the `models` operator on a stream.
+
+example
+source = await api.subscribe({'proposal_open_contract': 1})
+source.pipe(models()).subscribe(lambda contract: print(contract.contract_id, contract.profit))
+"""
+
+# fields of the models, by msg_type
+response_fields: Dict[str, Tuple[str, ...]] = {
+    'balance': ('accounts', 'balance', 'currency', 'id', 'loginid', 'total'),
+    'buy': ('balance_after', 'buy_price', 'contract_id', 'longcode', 'payout', 'purchase_time', 'shortcode',
+            'start_time', 'transaction_id'),
+    'proposal': ('ask_price', 'cancellation', 'commission', 'date_expiry', 'date_start', 'display_value', 'id',
+                 'limit_order', 'longcode', 'multiplier', 'payout', 'spot', 'spot_time'),
+    'proposal_open_contract': (
+        'account_id', 'audit_details', 'barrier', 'barrier_count', 'bid_price', 'buy_price', 'cancellation',
+        'commission', 'contract_id', 'contract_type', 'currency', 'current_spot', 'current_spot_display_value',
+        'current_spot_time', 'date_expiry', 'date_settlement', 'date_start', 'display_name', 'display_value',
+        'entry_spot', 'entry_spot_display_value', 'entry_tick', 'entry_tick_display_value', 'entry_tick_time',
+        'exit_tick', 'exit_tick_display_value', 'exit_tick_time', 'expiry_time', 'high_barrier', 'id',
+        'is_expired', 'is_forward_starting', 'is_intraday', 'is_path_dependent', 'is_settleable', 'is_sold',
+        'is_valid_to_cancel', 'is_valid_to_sell', 'limit_order', 'longcode', 'low_barrier', 'multiplier', 'payout',
+        'profit', 'profit_percentage', 'purchase_time', 'reset_time', 'sell_price', 'sell_spot',
+        'sell_spot_display_value', 'sell_spot_time', 'sell_time', 'shortcode', 'status', 'tick_count',
+        'tick_stream', 'transaction_ids', 'underlying', 'validation_error'),
+    'tick': ('ask', 'bid', 'epoch', 'id', 'pip_size', 'quote', 'symbol'),
+}
+
+
+class ResponseModel:
+    """Base class of the models, see `make_model`"""
+
+    __slots__ = ('extra',)
+    msg_type: str = ''
+    fields: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, body: dict) -> 'ResponseModel':
+        """Build the model of a response body, `make_model` replaces it with unrolled assignments"""
+        model = object.__new__(cls)
+        for field in cls.fields:
+            setattr(model, field, body.get(field))
+        extra = {key: value for key, value in body.items() if key not in cls.fields}
+        model.extra = extra or None
+        return model
+
+    def to_dict(self) -> dict:
+        body = {field: getattr(self, field) for field in self.fields if getattr(self, field) is not None}
+        if self.extra:
+            body.update(self.extra)
+        return body
+
+    def __eq__(self, other) -> bool:
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        values = ', '.join(f'{field}={getattr(self, field)!r}' for field in self.fields
+                           if getattr(self, field) is not None)
+        return f'{type(self).__name__}({values})'
+
+
+def make_model(msg_type: str, fields: Tuple[str, ...]) -> Type[ResponseModel]:
+    """
+    Generate the model class of a msg_type, with one slot per field and a `from_dict` reading them all at once
+    """
+
+    name = ''.join(part.capitalize() for part in msg_type.split('_'))
+    cls = type(name, (ResponseModel,), {'__slots__': fields, 'msg_type': msg_type, 'fields': fields})
+
+    # unrolled assignments, like `dataclasses` does for `__init__`
+    lines = ['def from_dict(cls, body):',
+             '    model = new(cls)',
+             '    get = body.get',
+             *(f'    model.{field} = get({field!r})' for field in fields),
+             '    model.extra = None if body.keys() <= known else '
+             '{key: value for key, value in body.items() if key not in known}',
+             '    return model']
+    namespace = {'new': object.__new__, 'known': frozenset(fields)}
+    exec('\n'.join(lines), namespace)
+    cls.from_dict = classmethod(namespace['from_dict'])
+    return cls
+
+
+models_by_msg_type: Dict[str, Type[ResponseModel]] = {}
+
+
+def get_model(msg_type: str) -> Type[ResponseModel]:
+    """Return the model class of a msg_type, generated on first use"""
+    model = models_by_msg_type.get(msg_type)
+    if model is None:
+        model = models_by_msg_type[msg_type] = make_model(msg_type, response_fields[msg_type])
+    return model
+
+
+def to_model(response: dict) -> ResponseModel:
+    """Build the model of a response, raises KeyError for the msg_types without a model"""
+    msg_type = response['msg_type']
+    return get_model(msg_type).from_dict(response[msg_type])
+
+
+def models() -> Callable[[Observable], Observable]:
+    """An operator turning the responses of a stream into models"""
+    def _models(source: Observable) -> Observable:
+        def subscribe(observer, scheduler=None):
+            return source.subscribe(lambda response: observer.on_next(to_model(response)), observer.on_error,
+                                    observer.on_completed, scheduler=scheduler)
+
+        return rx.create(subscribe)
+
+    return _models
@@ -0,0 +1,110 @@
+import asyncio
+import time
+from typing import Dict, Iterable, List, Optional
+
+from deriv_api.deriv_api_calls import get_validator
+from deriv_api.errors import ResponseError
+from deriv_api.rate_limiter import RateLimiter
+
+# default number of tokens packed into one multiple accounts request
+MAX_TOKENS_PER_REQUEST = 100
+
+
+class MultiAccountTrader:
+    """
+    Trades for many accounts at once with `buy_contract_for_multiple_accounts` and
+    `sell_contract_for_multiple_accounts`
+
+    The tokens are packed into batches of `batch_size`, the batches are sent concurrently, at most `concurrency`
+    at a time and under `rate_limiter` if given. The results are returned per token: the `result` item of the
+    token, or an item with `code` and `message_to_client` when the trade failed for that account or its batch.
+    The api should be authorized with a token of the account managing the others.
+    Tokens are deduplicated, a contract is bought at most once per token.
+
+    example
+    trader = MultiAccountTrader(api, tokens)
+    bought = await trader.buy(price=10, parameters={'amount': 10, 'basis': 'stake', 'contract_type': 'CALL',
+                                                     'currency': 'USD', 'duration': 5, 'duration_unit': 't',
+                                                     'symbol': 'R_100'})
+    failed = [token for token, result in bought.items() if 'code' in result]
+
+    param {DerivAPI} api - The api used to send the requests
+    param {Iterable[str]} tokens - Tokens of the accounts traded
+    param {int} batch_size - Maximum number of tokens per request
+    param {int} concurrency - Maximum number of requests in flight
+    param {RateLimiter} rate_limiter - Limits the number of requests per second
+
+    property {float} elapsed - Time spent by the last trade, in seconds
+    """
+
+    def __init__(self, api, tokens: Iterable[str], batch_size: int = MAX_TOKENS_PER_REQUEST, concurrency: int = 4,
+                 rate_limiter: Optional[RateLimiter] = None) -> None:
+        if batch_size < 1:
+            raise ValueError('batch_size should be at least 1')
+        self.api = api
+        self.tokens: List[str] = list(dict.fromkeys(tokens))
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.rate_limiter = rate_limiter
+        self.elapsed = 0.0
+
+    def batches(self) -> List[List[str]]:
+        return [self.tokens[i:i + self.batch_size] for i in range(0, len(self.tokens), self.batch_size)]
+
+    async def buy(self, price: float, proposal_id: Optional[str] = None,
+                  parameters: Optional[dict] = None) -> Dict[str, dict]:
+        """
+        Buy a contract for every account, from a proposal id or from contract parameters
+
+        param {float} price - Maximum price at which to buy the contract
+        param {str} proposal_id - Id of a proposal, when `parameters` are not given
+        param {dict} parameters - Parameters of the contract
+
+        returns {Dict[str, dict]} - The result of every token
+        """
+        if (proposal_id is None) == (parameters is None):
+            raise ValueError('Either proposal_id or parameters should be given')
+        args = {'buy_contract_for_multiple_accounts': proposal_id or '1', 'price': price}
+        if parameters is not None:
+            args['parameters'] = parameters
+        return await self.trade('buy_contract_for_multiple_accounts', args)
+
+    async def sell(self, shortcode: str, price: float = 0) -> Dict[str, dict]:
+        """
+        Sell the contract of `shortcode` for every account
+
+        param {str} shortcode - The shortcode returned by `buy`
+        param {float} price - Minimum price at which to sell the contract, 0 to sell at market
+
+        returns {Dict[str, dict]} - The result of every token
+        """
+        return await self.trade('sell_contract_for_multiple_accounts', {'shortcode': shortcode, 'price': price})
+
+    async def trade(self, method: str, args: dict) -> Dict[str, dict]:
+        parsed_args = get_validator(method)({**args, 'tokens': []})
+        # parsing truncates numbers, prices are sent as given
+        parsed_args['price'] = args['price']
+
+        results: Dict[str, dict] = {}
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def send(tokens: List[str]) -> None:
+            async with semaphore:
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire()
+                try:
+                    response = await self.api.send({**parsed_args, 'tokens': tokens}, cache=False)
+                except ResponseError as err:
+                    for token in tokens:
+                        results[token] = {'token': token, 'code': err.code, 'message_to_client': err.message}
+                    return
+            for item in response[method]['result']:
+                results[item['token']] = item
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(send(tokens) for tokens in self.batches()))
+        self.elapsed = time.perf_counter() - started_at
+        # in the order of the tokens, the server may leave out the tokens it could not trade
+        return {token: results.get(token, {'token': token, 'code': 'NoResult',
+                                           'message_to_client': 'No result returned for this account'})
+                for token in self.tokens}
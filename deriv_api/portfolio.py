@@ -0,0 +1,132 @@
+from array import array
+from typing import Dict, List, Optional
+
+from rx.disposable import Disposable
+
+
+class PortfolioTracker:
+    """
+    Open contracts kept in a column-oriented table, updated in place by `proposal_open_contract` messages
+
+    One row per open contract, one `array` per numeric column: `contract_ids`, `buy_prices`, `bid_prices`,
+    `profits` and `payouts`, plus the `underlyings` and `contract_types` lists. Sold contracts are removed
+    (the last row takes their place) and their profit is added to `realized_profit`.
+    Aggregate queries run over whole columns instead of looping over response dicts.
+
+    example
+    portfolio = PortfolioTracker()
+    await portfolio.track(api) # subscribes to all the open contracts
+    print(portfolio.exposure(), portfolio.unrealized_profit(), portfolio.exposure_by_underlying())
+
+    property {float} realized_profit - Total profit of the contracts sold while tracked
+    """
+
+    def __init__(self) -> None:
+        self.rows: Dict[int, int] = {}
+        self.contract_ids = array('q')
+        self.buy_prices = array('d')
+        self.bid_prices = array('d')
+        self.profits = array('d')
+        self.payouts = array('d')
+        self.underlyings: List[str] = []
+        self.contract_types: List[str] = []
+        self.realized_profit = 0.0
+        self.subscription: Optional[Disposable] = None
+
+    def __len__(self) -> int:
+        return len(self.contract_ids)
+
+    def on_update(self, response: dict) -> None:
+        """Update the table with a `proposal_open_contract` response"""
+        # errors of a single contract are sent on the stream of all contracts, they do not change the table
+        if response.get('error'):
+            return
+        contract = response.get('proposal_open_contract')
+        if not contract or 'contract_id' not in contract:
+            return
+
+        contract_id = int(contract['contract_id'])
+        if contract.get('is_sold'):
+            if contract_id in self.rows:
+                self.remove(contract_id)
+                self.realized_profit += float(contract.get('profit', 0))
+            return
+
+        row = self.rows.get(contract_id)
+        if row is None:
+            self.rows[contract_id] = len(self.contract_ids)
+            self.contract_ids.append(contract_id)
+            self.buy_prices.append(float(contract.get('buy_price', 0)))
+            self.bid_prices.append(float(contract.get('bid_price', 0)))
+            self.profits.append(float(contract.get('profit', 0)))
+            self.payouts.append(float(contract.get('payout', 0)))
+            self.underlyings.append(contract.get('underlying'))
+            self.contract_types.append(contract.get('contract_type'))
+            return
+
+        if 'bid_price' in contract:
+            self.bid_prices[row] = float(contract['bid_price'])
+        if 'profit' in contract:
+            self.profits[row] = float(contract['profit'])
+        if 'payout' in contract:
+            self.payouts[row] = float(contract['payout'])
+
+    def remove(self, contract_id: int) -> None:
+        """Remove a contract, the last row is moved to its place to keep the columns contiguous"""
+        row = self.rows.pop(contract_id)
+        last = len(self.contract_ids) - 1
+        for column in (self.contract_ids, self.buy_prices, self.bid_prices, self.profits, self.payouts,
+                       self.underlyings, self.contract_types):
+            column[row] = column[last]
+            column.pop()
+        if row != last:
+            self.rows[self.contract_ids[row]] = row
+
+    async def track(self, api) -> Disposable:
+        """Subscribe to all the open contracts of the account, and keep the table up to date"""
+        if not self.subscription:
+            source = await api.subscribe({'proposal_open_contract': 1})
+            subscription = self.subscription = source.subscribe(self.on_update,
+                                                                lambda error: self.on_error(api, error))
+            return subscription
+        return self.subscription
+
+    def on_error(self, api, error: Exception) -> None:
+        """The stream of the open contracts failed: stop tracking, `track` subscribes again, and report the error"""
+        self.untrack()
+        api.sanity_errors.on_next(error)
+
+    def untrack(self) -> None:
+        if self.subscription:
+            self.subscription.dispose()
+            self.subscription = None
+
+    def exposure(self) -> float:
+        """Total buy price of the open contracts"""
+        return sum(self.buy_prices)
+
+    def market_value(self) -> float:
+        """Total bid price of the open contracts"""
+        return sum(self.bid_prices)
+
+    def unrealized_profit(self) -> float:
+        return sum(self.profits)
+
+    def potential_payout(self) -> float:
+        return sum(self.payouts)
+
+    def total_profit(self) -> float:
+        """Realized and unrealized profit"""
+        return self.realized_profit + sum(self.profits)
+
+    def exposure_by_underlying(self) -> Dict[str, float]:
+        exposure: Dict[str, float] = {}
+        for underlying, buy_price in zip(self.underlyings, self.buy_prices):
+            exposure[underlying] = exposure.get(underlying, 0.0) + buy_price
+        return exposure
+
+    def profit_by_underlying(self) -> Dict[str, float]:
+        profits: Dict[str, float] = {}
+        for underlying, profit in zip(self.underlyings, self.profits):
+            profits[underlying] = profits.get(underlying, 0.0) + profit
+        return profits
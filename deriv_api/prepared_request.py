@@ -0,0 +1,56 @@
+import json
+from typing import Optional, Union
+
+from deriv_api.utils import dict_to_cache_key
+
+
+class PreparedRequest:
+    """
+    A request on its way to the API: its args, cache key, `req_id` and JSON message, each computed at most once
+    and shared by the cache and the connection.
+
+    The args dict is never modified: the `req_id` is put into the message, not into the args, so the caller's dict
+    is sent, cached and returned as it was given.
+
+    param {dict} args - The args of the request, as sent
+    param {int} req_id - The `req_id` of the request, allocated by the api when not given nor in `args`.
+    Raises ValueError when it differs from the `req_id` of `args`: the response would not be matched
+    """
+
+    __slots__ = ('args', 'req_id', '_cache_key', '_message')
+
+    def __init__(self, args: dict, req_id: Optional[int] = None) -> None:
+        if req_id is not None and args.get('req_id', req_id) != req_id:
+            raise ValueError(f"req_id {req_id} does not match the req_id {args['req_id']} of the request")
+        self.args = args
+        self.req_id = args.get('req_id') if req_id is None else req_id
+        self._cache_key: Optional[bytes] = None
+        self._message: Optional[str] = None
+
+    @property
+    def cache_key(self) -> bytes:
+        """The key of the request in the cache, see `dict_to_cache_key`"""
+        if self._cache_key is None:
+            self._cache_key = dict_to_cache_key(self.args)
+        return self._cache_key
+
+    @property
+    def message(self) -> str:
+        """The request as JSON, with its `req_id`"""
+        if self._message is None:
+            message = json.dumps(self.args)
+            if 'req_id' not in self.args:
+                # append the req_id to the serialized args instead of copying them
+                message = f'{message[:-1]}{", " if self.args else ""}"req_id": {json.dumps(self.req_id)}}}'
+            self._message = message
+        return self._message
+
+
+def prepare(request: Union[dict, PreparedRequest]) -> PreparedRequest:
+    """Return the request prepared, as is when it is already"""
+    return request if isinstance(request, PreparedRequest) else PreparedRequest(request)
+
+
+def cache_key(request: Union[dict, PreparedRequest]) -> bytes:
+    """The cache key of a request, computed once for the prepared requests"""
+    return request.cache_key if isinstance(request, PreparedRequest) else dict_to_cache_key(request)
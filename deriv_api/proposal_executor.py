@@ -0,0 +1,134 @@
+import asyncio
+import json
+import time
+from array import array
+from typing import Callable, Optional
+
+from rx.disposable import Disposable
+
+from deriv_api.deriv_api_calls import get_validator
+
+
+class ProposalExecutor:
+    """
+    Buys the contract of a proposal subscription as soon as a proposal message triggers it
+
+    The `buy` request is validated and serialized once, when the executor is created. On the triggering
+    message only the proposal id and a `req_id` are put into the serialized template, and the message is
+    sent with `send_serialized`: no argument parsing, no validation, no cache.
+
+    example
+    executor = ProposalExecutor(api, {'proposal': 1, 'amount': 10, 'basis': 'stake', 'contract_type': 'CALL',
+                                      'currency': 'USD', 'duration': 5, 'duration_unit': 't', 'symbol': 'R_100'},
+                                price=10)
+    await executor.start()
+    response = await executor.buy_when(lambda proposal: float(proposal['payout']) >= 19.5)
+    print(executor.latency_stats())
+
+    param {DerivAPI} api - The api used to subscribe to the proposal and to buy it
+    param {dict} proposal - The proposal request
+    param {float} price - Maximum price at which to buy the contract
+    param {dict} buy_args - Other arguments of the `buy` request, like `passthrough`
+
+    property {array} tick_to_send - Seconds from the triggering proposal message to the buy request sent
+    property {array} round_trips - Seconds from the triggering proposal message to the buy response
+    """
+
+    def __init__(self, api, proposal: dict, price: float, buy_args: Optional[dict] = None) -> None:
+        self.api = api
+        self.proposal = proposal
+        template = {**(buy_args or {}), 'buy': 'id', 'price': price}
+        parsed_args = get_validator('buy')(template)
+        # parsing truncates numbers, the maximum price is sent as given
+        parsed_args['price'] = price
+        del parsed_args['buy']
+        self.message_prefix = '{"buy": '
+        self.message_middle = ', ' + json.dumps(parsed_args)[1:-1] + ', "req_id": ' \
+            if parsed_args else ', "req_id": '
+
+        self.latest: Optional[dict] = None
+        self.latest_at = 0.0
+        self.condition: Optional[Callable[[dict], bool]] = None
+        self.result: Optional[asyncio.Future] = None
+        self.subscription: Optional[Disposable] = None
+        self.tick_to_send = array('d')
+        self.round_trips = array('d')
+
+    def serialize(self, proposal_id: str, req_id: int) -> str:
+        """The `buy` request of the proposal, as JSON"""
+        return f'{self.message_prefix}{json.dumps(proposal_id)}{self.message_middle}{req_id}}}'
+
+    async def start(self) -> Disposable:
+        """Subscribe to the proposal"""
+        if not self.subscription:
+            source = await self.api.subscribe(self.proposal)
+            self.subscription = source.subscribe(self.on_proposal, self.on_error)
+        return self.subscription
+
+    def stop(self) -> None:
+        if self.subscription:
+            self.subscription.dispose()
+            self.subscription = None
+
+    def on_proposal(self, response: dict) -> None:
+        received_at = time.perf_counter()
+        self.latest = response['proposal']
+        self.latest_at = received_at
+        if self.condition and self.condition(self.latest):
+            self.condition = None
+            asyncio.ensure_future(self.execute(self.latest['id'], received_at, self.result))
+
+    def on_error(self, error: Exception) -> None:
+        if self.result and not self.result.done():
+            self.condition = None
+            self.result.set_exception(error)
+
+    def buy_when(self, condition: Callable[[dict], bool]) -> asyncio.Future:
+        """
+        Buy the contract on the first proposal message accepted by `condition`
+
+        param {Callable} condition - Called with the `proposal` of every message
+
+        returns {Future} - The `buy` response
+        """
+        if self.result and not self.result.done():
+            raise ValueError('A buy is already pending')
+        self.result = asyncio.get_event_loop().create_future()
+        self.condition = condition
+        return self.result
+
+    async def buy_now(self) -> dict:
+        """Buy the contract of the latest proposal message"""
+        if not self.latest:
+            raise ValueError('No proposal received yet')
+        if self.result and not self.result.done():
+            raise ValueError('A buy is already pending')
+        self.result = asyncio.get_event_loop().create_future()
+        await self.execute(self.latest['id'], self.latest_at, self.result)
+        return await self.result
+
+    async def execute(self, proposal_id: str, received_at: float, result: asyncio.Future) -> None:
+        req_id = self.api.next_req_id()
+        try:
+            response = await self.api.send_serialized(req_id, self.serialize(proposal_id, req_id))
+            self.tick_to_send.append(time.perf_counter() - received_at)
+            response = await response
+            self.round_trips.append(time.perf_counter() - received_at)
+        except Exception as err:
+            if not result.done():
+                result.set_exception(err)
+            return
+        if not result.done():
+            result.set_result(response)
+
+    def latency_stats(self) -> dict:
+        """Last, mean and max latencies, in seconds"""
+        stats = {}
+        for name, latencies in (('tick_to_send', self.tick_to_send), ('round_trip', self.round_trips)):
+            stats[name] = {
+                'count': len(latencies),
+                'last': latencies[-1] if latencies else None,
+                'mean': sum(latencies) / len(latencies) if latencies else None,
+                'max': max(latencies) if latencies else None
+            }
+        return stats
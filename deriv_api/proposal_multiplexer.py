@@ -0,0 +1,210 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+import rx
+from rx import Observable
+from rx.disposable import Disposable
+from rx.subject import Subject
+
+from deriv_api.errors import ResponseError
+from deriv_api.utils import dict_to_cache_key
+
+# parameters that vary between the proposals of a `proposal_array`, the others are shared
+per_proposal_params = ['contract_type', 'barrier', 'barrier2']
+
+# parameters `proposal_array` does not accept, proposals using them are not merged
+unsupported_params = ['cancellation', 'limit_order', 'selected_tick', 'proposal_array']
+
+
+class ProposalGroup:
+    """Compatible proposals merged into one `proposal_array` subscription"""
+
+    def __init__(self, shared: dict) -> None:
+        self.shared = shared
+        self.contract_types: List[str] = []
+        self.barriers: List[Tuple[str, Optional[str]]] = []
+        self.subjects: Dict[Tuple[str, str, Optional[str]], Subject] = {}
+        self.sources: Dict[Tuple[str, str, Optional[str]], Observable] = {}
+        self.requests: Dict[Tuple[str, str, Optional[str]], dict] = {}
+        # subscription keys of the requests, several requests can share a proposal
+        self.request_keys: Dict[bytes, Tuple[str, str, Optional[str]]] = {}
+        # subscription key of the `proposal_array` stream
+        self.key: Optional[bytes] = None
+        self.listeners = 0
+        self.upstream: Optional[Disposable] = None
+        self.sent: Optional[asyncio.Future] = None
+
+    def add(self, request: dict) -> Tuple[str, str, Optional[str]]:
+        contract_type = request['contract_type']
+        barrier = (str(request['barrier']), str(request['barrier2']) if 'barrier2' in request else None)
+        if contract_type not in self.contract_types:
+            self.contract_types.append(contract_type)
+        if barrier not in self.barriers:
+            self.barriers.append(barrier)
+        proposal_key = (contract_type,) + barrier
+        if proposal_key not in self.subjects:
+            self.subjects[proposal_key] = Subject()
+            self.requests[proposal_key] = request
+        self.request_keys[dict_to_cache_key(request)] = proposal_key
+        return proposal_key
+
+    def array_request(self) -> dict:
+        barriers = [{'barrier': barrier} if barrier2 is None else {'barrier': barrier, 'barrier2': barrier2}
+                    for barrier, barrier2 in self.barriers]
+        return {'proposal_array': 1, **self.shared, 'contract_type': self.contract_types, 'barriers': barriers}
+
+
+class ProposalMultiplexer:
+    """
+    Merges compatible `proposal` subscriptions into `proposal_array` subscriptions
+
+    Proposals with a barrier that only differ by contract type and barriers, and are subscribed within `delay`
+    seconds of each other, are sent as one `proposal_array` subscription. Its responses are demultiplexed back
+    into `proposal` responses for every proposal consumer. The array subscription is forgotten when none of its
+    proposals has a consumer anymore.
+
+    The merged proposals are registered in the subscription manager like the other `proposal` subscriptions:
+    the same proposal subscribed later gets the live stream, and `forget_all('proposal')` ends them with their
+    `proposal_array` streams.
+
+    A `proposal_array` prices every contract type at every barrier of the group, so merging `CALL` at one barrier
+    with `PUT` at another also prices the 2 proposals nobody asked for, in the same stream.
+
+    example
+    api.subscription_manager.enable_proposal_multiplexing()
+    call, put = await asyncio.gather(api.subscribe({**proposal, 'contract_type': 'CALL'}),
+                                     api.subscribe({**proposal, 'contract_type': 'PUT'})) # one stream
+
+    param {SubscriptionManager} subscription_manager - The manager subscribing to the `proposal_array` streams
+    param {float} delay - Time to wait for more proposals to merge, 0 to merge the ones subscribed together
+    """
+
+    def __init__(self, subscription_manager, delay: float = 0.0) -> None:
+        self.subscription_manager = subscription_manager
+        self.delay = delay
+        self.pending: Dict[bytes, ProposalGroup] = {}
+        self.groups: List[ProposalGroup] = []
+        # group and proposal of the subscription key of every live merged proposal
+        self.keys: Dict[bytes, Tuple[ProposalGroup, Tuple[str, str, Optional[str]]]] = {}
+        self.array_messages = 0
+        self.proposal_messages = 0
+
+    @staticmethod
+    def can_merge(request: dict) -> bool:
+        return 'barrier' in request and 'contract_type' in request and \
+               not any(param in request for param in unsupported_params)
+
+    async def subscribe(self, request: dict) -> Observable:
+        """
+        Subscribe to a proposal through a `proposal_array` subscription
+
+        param {Object} request - A proposal request accepted by `can_merge`
+
+        returns {Observable} - A stream of `proposal` responses
+        """
+        shared = {k: v for k, v in request.items() if k not in per_proposal_params and k not in
+                  ['proposal', 'subscribe', 'req_id', 'passthrough']}
+        group_key = dict_to_cache_key(shared)
+        group = self.pending.get(group_key)
+        if group is None:
+            group = self.pending[group_key] = ProposalGroup(shared)
+            group.sent = asyncio.ensure_future(self.send_group(group_key, group))
+        proposal_key = group.add(request)
+        await asyncio.shield(group.sent)
+        return group.sources[proposal_key]
+
+    async def send_group(self, group_key: bytes, group: ProposalGroup) -> None:
+        await asyncio.sleep(self.delay)
+        del self.pending[group_key]
+        array_request = group.array_request()
+        group.key = dict_to_cache_key(array_request)
+        source = await self.subscription_manager.subscribe(array_request)
+        self.groups.append(group)
+
+        for proposal_key, subject in group.subjects.items():
+            group.sources[proposal_key] = self.proposal_source(group, subject)
+        for key, proposal_key in group.request_keys.items():
+            self.keys[key] = (group, proposal_key)
+            self.subscription_manager.sources[key] = group.sources[proposal_key]
+            self.subscription_manager.save_subs_per_msg_type(group.requests[proposal_key], key)
+
+        group.upstream = source.subscribe(lambda response: self.demultiplex(group, response),
+                                          lambda error: self.close_group(group, error),
+                                          lambda: self.close_group(group))
+
+    def proposal_source(self, group: ProposalGroup, subject: Subject) -> Observable:
+        """The stream of one proposal, the array subscription is disposed when its last consumer leaves"""
+        def release():
+            group.listeners -= 1
+            if not group.listeners and group in self.groups:
+                self.close_group(group)
+
+        def subscribe(observer, scheduler=None):
+            group.listeners += 1
+            subscription = subject.subscribe(observer, scheduler=scheduler)
+            return Disposable(lambda: (subscription.dispose(), release()))
+
+        return rx.create(subscribe)
+
+    def unregister(self, group: ProposalGroup, proposal_key: Optional[Tuple[str, str, Optional[str]]] = None) -> None:
+        """Remove the proposals of a group from the subscription manager, all of them without `proposal_key`"""
+        for key, registered in group.request_keys.items():
+            if (proposal_key is None or registered == proposal_key) and self.keys.pop(key, None):
+                self.subscription_manager.sources.pop(key, None)
+
+    def complete(self, key: bytes) -> None:
+        """End the stream of a merged proposal, by its subscription key"""
+        group, proposal_key = self.keys.get(key, (None, None))
+        if group is None:
+            return
+        self.unregister(group, proposal_key)
+        group.subjects[proposal_key].on_completed()
+
+    def close_group(self, group: ProposalGroup, error: Optional[Exception] = None) -> None:
+        """End the streams of a group and dispose its array subscription"""
+        if group in self.groups:
+            self.groups.remove(group)
+        self.unregister(group)
+        for subject in group.subjects.values():
+            if error is None:
+                subject.on_completed()
+            else:
+                subject.on_error(error)
+        if group.upstream:
+            group.upstream.dispose()
+
+    def demultiplex(self, group: ProposalGroup, response: dict) -> None:
+        self.array_messages += 1
+        proposal_array = response['proposal_array']
+        proposals = proposal_array['proposals']
+        for (contract_type, barrier, barrier2), subject in group.subjects.items():
+            index = group.barriers.index((barrier, barrier2))
+            proposal = dict(proposals[contract_type][index])
+            if 'error' in proposal:
+                error = proposal['error']
+                self.unregister(group, (contract_type, barrier, barrier2))
+                subject.on_error(ResponseError({
+                    'echo_req': group.requests[(contract_type, barrier, barrier2)],
+                    'error': {'code': error.get('code'), 'message': error.get('message')},
+                    'msg_type': 'proposal'
+                }))
+                continue
+            proposal.setdefault('id', proposal_array.get('id'))
+            self.proposal_messages += 1
+            subject.on_next({
+                'echo_req': group.requests[(contract_type, barrier, barrier2)],
+                'msg_type': 'proposal',
+                'proposal': proposal,
+                'subscription': response.get('subscription')
+            })
+
+    def stats(self) -> dict:
+        """Compare the streams and messages used with the ones separate `proposal` subscriptions would use"""
+        return {
+            'proposal_subscriptions': len({(id(group), proposal_key) for group, proposal_key in self.keys.values()}),
+            # groups can share an array stream
+            'wire_streams': len({group.key for group in self.groups if group.key in self.subscription_manager.sources}),
+            'array_messages': self.array_messages,
+            'proposal_messages': self.proposal_messages
+        }
+
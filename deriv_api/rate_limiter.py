@@ -0,0 +1,40 @@
+import asyncio
+import time
+
+
+class RateLimiter:
+    """
+    A token bucket rate limiter for asyncio tasks
+
+    At most `rate` acquisitions are allowed per `period` seconds on average, with bursts of up to `burst`.
+
+    example
+    limiter = RateLimiter(10) # 10 requests per second
+    await limiter.acquire()
+    await api.send(request)
+
+    param {float} rate - Number of acquisitions per period
+    param {float} period - Period in seconds, 1 by default
+    param {int} burst - Maximum number of acquisitions without waiting, `rate` by default
+    """
+
+    def __init__(self, rate: float, period: float = 1.0, burst: int = None) -> None:
+        if rate <= 0 or period <= 0:
+            raise ValueError('rate and period should be positive')
+        self.fill_rate = rate / period
+        self.burst = burst or max(int(rate), 1)
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+
+    def refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.fill_rate)
+        self.updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, and take it"""
+        self.refill()
+        while self.tokens < 1:
+            await asyncio.sleep((1 - self.tokens) / self.fill_rate)
+            self.refill()
+        self.tokens -= 1
@@ -0,0 +1,153 @@
+from typing import Callable, Dict, List, Optional
+
+from rx.subject import Subject
+
+from deriv_api.deriv_api_calls import ANY, NUMERIC, REQUIRED_NUMERIC, REQUIRED_STRING, STRING, type_checkers
+from deriv_api.errors import ResponseValidationError
+from deriv_api.models import response_fields
+
+"""
+Response validation
+-------------------
+Checks a sample of the responses received against the expected shape of their msg_type, to detect changes of
+the API. The fields are configured like the params of the requests, see `method_configs`: the required fields
+must be there, the typed fields must have their type when they are there. The fields of the bodies that have a
+model (see `models.response_fields`) are all known, other fields are reported as unexpected.
+
+Violations are reported as `ResponseValidationError`, through `api.sanity_errors`.
+
+example
+validator = api.enable_response_validation(rate=1000)
+api.sanity_errors.subscribe(lambda err: log.warning(err))
+"""
+
+# expected fields of the response bodies, by msg_type
+response_configs: Dict[str, dict] = {
+    'balance': {'balance': REQUIRED_NUMERIC, 'currency': REQUIRED_STRING, 'id': STRING, 'loginid': REQUIRED_STRING},
+    'buy': {
+        'balance_after': REQUIRED_NUMERIC, 'buy_price': REQUIRED_NUMERIC, 'contract_id': REQUIRED_NUMERIC,
+        'longcode': REQUIRED_STRING, 'payout': REQUIRED_NUMERIC, 'purchase_time': REQUIRED_NUMERIC,
+        'shortcode': REQUIRED_STRING, 'start_time': REQUIRED_NUMERIC, 'transaction_id': REQUIRED_NUMERIC
+    },
+    'proposal': {
+        'ask_price': REQUIRED_NUMERIC, 'date_expiry': NUMERIC, 'date_start': REQUIRED_NUMERIC,
+        'display_value': REQUIRED_STRING, 'id': REQUIRED_STRING, 'longcode': REQUIRED_STRING,
+        'payout': REQUIRED_NUMERIC, 'spot': REQUIRED_NUMERIC, 'spot_time': REQUIRED_NUMERIC
+    },
+    # the body is empty when there is no open contract
+    'proposal_open_contract': {
+        'bid_price': NUMERIC, 'buy_price': NUMERIC, 'contract_id': NUMERIC, 'contract_type': STRING,
+        'currency': STRING, 'current_spot_time': NUMERIC, 'date_expiry': NUMERIC, 'date_start': NUMERIC,
+        'id': STRING, 'is_sold': NUMERIC, 'payout': NUMERIC, 'profit': NUMERIC, 'purchase_time': NUMERIC,
+        'shortcode': STRING, 'status': ANY, 'underlying': STRING
+    },
+    'tick': {
+        'ask': NUMERIC, 'bid': NUMERIC, 'epoch': REQUIRED_NUMERIC, 'id': STRING, 'pip_size': NUMERIC,
+        'quote': REQUIRED_NUMERIC, 'symbol': REQUIRED_STRING
+    },
+}
+
+# expected types of the bodies that are not objects
+body_types: Dict[str, str] = {'forget': 'numeric', 'ping': 'string', 'time': 'numeric'}
+
+
+def compile_response_validator(msg_type: str) -> Callable[[dict], List[str]]:
+    """
+    Compile the validation of the responses of a msg_type into one function, returning the violations found
+    """
+
+    config = response_configs.get(msg_type)
+    body_type = body_types.get(msg_type)
+    required = [field for field, field_config in (config or {}).items() if field_config.get('required')]
+    typed = [(field, field_config['type'], type_checkers[field_config['type']])
+             for field, field_config in (config or {}).items() if field_config.get('type')]
+    # all the fields are known for the bodies with a model
+    known = (frozenset(config or ()) | frozenset(response_fields[msg_type])) if msg_type in response_fields else None
+
+    def validator(response: dict) -> List[str]:
+        violations = []
+        if not isinstance(response.get('echo_req'), dict):
+            violations.append('echo_req is missing')
+        if response.get('error') or msg_type not in response:
+            # error responses have no body
+            return violations
+
+        body = response[msg_type]
+        if body_type:
+            if not type_checkers[body_type](body):
+                violations.append(f'{body_type} value expected but found {type(body)}: {msg_type}')
+            return violations
+        if config is None:
+            return violations
+        if not isinstance(body, dict):
+            violations.append(f'dict value expected but found {type(body)}: {msg_type}')
+            return violations
+
+        missing = [field for field in required if field not in body]
+        if missing:
+            violations.append(f'Required fields missing: {", ".join(missing)}')
+        for field, expected_type, checker in typed:
+            value = body.get(field)
+            if value is not None and not checker(value):
+                violations.append(f'{expected_type} value expected but found {type(value)}: {field}')
+        if known is not None and not body.keys() <= known:
+            violations.append(f'unexpected fields: {", ".join(sorted(body.keys() - known))}')
+        return violations
+
+    return validator
+
+
+response_validators: Dict[str, Callable[[dict], List[str]]] = {}
+
+
+def get_response_validator(msg_type: str) -> Callable[[dict], List[str]]:
+    """Return the compiled validator of a msg_type, compiled on first use"""
+    validator = response_validators.get(msg_type)
+    if validator is None:
+        validator = response_validators[msg_type] = compile_response_validator(msg_type)
+    return validator
+
+
+class ResponseValidator:
+    """
+    Validates one response in `rate` of every msg_type, the first one included, and reports the violations
+
+    param {Subject} errors - The subject the `ResponseValidationError`s are sent to, like `api.sanity_errors`
+    param {int} rate - Validate one response in `rate`, 1 to validate them all
+
+    property {int} checked - Number of responses validated
+    property {int} failed - Number of responses with violations
+    """
+
+    def __init__(self, errors: Subject, rate: int = 1000) -> None:
+        if rate < 1:
+            raise ValueError('rate should be at least 1')
+        self.errors = errors
+        self.rate = rate
+        # responses to skip before the next validation, by msg_type
+        self.countdowns: Dict[str, int] = {}
+        self.checked = 0
+        self.failed = 0
+
+    def check(self, response: dict) -> Optional[List[str]]:
+        """Validate the response if it is sampled, returns its violations or None when it is not sampled"""
+        msg_type = response.get('msg_type')
+        countdown = self.countdowns.get(msg_type, 0)
+        if countdown:
+            self.countdowns[msg_type] = countdown - 1
+            return None
+        self.countdowns[msg_type] = self.rate - 1
+        return self.validate(response)
+
+    def validate(self, response: dict) -> List[str]:
+        """Validate a response, sampled or not"""
+        self.checked += 1
+        msg_type = response.get('msg_type')
+        if not isinstance(msg_type, str):
+            violations = ['msg_type is missing']
+        else:
+            violations = get_response_validator(msg_type)(response)
+        if violations:
+            self.failed += 1
+            self.errors.on_next(ResponseValidationError(response, violations))
+        return violations
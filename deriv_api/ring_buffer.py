@@ -0,0 +1,62 @@
+from array import array
+
+
+class RingBuffer:
+    """
+    A fixed capacity ring buffer of numbers backed by an `array.array`
+
+    Every value is written twice, at `i` and at `i + capacity`, so the latest `n` values are always contiguous
+    in memory. Append is O(1) and `last()` returns a zero-copy `memoryview` window, at the cost of twice the
+    memory of a plain array.
+
+    Windows are live views on the buffer: they are overwritten once `capacity` new values are appended.
+    Copy them (`window.tolist()` or `array(typecode, window)`) if they have to outlive that.
+
+    example
+    buffer = RingBuffer(3)
+    for value in [1, 2, 3, 4]:
+        buffer.append(value)
+    buffer.last(2).tolist() # [3.0, 4.0]
+
+    param {int} capacity - Maximum number of values kept
+    param {str} typecode - `array` typecode of the values, 'd' (double) by default
+    """
+
+    def __init__(self, capacity: int, typecode: str = 'd') -> None:
+        if capacity <= 0:
+            raise ValueError('capacity should be a positive integer')
+        self.capacity = capacity
+        self.typecode = typecode
+        self.data = array(typecode, [0]) * (2 * capacity)
+        self.view = memoryview(self.data)
+        self.head = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(self, value) -> None:
+        head = self.head
+        self.data[head] = value
+        self.data[head + self.capacity] = value
+        head += 1
+        self.head = 0 if head == self.capacity else head
+        if self.size < self.capacity:
+            self.size += 1
+
+    def last(self, n: int = None) -> memoryview:
+        """Return a zero-copy view of the latest `n` values, oldest first. All values if `n` is not given"""
+        if n is None or n > self.size:
+            n = self.size
+        end = self.head + self.capacity
+        return self.view[end - n:end]
+
+    def latest(self):
+        """Return the latest value"""
+        if not self.size:
+            raise IndexError('ring buffer is empty')
+        return self.data[self.head + self.capacity - 1]
+
+    @property
+    def nbytes(self) -> int:
+        return self.view.nbytes
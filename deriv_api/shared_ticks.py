@@ -0,0 +1,216 @@
+import multiprocessing
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Iterable, Optional, Tuple
+
+from rx.disposable import Disposable
+
+"""
+Multi-process tick fan-out over shared memory
+---------------------------------------------
+One process owns the DerivAPI tick subscriptions and publishes the ticks with a `SharedTickPublisher`.
+Worker processes attach a `SharedTickReader` and read the ticks without copying them, from read-only views.
+
+Every symbol has its own shared memory block: a tick counter followed by the epoch (int64) and quote (double)
+columns of a mirrored ring buffer (see `RingBuffer`), so the latest ticks are always contiguous.
+The publisher writes a tick, then increments the counter, then wakes the readers up through a shared
+`multiprocessing.Condition`.
+
+The views returned by `last(symbol, n)` are overwritten in place once `capacity - n` more ticks are published:
+read them right away, while the publisher is known to be behind (e.g. after `wait`), or use `copy` which
+copies the ticks and checks, like a seqlock, that the publisher did not overwrite them during the copy.
+
+example
+publisher = SharedTickPublisher(['R_50', 'R_100'])
+await publisher.track(api, 'R_50')
+worker = multiprocessing.Process(target=work, args=(publisher.reader_args(),))
+
+def work(reader_args):
+    reader = SharedTickReader(**reader_args)
+    counts = reader.counts()
+    while reader.wait(counts):
+        counts = reader.counts()
+        epochs, quotes = reader.copy('R_50', 10)
+"""
+
+COUNTER_BYTES = 8
+BYTES_PER_TICK = 2 * (8 + 8)
+
+
+def block_size(capacity: int) -> int:
+    return COUNTER_BYTES + capacity * BYTES_PER_TICK
+
+
+class SharedTickBuffer:
+    """Views of the shared memory block of one symbol"""
+
+    def __init__(self, shm: SharedMemory, capacity: int, readonly: bool) -> None:
+        self.shm = shm
+        self.capacity = capacity
+        buf = shm.buf.toreadonly() if readonly else shm.buf
+        self.buf = buf
+        self.counter = buf[:COUNTER_BYTES].cast('q')
+        columns = buf[COUNTER_BYTES:block_size(capacity)]
+        self.epochs = columns[:len(columns) // 2].cast('q')
+        self.quotes = columns[len(columns) // 2:].cast('d')
+
+    @property
+    def count(self) -> int:
+        """Number of ticks published since the start"""
+        return self.counter[0]
+
+    def append(self, epoch: int, quote: float) -> None:
+        count = self.counter[0]
+        head = count % self.capacity
+        self.epochs[head] = self.epochs[head + self.capacity] = epoch
+        self.quotes[head] = self.quotes[head + self.capacity] = quote
+        # the counter is written last, readers never see a partially written tick
+        self.counter[0] = count + 1
+
+    def last(self, n: int = None) -> Tuple[memoryview, memoryview]:
+        return self.last_at(self.counter[0], n)
+
+    def last_at(self, count: int, n: int = None) -> Tuple[memoryview, memoryview]:
+        # the oldest slot of a full buffer is the next one written, it is never returned
+        size = min(count, self.capacity - 1)
+        if n is None or n > size:
+            n = size
+        end = count % self.capacity + self.capacity
+        return self.epochs[end - n:end], self.quotes[end - n:end]
+
+    def copy(self, n: int = None) -> Tuple[array, array]:
+        while True:
+            count = self.counter[0]
+            epochs, quotes = self.last_at(count, n)
+            copies = array('q', epochs), array('d', quotes)
+            size = len(epochs)
+            epochs.release()
+            quotes.release()
+            # the tick being written when the counter was read again can overwrite the copied slots too,
+            # the slots of the copy are overwritten from the `capacity - n`th tick published after `count`
+            if self.counter[0] - count < self.capacity - size:
+                return copies
+
+    def release(self) -> None:
+        for view in (self.epochs, self.quotes, self.counter, self.buf):
+            view.release()
+        self.shm.close()
+
+
+class SharedTickPublisher:
+    """
+    Publishes ticks into shared memory ring buffers, see the module documentation
+
+    param {Iterable[str]} symbols - The symbols published
+    param {int} capacity - Number of ticks kept per symbol, the readers can read `capacity - 1` of them
+    """
+
+    def __init__(self, symbols: Iterable[str], capacity: int = 100000) -> None:
+        if capacity <= 1:
+            raise ValueError('capacity should be greater than 1')
+        self.capacity = capacity
+        self.condition = multiprocessing.Condition()
+        self.buffers: Dict[str, SharedTickBuffer] = {}
+        for symbol in symbols:
+            shm = SharedMemory(create=True, size=block_size(capacity))
+            shm.buf[:COUNTER_BYTES] = bytes(COUNTER_BYTES)
+            self.buffers[symbol] = SharedTickBuffer(shm, capacity, readonly=False)
+        self.subscriptions: Dict[str, Disposable] = {}
+
+    def reader_args(self) -> dict:
+        """Arguments of `SharedTickReader`, to pass to the worker processes"""
+        return {
+            'names': {symbol: buffer.shm.name for symbol, buffer in self.buffers.items()},
+            'capacity': self.capacity,
+            'condition': self.condition
+        }
+
+    def append(self, symbol: str, epoch: int, quote: float) -> None:
+        self.buffers[symbol].append(epoch, quote)
+        with self.condition:
+            self.condition.notify_all()
+
+    def on_tick(self, response: dict) -> None:
+        """Publish the tick of a `ticks` subscription response"""
+        tick = response['tick']
+        self.append(tick['symbol'], tick['epoch'], tick['quote'])
+
+    async def track(self, api, symbol: str) -> Disposable:
+        """Subscribe to the ticks of the symbol and publish them"""
+        if symbol not in self.buffers:
+            raise KeyError(f'{symbol} is not published')
+        if symbol not in self.subscriptions:
+            source = await api.subscribe({'ticks': symbol})
+            subscription = self.subscriptions[symbol] = source.subscribe(
+                self.on_tick, lambda error: self.on_error(api, symbol, error))
+            return subscription
+        return self.subscriptions[symbol]
+
+    def on_error(self, api, symbol: str, error: Exception) -> None:
+        """The ticks stream of the symbol failed, e.g. on an invalid symbol: stop tracking it and report the error"""
+        self.untrack(symbol)
+        api.sanity_errors.on_next(error)
+
+    def untrack(self, symbol: str) -> None:
+        """Stop publishing the ticks of the symbol, its buffer is kept for the readers"""
+        subscription = self.subscriptions.pop(symbol, None)
+        if subscription:
+            subscription.dispose()
+
+    def close(self) -> None:
+        """Stop publishing and free the shared memory, the readers should be closed first"""
+        for subscription in self.subscriptions.values():
+            subscription.dispose()
+        self.subscriptions = {}
+        for buffer in self.buffers.values():
+            buffer.release()
+            buffer.shm.unlink()
+        self.buffers = {}
+
+
+class SharedTickReader:
+    """
+    Read-only access to the ticks of a `SharedTickPublisher` from another process
+
+    The reader process should be started by the publisher process (with `multiprocessing`), so they share the
+    resource tracker that frees the shared memory if the publisher dies without closing it.
+
+    param {Dict[str, str]} names - Shared memory block name of every symbol
+    param {int} capacity - Capacity of the blocks
+    param {Condition} condition - Condition notified by the publisher on every tick
+    """
+
+    def __init__(self, names: Dict[str, str], capacity: int, condition) -> None:
+        self.condition = condition
+        self.buffers: Dict[str, SharedTickBuffer] = {}
+        for symbol, name in names.items():
+            shm = SharedMemory(name=name)
+            self.buffers[symbol] = SharedTickBuffer(shm, capacity, readonly=True)
+
+    def count(self, symbol: str) -> int:
+        return self.buffers[symbol].count
+
+    def counts(self) -> Dict[str, int]:
+        """Number of ticks published for every symbol"""
+        return {symbol: buffer.count for symbol, buffer in self.buffers.items()}
+
+    def last(self, symbol: str, n: int = None) -> Tuple[memoryview, memoryview]:
+        """
+        Return read-only views of the epochs and quotes of the latest `n` ticks of the symbol, oldest first.
+        They are overwritten once `capacity - n` more ticks are published, see the module documentation
+        """
+        return self.buffers[symbol].last(n)
+
+    def copy(self, symbol: str, n: int = None) -> Tuple[array, array]:
+        """Return copies of the epochs and quotes of the latest `n` ticks of the symbol, never torn by the publisher"""
+        return self.buffers[symbol].copy(n)
+
+    def wait(self, counts: Dict[str, int], timeout: Optional[float] = None) -> bool:
+        """Wait until a tick is published after `counts`, returns False on timeout"""
+        with self.condition:
+            return self.condition.wait_for(lambda: self.counts() != counts, timeout)
+
+    def close(self) -> None:
+        for buffer in self.buffers.values():
+            buffer.release()
+        self.buffers = {}
@@ -0,0 +1,125 @@
+import time
+from array import array
+from typing import Callable, Optional
+
+import rx
+from rx import Observable
+
+# inter-arrival histogram bucket `i` counts the intervals in [2 ** (i - 1), 2 ** i) milliseconds,
+# bucket 0 the ones under 1ms, the last bucket everything above
+HISTOGRAM_BUCKETS = 18
+
+# the histograms cover between one and two windows of that many seconds
+HISTOGRAM_WINDOW = 60.0
+
+# fields holding the server time of a stream message, in order of preference
+epoch_fields = ['epoch', 'spot_time', 'current_spot_time']
+
+
+class StreamStats:
+    """
+    Statistics of one subscription stream, updated in O(1) per message with a few clock reads
+
+    property {str} msg_type - Subscription type of the stream
+    property {int} messages - Number of messages received
+    property {float} last_received_at - Local time (epoch seconds) of the last message
+    property {float} server_lag - Local receive time minus server `epoch` of the last message, when it has one
+    property {float} dispatch_seconds - Total time spent by the consumers handling the messages
+    """
+
+    __slots__ = ('msg_type', 'messages', 'first_received_at', 'last_received_at', 'last_arrival', 'server_lag',
+                 'max_server_lag', 'dispatch_seconds', 'max_dispatch_seconds', 'histogram', 'previous_histogram',
+                 'window_started_at')
+
+    def __init__(self, msg_type: str) -> None:
+        self.msg_type = msg_type
+        self.messages = 0
+        self.first_received_at: Optional[float] = None
+        self.last_received_at: Optional[float] = None
+        self.last_arrival: Optional[float] = None
+        self.server_lag: Optional[float] = None
+        self.max_server_lag = 0.0
+        self.dispatch_seconds = 0.0
+        self.max_dispatch_seconds = 0.0
+        self.histogram = array('q', [0]) * HISTOGRAM_BUCKETS
+        self.previous_histogram = array('q', [0]) * HISTOGRAM_BUCKETS
+        self.window_started_at = time.perf_counter()
+
+    def on_message(self, response: dict) -> float:
+        """Record a message arrival, returns the time to pass to `on_dispatched`"""
+        arrival = time.perf_counter()
+        received_at = time.time()
+        self.messages += 1
+        if self.first_received_at is None:
+            self.first_received_at = received_at
+        self.last_received_at = received_at
+
+        if self.last_arrival is not None:
+            if arrival - self.window_started_at >= HISTOGRAM_WINDOW:
+                self.rotate(arrival)
+            bucket = int((arrival - self.last_arrival) * 1000).bit_length()
+            self.histogram[bucket if bucket < HISTOGRAM_BUCKETS else HISTOGRAM_BUCKETS - 1] += 1
+        self.last_arrival = arrival
+
+        body = response.get(response.get('msg_type'))
+        if isinstance(body, dict):
+            for field in epoch_fields:
+                epoch = body.get(field)
+                if epoch:
+                    lag = received_at - float(epoch)
+                    self.server_lag = lag
+                    if lag > self.max_server_lag:
+                        self.max_server_lag = lag
+                    break
+        return arrival
+
+    def rotate(self, now: float) -> None:
+        """Start a new histogram window, the previous one is dropped too when it ended a window ago or more"""
+        elapsed = now - self.window_started_at
+        if elapsed < HISTOGRAM_WINDOW:
+            return
+        self.previous_histogram = self.histogram if elapsed < 2 * HISTOGRAM_WINDOW else \
+            array('q', [0]) * HISTOGRAM_BUCKETS
+        self.histogram = array('q', [0]) * HISTOGRAM_BUCKETS
+        self.window_started_at = now
+
+    def on_dispatched(self, arrival: float) -> None:
+        """Record the end of the delivery of a message to the consumers"""
+        duration = time.perf_counter() - arrival
+        self.dispatch_seconds += duration
+        if duration > self.max_dispatch_seconds:
+            self.max_dispatch_seconds = duration
+
+    def snapshot(self) -> dict:
+        # the windows age while the stream is silent
+        self.rotate(time.perf_counter())
+        now = time.time()
+        elapsed = now - self.first_received_at if self.first_received_at else 0.0
+        return {
+            'msg_type': self.msg_type,
+            'messages': self.messages,
+            'messages_per_second': self.messages / elapsed if elapsed else 0.0,
+            'last_received_at': self.last_received_at,
+            'seconds_since_last_message': now - self.last_received_at if self.last_received_at else None,
+            'server_lag': self.server_lag,
+            'max_server_lag': self.max_server_lag,
+            'mean_dispatch_seconds': self.dispatch_seconds / self.messages if self.messages else 0.0,
+            'max_dispatch_seconds': self.max_dispatch_seconds,
+            'inter_arrival_histogram': [a + b for a, b in zip(self.previous_histogram, self.histogram)]
+        }
+
+
+def instrument(stats: StreamStats) -> Callable[[Observable], Observable]:
+    """An operator recording every message of the source, and how long its consumers took to handle it"""
+    def _instrument(source: Observable) -> Observable:
+        def subscribe(observer, scheduler=None):
+            def on_next(response):
+                arrival = stats.on_message(response)
+                observer.on_next(response)
+                stats.on_dispatched(arrival)
+
+            return source.subscribe(on_next, observer.on_error, observer.on_completed, scheduler=scheduler)
+
+        return rx.create(subscribe)
+
+    return _instrument
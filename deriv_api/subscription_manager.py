@@ -1,29 +1,126 @@
 import asyncio
+import time
 
+from deriv_api.conflated_source import ConflatedSource
 from deriv_api.utils import dict_to_cache_key
 from deriv_api.errors import APIError
+from deriv_api.proposal_multiplexer import ProposalMultiplexer
+from deriv_api.stream_stats import StreamStats, instrument
 from rx import operators as op
 from rx.subject import Subject
 from rx import Observable
-from typing import Optional
+from typing import List, Optional
+
+# streams_list is the list of subscriptions msg_types available: the requests accepting `subscribe`,
+# generated by scripts/regen_py.py from the API schemas
+streams_list = [
+    'balance', 'buy', 'cashier_payments', 'p2p_advert_info', 'p2p_advertiser_create', 'p2p_advertiser_info',
+    'p2p_order_create', 'p2p_order_info', 'p2p_order_list', 'proposal', 'proposal_open_contract', 'ticks',
+    'ticks_history', 'transaction', 'website_status'
+]
+# streams missing from the schemas the list is generated from
+streams_list += ['proposal_array']
+
+# streams for which only the newest message matters, and can be conflated by `subscribe_conflated`
+conflatable_streams = ['proposal', 'proposal_open_contract']
+
+
+class Connection:
+    """
+    A connection used by the subscription manager, with the subscriptions and messages it carries
+
+    param {DerivAPI} api - The api owning the connection
+    """
+
+    def __init__(self, api) -> None:
+        self.api = api
+        self.subscriptions = 0
+        self.messages = 0
+        self.since = time.monotonic()
+
+    def on_message(self, _) -> None:
+        self.messages += 1
+
+    def stats(self) -> dict:
+        elapsed = time.monotonic() - self.since
+        return {
+            'subscriptions': self.subscriptions,
+            'messages': self.messages,
+            'messages_per_second': self.messages / elapsed if elapsed else 0.0
+        }
 
-# streams_list is the list of subscriptions msg_types available.
-# Please add / remove based on current available streams in api.
-# Refer https: // developers.binary.com /
-# TODO NEXT auto generate this one
-streams_list = ['balance', 'candles', 'p2p_advertiser', 'p2p_order', 'proposal',
-                'proposal_array', 'proposal_open_contract', 'ticks', 'ticks_history', 'transaction',
-                'website_status', 'buy']
 
 class SubscriptionManager:
-    def __init__(self, api):
+    """
+    Manages the subscription streams of an api
+
+    Subscriptions are sent on the connection of `api` by default. When the server limit of subscriptions per
+    connection is reached, more connections can be added with `add_connection`: new subscriptions are then
+    allocated to the least loaded connection, and `forget` is sent on the connection of the subscription.
+
+    example
+    api.subscription_manager.max_subscriptions = 100
+    api.subscription_manager.add_connection(DerivAPI(app_id=1234))
+
+    param {DerivAPI} api - The api used to send the requests
+    param {int} max_subscriptions - Maximum number of subscriptions per connection, no limit by default
+    param {bool} stats_enabled - Record the statistics of every stream, see `stats`
+    """
+
+    def __init__(self, api, max_subscriptions: int = None, stats_enabled: bool = True):
         self.api = api
+        self.max_subscriptions = max_subscriptions
+        self.stats_enabled = stats_enabled
+        self.stream_stats: dict = {}
+        self.connections: List[Connection] = [Connection(api)]
+        self.key_to_connection: dict = {}
         self.sources: dict = {}
         self.orig_sources: dict = {}
         self.subs_id_to_key: dict = {}
         self.key_to_subs_id: dict = {}
         self.buy_key_to_contract_id: dict = {}
         self.subs_per_msg_type: dict = {}
+        self.proposal_multiplexer: Optional[ProposalMultiplexer] = None
+
+    def enable_proposal_multiplexing(self, delay: float = 0.0) -> ProposalMultiplexer:
+        """
+        Merge compatible `proposal` subscriptions into `proposal_array` subscriptions from now on,
+        see `ProposalMultiplexer`. Its `stats()` compare the streams used with separate subscriptions.
+        """
+        self.proposal_multiplexer = ProposalMultiplexer(self, delay)
+        return self.proposal_multiplexer
+
+    def add_connection(self, api) -> None:
+        """Add the connection of an api to the ones the subscriptions are spread across"""
+        self.connections.append(Connection(api))
+
+    def get_connection(self) -> Connection:
+        """Return the least loaded connection"""
+        connection = min(self.connections, key=lambda c: c.subscriptions)
+        if self.max_subscriptions is not None and connection.subscriptions >= self.max_subscriptions:
+            raise APIError('All connections reached the subscription limit')
+        return connection
+
+    def stats(self) -> dict:
+        """
+        Return the statistics of every live stream, keyed by subscription key: msg_type, message count and rate,
+        last message time, server lag (local receive time - server epoch), time spent by the consumers handling
+        the messages, and a histogram of the inter-arrival times in log2 milliseconds buckets
+        """
+        return {key: stats.snapshot() for key, stats in self.stream_stats.items()}
+
+    def stats_by_msg_type(self) -> dict:
+        """Return the number of live streams and messages received per msg_type"""
+        by_msg_type = {}
+        for stats in self.stream_stats.values():
+            totals = by_msg_type.setdefault(stats.msg_type, {'streams': 0, 'messages': 0})
+            totals['streams'] += 1
+            totals['messages'] += stats.messages
+        return by_msg_type
+
+    def connection_stats(self) -> List[dict]:
+        """Return the subscriptions count and message rate of every connection, in the order they were added"""
+        return [connection.stats() for connection in self.connections]
 
     async def subscribe(self, request: dict) -> Subject:
         """
@@ -41,13 +138,36 @@ class SubscriptionManager:
         if not get_msg_type(request):
             raise APIError('Subscription type is not found in deriv-api')
 
-        if self.source_exists(request):
-            return self.get_source(request)
+        source = self.get_source(request)
+        if source:
+            return source
+
+        if self.proposal_multiplexer and get_msg_type(request) == 'proposal' \
+                and self.proposal_multiplexer.can_merge(request):
+            return await self.proposal_multiplexer.subscribe(request)
 
         new_request: dict = request.copy()
         new_request['subscribe'] = 1
         return await self.create_new_source(new_request)
 
+    async def subscribe_conflated(self, request: dict) -> ConflatedSource:
+        """
+        Subscribe to a given request, keeping only the newest response until the consumer reads it.
+        Only streams in `conflatable_streams` are supported.
+
+        example
+        proposal = await api.subscribe_conflated({ 'proposal': 1, ... });
+        response = await proposal.get() # the newest proposal, intermediate updates are skipped
+
+        param {Object} request - A request object acceptable by the API
+
+        returns {ConflatedSource} - A latest-value view of the stream
+        """
+        if get_msg_type(request) not in conflatable_streams:
+            raise APIError(f'Conflation is only supported for {", ".join(conflatable_streams)} streams')
+
+        return ConflatedSource(await self.subscribe(request))
+
     def get_source(self, request: dict) -> Optional[Subject]:
         key: str = dict_to_cache_key(request)
         if key in self.sources:
@@ -55,7 +175,7 @@ class SubscriptionManager:
 
         # if we have a buy subscription reuse that for poc
         for c in self.buy_key_to_contract_id.values():
-            if c['contract_id'] == request['contract_id']:
+            if c['contract_id'] == request.get('contract_id'):
                 return self.sources[c['buy_key']]
 
         return None
@@ -75,8 +195,16 @@ class SubscriptionManager:
                 self.api.sanity_errors.on_next(err)
             return
 
-        self.orig_sources[key]: Observable = self.api.send_and_get_source(request)
+        connection = self.get_connection()
+        connection.subscriptions += 1
+        self.key_to_connection[key] = connection
+        self.orig_sources[key]: Observable = connection.api.send_and_get_source(request)
+        operators = [op.do_action(connection.on_message)]
+        if self.stats_enabled:
+            self.stream_stats[key] = StreamStats(get_msg_type(request))
+            operators.append(instrument(self.stream_stats[key]))
         source: Observable = self.orig_sources[key].pipe(
+            *operators,
             op.finally_action(forget_old_source),
             op.share()
         )
@@ -99,18 +227,25 @@ class SubscriptionManager:
         return source
 
     async def forget(self, subs_id):
+        connection = self.key_to_connection.get(self.subs_id_to_key.get(subs_id), self.connections[0])
         self.complete_subs_by_ids(subs_id)
-        return await self.api.send({'forget': subs_id})
+        return await connection.api.send({'forget': subs_id})
 
     async def forget_all(self, *types):
         # To include subscriptions that were automatically unsubscribed
         # for example a proposal subscription is auto-unsubscribed after buy
 
+        if 'proposal' in types and self.proposal_multiplexer and 'proposal_array' not in types:
+            # the merged proposals are carried by proposal_array streams
+            types += ('proposal_array',)
         for t in types:
             for k in (self.subs_per_msg_type.get(t) or []):
                 self.complete_subs_by_key(k)
             self.subs_per_msg_type[t] = []
-        return await self.api.send({'forget_all': list(types)})
+        # every connection may hold subscriptions of these types
+        responses = await asyncio.gather(
+            *(connection.api.send({'forget_all': list(types)}) for connection in self.connections))
+        return responses[0]
 
     def complete_subs_by_ids(self, *subs_ids):
         for subs_id in subs_ids:
@@ -141,12 +276,20 @@ class SubscriptionManager:
         return lambda: self.complete_subs_by_key(key)
 
     def complete_subs_by_key(self, key):
-        if not key or not self.sources[key]:
+        if not key or not self.sources.get(key):
             return
 
+        if key not in self.orig_sources:
+            # a proposal merged into a proposal_array stream
+            return self.proposal_multiplexer.complete(key)
+
         # Delete the source
         del self.sources[key]
         orig_source: Subject = self.orig_sources.pop(key)
+        connection = self.key_to_connection.pop(key, None)
+        self.stream_stats.pop(key, None)
+        if connection:
+            connection.subscriptions -= 1
 
         try:
             # Delete the subs id if exist
@@ -0,0 +1,121 @@
+from bisect import bisect_left, bisect_right
+from typing import Dict, Tuple
+
+from rx.disposable import Disposable
+
+from deriv_api.ring_buffer import RingBuffer
+
+# int64 epochs and double quotes, each mirrored by the ring buffer
+BYTES_PER_TICK = 2 * (8 + 8)
+
+
+class TickBuffer:
+    """
+    Fixed capacity columnar storage of the ticks of one symbol: an epoch column and a quote column,
+    each one a `RingBuffer`. Queries return zero-copy `memoryview` windows of both columns.
+
+    param {int} capacity - Maximum number of ticks kept
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.epochs = RingBuffer(capacity, 'q')
+        self.quotes = RingBuffer(capacity, 'd')
+
+    def __len__(self) -> int:
+        return len(self.epochs)
+
+    def append(self, epoch: int, quote: float) -> None:
+        self.epochs.append(epoch)
+        self.quotes.append(quote)
+
+    def last(self, n: int = None) -> Tuple[memoryview, memoryview]:
+        """Return the epochs and quotes of the latest `n` ticks, oldest first"""
+        return self.epochs.last(n), self.quotes.last(n)
+
+    def between(self, start: int, end: int) -> Tuple[memoryview, memoryview]:
+        """Return the epochs and quotes of the ticks with `start <= epoch <= end`"""
+        epochs = self.epochs.last()
+        first = bisect_left(epochs, start)
+        last = bisect_right(epochs, end, first)
+        return epochs[first:last], self.quotes.last()[first:last]
+
+    @property
+    def nbytes(self) -> int:
+        return self.epochs.nbytes + self.quotes.nbytes
+
+
+class TickStore:
+    """
+    Per-symbol tick ring buffers fed by `ticks` subscriptions
+
+    Only `epoch` and `quote` are kept from every tick response, in array-backed ring buffers, so the memory
+    used is fixed by the capacity: `BYTES_PER_TICK` (32) bytes per tick, 32 MB per 1M ticks.
+    Run `benchmarks/tick_store.py` for a comparison with a list of tick dicts.
+
+    example
+    store = TickStore(capacity=10000)
+    await store.track(api, 'R_100')
+    epochs, quotes = store.last('R_100', 100)
+    average = sum(quotes) / len(quotes)
+
+    param {int} capacity - Maximum number of ticks kept per symbol
+    """
+
+    def __init__(self, capacity: int = 100000) -> None:
+        self.capacity = capacity
+        self.buffers: Dict[str, TickBuffer] = {}
+        self.subscriptions: Dict[str, Disposable] = {}
+
+    def buffer(self, symbol: str) -> TickBuffer:
+        """Return the buffer of the symbol, creating it if needed"""
+        buffer = self.buffers.get(symbol)
+        if buffer is None:
+            buffer = self.buffers[symbol] = TickBuffer(self.capacity)
+        return buffer
+
+    def append(self, symbol: str, epoch: int, quote: float) -> None:
+        self.buffer(symbol).append(epoch, quote)
+
+    def on_tick(self, response: dict) -> None:
+        """Append the tick of a `ticks` subscription response"""
+        tick = response['tick']
+        self.buffer(tick['symbol']).append(tick['epoch'], tick['quote'])
+
+    async def track(self, api, symbol: str) -> Disposable:
+        """
+        Subscribe to the ticks of the symbol and append every tick to its buffer
+
+        param {DerivAPI} api - The api used to subscribe
+        param {String} symbol - The symbol to track
+
+        returns {Disposable} - Dispose it, or call `untrack`, to stop tracking the symbol
+        """
+        if symbol in self.subscriptions:
+            return self.subscriptions[symbol]
+
+        self.buffer(symbol)
+        source = await api.subscribe({'ticks': symbol})
+        self.subscriptions[symbol] = source.subscribe(self.on_tick, lambda error: self.on_error(api, symbol, error))
+        return self.subscriptions[symbol]
+
+    def on_error(self, api, symbol: str, error: Exception) -> None:
+        """The ticks stream of the symbol failed, e.g. on an invalid symbol: stop tracking it and report the error"""
+        self.untrack(symbol)
+        api.sanity_errors.on_next(error)
+
+    def untrack(self, symbol: str) -> None:
+        subscription = self.subscriptions.pop(symbol, None)
+        if subscription:
+            subscription.dispose()
+
+    def last(self, symbol: str, n: int = None) -> Tuple[memoryview, memoryview]:
+        """Return the epochs and quotes of the latest `n` ticks of the symbol, oldest first"""
+        return self.buffers[symbol].last(n)
+
+    def between(self, symbol: str, start: int, end: int) -> Tuple[memoryview, memoryview]:
+        """Return the epochs and quotes of the ticks of the symbol with `start <= epoch <= end`"""
+        return self.buffers[symbol].between(start, end)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(buffer.nbytes for buffer in self.buffers.values())
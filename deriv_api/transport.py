@@ -0,0 +1,133 @@
+"""
+Transports
+----------
+The connection DerivAPI sends its requests and receives its responses through.
+`WebsocketTransport` connects to the API, `LoopbackTransport` is an in-process pair without sockets nor framing,
+for backtests, simulations and benchmarks of the client alone:
+
+transport = LoopbackTransport()
+api = DerivAPI(transport=transport)
+async for message in transport.peer:      # the requests of api
+    await transport.peer.send(response)   # received by api
+
+The frames are handed over as they are, without copying them: a `dict` sent by the peer reaches DerivAPI
+without being serialized and parsed, and must not be changed afterwards.
+`MockServer.loopback` of `benchmarks/mock_server.py` serves a loopback transport like a websocket connection.
+"""
+import abc
+import asyncio
+from typing import Optional, Union
+
+import websockets
+from websockets.exceptions import ConnectionClosedOK
+
+from deriv_api.errors import APIError
+
+Frame = Union[str, dict]
+
+# queued to wake up the readers of a closed side
+CLOSED = object()
+
+
+class Transport(abc.ABC):
+    """Base class of the transports, see the module documentation"""
+
+    @abc.abstractmethod
+    async def connect(self) -> None:
+        pass
+
+    @abc.abstractmethod
+    async def send(self, message: str) -> None:
+        pass
+
+    @abc.abstractmethod
+    async def recv(self) -> Frame:
+        """The next frame, raises `ConnectionClosed` once the transport is closed"""
+
+    @abc.abstractmethod
+    async def close(self) -> None:
+        pass
+
+
+class WebsocketTransport(Transport):
+    """
+    param {str} url - The websocket URL of the API
+    param {dict} options - Options of `websockets.connect`
+    """
+
+    def __init__(self, url: str, **options) -> None:
+        self.url = url
+        self.options = options
+        self.websocket: Optional[websockets.WebSocketClientProtocol] = None
+
+    async def connect(self) -> None:
+        self.websocket = await websockets.connect(self.url, **self.options)
+
+    async def send(self, message: str) -> None:
+        await self.connection().send(message)
+
+    async def recv(self) -> str:
+        return await self.connection().recv()
+
+    async def close(self) -> None:
+        if self.websocket:
+            await self.websocket.close()
+
+    def connection(self) -> websockets.WebSocketClientProtocol:
+        if not self.websocket:
+            raise APIError('Websocket transport is not connected, call connect first')
+        return self.websocket
+
+
+class LoopbackSide:
+    """One side of a loopback transport, receiving the frames sent by the other side"""
+
+    def __init__(self) -> None:
+        self.frames: asyncio.Queue = asyncio.Queue()
+        self.other: Optional['LoopbackSide'] = None
+        self.closed = False
+
+    async def send(self, frame: Frame) -> None:
+        if self.closed:
+            raise ConnectionClosedOK(1000, 'Loopback closed')
+        self.other.frames.put_nowait(frame)
+
+    async def recv(self) -> Frame:
+        if self.closed and self.frames.empty():
+            raise ConnectionClosedOK(1000, 'Loopback closed')
+        frame = await self.frames.get()
+        if frame is CLOSED:
+            raise ConnectionClosedOK(1000, 'Loopback closed')
+        return frame
+
+    async def close(self, code: int = 1000, reason: str = '') -> None:
+        for side in (self, self.other):
+            if not side.closed:
+                side.closed = True
+                side.frames.put_nowait(CLOSED)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Frame:
+        try:
+            return await self.recv()
+        except ConnectionClosedOK:
+            raise StopAsyncIteration
+
+
+class LoopbackTransport(LoopbackSide, Transport):
+    """
+    An in-process transport, `peer` is the other side, acting as the server
+
+    property {LoopbackSide} peer - Receives the messages sent by the transport, and sends it its frames
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.peer = LoopbackSide()
+        self.other, self.peer.other = self.peer, self
+
+    async def connect(self) -> None:
+        if self.closed:
+            raise ConnectionClosedOK(1000, 'Loopback closed')
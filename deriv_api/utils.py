@@ -12,6 +12,10 @@ is_valid_url(url)
 """
 
 
+# keys left out of the cache keys
+uncached_keys = ('req_id', 'passthrough', 'subscribe')
+
+
 def dict_to_cache_key(obj: dict) -> bytes:
     """convert the dictionary object to Pickled representation of object as bytes
 
@@ -20,11 +24,11 @@ def dict_to_cache_key(obj: dict) -> bytes:
     rtype: bytes
     """
 
-    cloned_obj: dict = obj.copy()
-    for key in ['req_id', 'passthrough', 'subscribe']:
-        cloned_obj.pop(key, None)
+    # only copied when there is something to leave out
+    if 'req_id' in obj or 'passthrough' in obj or 'subscribe' in obj:
+        obj = {key: value for key, value in obj.items() if key not in uncached_keys}
 
-    return pickle.dumps(cloned_obj)
+    return pickle.dumps(obj)
 
 
 def is_valid_url(url: str) -> bool:
@@ -36,3 +40,4 @@ def is_valid_url(url: str) -> bool:
         r'(?::\d+)?'  # optional port
         r'(?:/?|[/?]\S+)$', re.IGNORECASE)
     return re.match(regex, url) is not None
+
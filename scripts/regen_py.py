@@ -0,0 +1,289 @@
+# run it like PYTHONPATH=. python3 scripts/regen_py.py path/to/deriv-api-docs/config/v3
+# or like PYTHONPATH=. python3 scripts/regen_py.py --from-tables, to render the current tables again after changing
+# this script
+"""
+Regenerates the generated parts of the call layer from the JSON schemas of the Deriv API
+
+The schema directory has one directory per method, holding the `send.json` schema of its request. From them
+the script renders, in place:
+- `method_docs`, `method_configs` and `required_params` in deriv_api/deriv_api_calls.py
+- the whole of deriv_api/deriv_api_calls.pyi
+- `streams_list` in deriv_api/subscription_manager.py: the methods whose request accepts `subscribe`
+The code around the tables is maintained by hand.
+"""
+import inspect
+import json
+import os
+import sys
+from typing import Dict, List, Tuple
+
+package_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'deriv_api')
+
+# configs shared by many params, by their repr, see the shared configs of deriv_api_calls.py
+shared_configs = {
+    '{}': 'ANY',
+    "{'type': 'numeric'}": 'NUMERIC',
+    "{'type': 'string'}": 'STRING',
+    "{'required': 1}": 'REQUIRED',
+    "{'required': 1, 'type': 'numeric'}": 'REQUIRED_NUMERIC',
+    "{'required': 1, 'type': 'string'}": 'REQUIRED_STRING',
+}
+
+# schema type: (type of the config, type in the docs)
+schema_types = {
+    'integer': ('numeric', 'Number'),
+    'number': ('numeric', 'Number'),
+    'string': ('string', 'String'),
+    'boolean': ('boolean', 'Boolean'),
+}
+
+LINE_LENGTH = 120
+
+
+def load_schemas(schema_dir: str) -> Dict[str, dict]:
+    """
+    Load the `send.json` schemas of a schema directory
+
+    param {str} schema_dir - Directory with one directory per method
+
+    returns {Dict[str, dict]} - The schemas by method, sorted by method
+    """
+    schemas = {}
+    for method in sorted(os.listdir(schema_dir)):
+        path = os.path.join(schema_dir, method, 'send.json')
+        if os.path.isfile(path):
+            with open(path) as file:
+                schemas[method] = json.load(file)
+    return schemas
+
+
+def param_config(schema: dict, required: bool) -> dict:
+    """The config of a param, the params of the objects with properties are configured one by one"""
+    if schema.get('type') == 'object' and 'properties' in schema:
+        return params_config(schema)
+    config = {}
+    if required:
+        config['required'] = 1
+    schema_type = schema.get('type')
+    if isinstance(schema_type, str) and schema_type in schema_types:
+        config['type'] = schema_types[schema_type][0]
+    return config
+
+
+def params_config(schema: dict) -> dict:
+    required = schema.get('required', [])
+    return {param: param_config(param_schema, param in required)
+            for param, param_schema in sorted(schema['properties'].items())}
+
+
+def param_doc(param: str, schema: dict) -> str:
+    schema_type = schema.get('type')
+    doc_type = schema_types[schema_type][1] if isinstance(schema_type, str) and schema_type in schema_types else 'Any'
+    # objects with properties are documented by their properties, in the API docs
+    description = '' if schema_type == 'object' and 'properties' in schema else schema.get('description', '')
+    return f'    param args.{param} {{{doc_type}}}: {description}\n'
+
+
+def method_doc(schema: dict) -> str:
+    params = ''.join(param_doc(param, param_schema) for param, param_schema in sorted(schema['properties'].items()))
+    return '\n    param args {Dict}\n' + params + '    '
+
+
+def tables_from_schemas(schemas: Dict[str, dict]) -> Tuple[Dict[str, str], Dict[str, dict]]:
+    """The docs and the configs of the methods"""
+    return ({method: method_doc(schema) for method, schema in schemas.items()},
+            {method: params_config(schema) for method, schema in schemas.items()})
+
+
+def tables_from_module() -> Tuple[Dict[str, str], Dict[str, dict]]:
+    """The docs and the configs of deriv_api_calls.py as they are"""
+    from deriv_api.deriv_api_calls import method_configs, method_docs
+    return method_docs, method_configs
+
+
+def required_params(configs: Dict[str, dict]) -> Dict[str, Tuple[str, ...]]:
+    return {method: tuple(param for param, config in params.items() if config.get('required'))
+            for method, params in configs.items()}
+
+
+def stream_types(configs: Dict[str, dict]) -> List[str]:
+    """The methods whose request accepts `subscribe`"""
+    return [method for method, params in configs.items() if 'subscribe' in params]
+
+
+def pack(items: List[str], indent: int) -> List[str]:
+    """Lay out items on lines of `LINE_LENGTH` at most, several per line; multiline items get their own lines"""
+    pad = ' ' * indent
+    lines, line = [], ''
+    for item in items:
+        if '\n' in item:
+            if line:
+                lines.append(line.rstrip())
+                line = ''
+            lines.append(item + ',')
+            continue
+        candidate = line + item + ', '
+        if line and len(pad) + len(candidate.rstrip()) > LINE_LENGTH:
+            lines.append(line.rstrip())
+            line = item + ', '
+        else:
+            line = candidate
+    if line:
+        lines.append(line.rstrip())
+    return [pad + line for line in lines]
+
+
+def render_config(config: dict, indent: int, key: str) -> str:
+    """The config rendered after `key`, on one line when `key`, the config and a comma fit"""
+    items = [f'{param!r}: ' + (shared_configs.get(repr(param_config))
+                               or render_config(param_config, indent + 4, f'{param!r}: '))
+             for param, param_config in config.items()]
+    one_line = '{' + ', '.join(items) + '}'
+    if indent + len(key) + len(one_line) + 1 <= LINE_LENGTH and '\n' not in one_line:
+        return one_line
+    lines = pack(items, indent + 4)
+    lines[-1] = lines[-1].rstrip(',')
+    return '{\n' + '\n'.join(lines) + '\n' + ' ' * indent + '}'
+
+
+def render_tuple(values: Tuple[str, ...], indent: int, key: str) -> str:
+    """The tuple rendered after `key`, like the configs"""
+    one_line = '(' + ', '.join(repr(value) for value in values) + (',)' if len(values) == 1 else ')')
+    if indent + len(key) + len(one_line) + 1 <= LINE_LENGTH:
+        return one_line
+    lines = pack([repr(value) for value in values], indent + 4)
+    lines[-1] = lines[-1].rstrip(',')
+    return '(\n' + '\n'.join(lines) + '\n' + ' ' * indent + ')'
+
+
+def render_docs(docs: Dict[str, str]) -> str:
+    return 'method_docs = {\n' + ',\n'.join(f'    {method!r}: """{doc}"""' for method, doc in docs.items()) + '\n}\n'
+
+
+def render_configs(configs: Dict[str, dict]) -> str:
+    shared = ''.join(f'{name} = {config}\n' for config, name in shared_configs.items())
+    body = ',\n'.join(f'    {method!r}: ' + render_config(config, 4, f'{method!r}: ')
+                      for method, config in configs.items())
+    required = ',\n'.join(f'    {method!r}: ' + render_tuple(params, 4, f'{method!r}: ')
+                           for method, params in required_params(configs).items())
+    return ('# configs shared by many params, treat all the configs as read-only\n' + shared + '\n'
+            'method_configs = {\n' + body + '\n}\n\n'
+            '# required params of each method, in the order of its config\n'
+            'required_params = {\n' + required + '\n}\n')
+
+
+def render_streams(streams: List[str]) -> str:
+    items = [repr(stream) for stream in streams]
+    return 'streams_list = [\n' + '\n'.join(pack(items, 4))[:-1] + '\n]\n'
+
+
+def render_stub(docs: Dict[str, str]) -> str:
+    methods = []
+    for method, doc in docs.items():
+        body = '\n'.join('        ' + line if line else '' for line in inspect.cleandoc(doc).split('\n'))
+        methods.append(f'    async def {method}(self, args: Optional[dict] = None, trusted: Optional[bool] = None)'
+                       f' -> dict:\n        """\n{body}\n        """\n        ...\n')
+    return STUB_HEAD + '\n'.join(methods) + STUB_TAIL
+
+
+STUB_HEAD = '''# This file was generated by scripts/regen_py.py, do not edit
+# declares the API methods generated on first access by deriv_api_calls.py
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+class LazyMethods(type): ...
+
+class DerivAPICalls(metaclass=LazyMethods):
+    trusted: bool
+    async def process_request(self, all_args: dict) -> Any: ...
+
+'''
+
+STUB_TAIL = '''
+def make_method(method: str) -> Callable[..., Any]: ...
+def install_method(method: str) -> Callable[..., Any]: ...
+
+method_docs: Dict[str, str]
+
+ANY: dict
+NUMERIC: dict
+STRING: dict
+REQUIRED: dict
+REQUIRED_NUMERIC: dict
+REQUIRED_STRING: dict
+
+method_configs: Dict[str, dict]
+
+required_params: Dict[str, Tuple[str, ...]]
+
+def parse_args(all_args: dict) -> Optional[dict]: ...
+
+type_checkers: Dict[str, Callable[[Any], bool]]
+
+def validate_args(config: dict, args: Any) -> str: ...
+
+NO_COERCION: int
+TO_STRING: int
+TO_NUMBER: int
+
+def compile_validator(method: str, config: dict, needs_method_arg: Any = ...,
+                      required: Optional[Tuple[str, ...]] = ...) -> Callable[[Any], dict]: ...
+
+validators: Dict[str, Callable[[Any], dict]]
+
+def get_validator(method: str) -> Callable[[Any], dict]: ...
+'''
+
+
+def replace_between(source: str, start: str, end: str, text: str) -> str:
+    """Replace the text from `start`, included, up to `end`, excluded"""
+    begin = source.index(start)
+    finish = source.index(end, begin)
+    return source[:begin] + text + source[finish:]
+
+
+def render_files(docs: Dict[str, str], configs: Dict[str, dict], directory: str = package_dir) -> Dict[str, str]:
+    """
+    Render the generated files from the tables
+
+    param {Dict[str, str]} docs - Docs by method
+    param {Dict[str, dict]} configs - Configs by method
+    param {str} directory - The package directory holding the current files
+
+    returns {Dict[str, str]} - The new content of the files, by path
+    """
+    calls_path = os.path.join(directory, 'deriv_api_calls.py')
+    manager_path = os.path.join(directory, 'subscription_manager.py')
+    with open(calls_path) as file:
+        calls = file.read()
+    with open(manager_path) as file:
+        manager = file.read()
+
+    calls = replace_between(calls, 'method_docs = {\n', '\n\n# ==========================\n# ----- Method configs',
+                            render_docs(docs))
+    calls = replace_between(calls, '# configs shared by many params', '\n\ndef parse_args(', render_configs(configs))
+    manager = replace_between(manager, 'streams_list = [', '# streams missing from the schemas',
+                              render_streams(stream_types(configs)))
+    return {
+        calls_path: calls,
+        os.path.join(directory, 'deriv_api_calls.pyi'): render_stub(docs),
+        manager_path: manager,
+    }
+
+
+def main(argv: List[str]) -> int:
+    if len(argv) != 1:
+        print(__doc__)
+        print(f'usage: {sys.argv[0]} <schema directory> | --from-tables')
+        return 1
+    docs, configs = tables_from_module() if argv[0] == '--from-tables' else tables_from_schemas(
+        load_schemas(argv[0]))
+    for path, content in render_files(docs, configs).items():
+        with open(path, 'w') as file:
+            file.write(content)
+        print(f'generated {path}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -3,6 +3,7 @@ from setuptools import find_packages, setup
 setup(
     name='deriv_api',
     packages=find_packages(include=['deriv_api']),
+    package_data={'deriv_api': ['*.pyi']},
     version='0.1.0',
     description='Deriv API',
     author='deriv.com',
@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+
+from deriv_api import backfill
+from deriv_api.backfill import backfill_ticks
+
+
+class API:
+    """ticks every 2 seconds, returns the latest `count` ticks of the range like the server does"""
+    def __init__(self):
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send(self, request, cache=True):
+        assert cache is False, "backfill responses are not cached"
+        self.requests.append(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        start = request['start'] + request['start'] % 2
+        # include the tick at the page end on both sides of a boundary
+        times = list(range(start, int(request['end']) + 1, 2))[-request['count']:]
+        return {'msg_type': 'history', 'history': {'times': times, 'prices': [t / 10 for t in times]}}
+
+
+@pytest.mark.asyncio
+async def test_backfill_ticks(mocker):
+    mocker.patch.object(backfill, 'MAX_TICKS_PER_PAGE', 10)
+    api = API()
+    with pytest.raises(ValueError, match='end should not be before start'):
+        await backfill_ticks(api, 'R_50', 100, 10)
+    history = await backfill_ticks(api, 'R_50', 1000, 1200, page_seconds=30, concurrency=2)
+    assert list(history.epochs) == list(range(1000, 1201, 2)), "contiguous ticks, without duplicates"
+    assert list(history.quotes) == [t / 10 for t in range(1000, 1201, 2)]
+    assert api.max_in_flight == 2
+    assert history.pages == len(api.requests)
+    assert history.pages > 7, "full pages are fetched again"
+    assert api.requests[0] == {'ticks_history': 'R_50', 'start': 1000, 'end': '1030', 'count': 10,
+                               'style': 'ticks'}
+    assert history.ticks_per_second > 0
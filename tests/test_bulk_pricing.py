@@ -0,0 +1,58 @@
+import asyncio
+import math
+
+import pytest
+
+from deriv_api.bulk_pricing import build_proposal_grid, price_proposals
+from deriv_api.errors import ResponseError
+
+BASE = {'amount': 10, 'basis': 'stake', 'currency': 'USD', 'symbol': 'R_100', 'duration_unit': 't'}
+
+
+def test_build_proposal_grid():
+    requests = build_proposal_grid(BASE, {'contract_type': ['CALL', 'PUT'], 'duration': ['5', 10]})
+    assert requests == [
+        {**BASE, 'proposal': 1, 'contract_type': 'CALL', 'duration': 5},
+        {**BASE, 'proposal': 1, 'contract_type': 'CALL', 'duration': 10},
+        {**BASE, 'proposal': 1, 'contract_type': 'PUT', 'duration': 5},
+        {**BASE, 'proposal': 1, 'contract_type': 'PUT', 'duration': 10},
+    ], "every combination, with parsed values"
+    with pytest.raises(ValueError, match='Required parameters missing: contract_type'):
+        build_proposal_grid(BASE)
+    with pytest.raises(ValueError, match='could not convert'):
+        build_proposal_grid(BASE, {'contract_type': ['CALL'], 'duration': [5, 'five']})
+
+
+@pytest.mark.asyncio
+async def test_price_proposals():
+    class API:
+        def __init__(self):
+            self.requests = []
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        async def send(self, request, cache=True):
+            assert cache is False, "proposals are never cached"
+            self.requests.append(request)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            if request['duration'] == 7:
+                raise ResponseError({'echo_req': request, 'msg_type': 'proposal',
+                                     'error': {'code': 'ContractBuyValidationError', 'message': 'invalid duration'}})
+            return {'msg_type': 'proposal', 'proposal': {'ask_price': 10, 'payout': request['duration'] + 10,
+                                                         'spot': '1000.5', 'id': f"id{request['duration']}"}}
+
+    api = API()
+    results = await price_proposals(api, {**BASE, 'contract_type': 'CALL'}, {'duration': range(5, 10)},
+                                    concurrency=2)
+    assert len(results) == 5
+    assert api.max_in_flight == 2
+    assert list(results.payouts[:2]) == [15.0, 16.0]
+    assert results.ids[0] == 'id5'
+    assert results.spots[0] == 1000.5
+    assert math.isnan(results.ask_prices[2]), "failed row has no price"
+    assert str(results.errors[2]) == 'ResponseError: invalid duration'
+    assert results.failed == 1
+    assert 'req_id' not in results.requests[0], "requests of the results are not changed by send"
@@ -1,6 +1,7 @@
 from deriv_api.cache import Cache
 from deriv_api.errors import ConstructionError
 from deriv_api.in_memory import InMemory
+from deriv_api.prepared_request import PreparedRequest
 import pytest
 
 class Api:
@@ -9,6 +10,9 @@ class Api:
     async def send(self, request):
         # seq will change every time send is called
         self.seq = self.seq + 1
+        # the request is passed on prepared, not prepared again
+        assert isinstance(request, PreparedRequest)
+        request = request.args
         return {'request': request, 'seq': self.seq, 'msg_type': request['msg_type']}
 
 @pytest.mark.asyncio
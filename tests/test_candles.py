@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+from rx.subject import Subject
+
+from benchmarks.mock_server import MockServer
+from deriv_api.candles import CandleSeries, CandleAggregator
+from deriv_api.deriv_api import DerivAPI
+from deriv_api.errors import ResponseError
+
+
+def test_candle_series():
+    with pytest.raises(ValueError, match='granularity should be a positive integer'):
+        CandleSeries(0)
+    series = CandleSeries(60, capacity=2)
+    assert series.current() is None
+    assert series.add_tick(120, 10.0) is None
+    series.add_tick(130, 12.0)
+    series.add_tick(150, 9.0)
+    series.add_tick(179, 11.0)
+    assert series.current() == {'epoch': 120, 'granularity': 60, 'open': 10.0, 'high': 12.0, 'low': 9.0,
+                                'close': 11.0}
+    closed = series.add_tick(185, 11.5)
+    assert closed == {'epoch': 120, 'granularity': 60, 'open': 10.0, 'high': 12.0, 'low': 9.0, 'close': 11.0}
+    assert series.add_tick(170, 100.0) is None, "late tick is ignored"
+    assert series.current()['close'] == 11.5
+    series.add_tick(305, 13.0)  # no tick between 240 and 300
+    epochs, opens, highs, lows, closes = series.last()
+    assert epochs.tolist() == [120, 180]
+    assert closes.tolist() == [11.0, 11.5]
+    assert len(series) == 2
+
+
+@pytest.mark.asyncio
+async def test_candle_aggregator():
+    class API:
+        def __init__(self):
+            self.requests = []
+            self.source = Subject()
+
+        async def ticks_history(self, request):
+            self.requests.append(request)
+            # ticks received while the history is requested, the first one is also in the history
+            for epoch, quote in ((130, 0.5), (140, 0.7)):
+                self.source.on_next({'msg_type': 'tick', 'tick': {'symbol': 'R_50', 'epoch': epoch, 'quote': quote}})
+            return {'msg_type': 'history', 'history': {'times': [60, 70, 130], 'prices': ['1.5', '2.5', '0.5']}}
+
+        async def subscribe(self, request):
+            self.requests.append(request)
+            return self.source
+
+    api = API()
+    aggregator = CandleAggregator(granularities=[120, 60, 60])
+    assert aggregator.granularities == [60, 120]
+    closed = []
+    aggregator.closed.subscribe(closed.append)
+    await aggregator.track(api, 'R_50')
+    assert api.requests == [{'ticks': 'R_50'},
+                            {'ticks_history': 'R_50', 'end': 'latest', 'count': 5000, 'style': 'ticks'}]
+    assert closed[0] == {'epoch': 60, 'granularity': 60, 'open': 1.5, 'high': 2.5, 'low': 1.5, 'close': 2.5,
+                         'symbol': 'R_50'}
+    assert aggregator.series('R_50', 60).current()['close'] == 0.7, "the ticks received during the backfill are added"
+    api.source.on_next({'msg_type': 'tick', 'tick': {'symbol': 'R_50', 'epoch': 130, 'quote': 9.0}})
+    assert aggregator.series('R_50', 60).current()['close'] == 0.7, "tick already seeded is skipped"
+    api.source.on_next({'msg_type': 'tick', 'tick': {'symbol': 'R_50', 'epoch': 250, 'quote': 3.0}})
+    assert [(c['granularity'], c['epoch']) for c in closed] == [(60, 60), (120, 0), (60, 120), (120, 120)]
+    assert aggregator.series('R_50', 120).last()[3].tolist() == [1.5, 0.5]
+    assert aggregator.server_subscriptions == 1
+    assert aggregator.server_side_subscriptions == 2
+    aggregator.untrack('R_50')
+    assert aggregator.server_subscriptions == 0
+
+
+@pytest.mark.asyncio
+async def test_track_error():
+    api = DerivAPI(transport=MockServer(symbols=1).loopback())
+    errors = []
+    api.sanity_errors.subscribe(errors.append)
+    aggregator = CandleAggregator()
+    await aggregator.track(api, 'BAD', count=0)
+    assert (await asyncio.wait_for(api.ping(), 1))['ping'] == 'pong', "the error of the stream does not stop the api"
+    assert aggregator.server_subscriptions == 0, "the symbol is untracked"
+    assert isinstance(errors[0], ResponseError) and errors[0].code == 'InvalidSymbol'
+    await api.clear()
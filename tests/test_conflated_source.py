@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+from rx.subject import Subject
+
+from deriv_api.conflated_source import ConflatedSource
+from deriv_api.errors import APIError
+
+
+@pytest.mark.asyncio
+async def test_conflated_source():
+    source = Subject()
+    conflated = ConflatedSource(source)
+    for i in range(5):
+        source.on_next({'msg_type': 'proposal', 'seq': i})
+    assert (await conflated.get())['seq'] == 4, "only the newest response is kept"
+    assert conflated.received == 5
+    assert conflated.coalesced == 4, "4 responses were overwritten before being consumed"
+
+    get_task = asyncio.create_task(conflated.get())
+    await asyncio.sleep(0.01)
+    assert not get_task.done(), "waiting for the next response"
+    source.on_next({'msg_type': 'proposal', 'seq': 5})
+    source.on_next({'msg_type': 'proposal', 'seq': 6})
+    assert (await get_task)['seq'] == 6, "consumer is woken up once with the newest response"
+    assert conflated.coalesced == 5
+
+    source.on_next({'msg_type': 'proposal', 'seq': 7})
+    source.on_completed()
+    assert [response['seq'] async for response in conflated] == [7], "pending response is drained before completion"
+    with pytest.raises(APIError, match='Subscription is completed'):
+        await conflated.get()
+
+
+@pytest.mark.asyncio
+async def test_conflated_source_error():
+    source = Subject()
+    conflated = ConflatedSource(source)
+    source.on_error(Exception('stream error'))
+    with pytest.raises(Exception, match='stream error'):
+        await conflated.get()
+
+    source = Subject()
+    conflated = ConflatedSource(source)
+    conflated.dispose()
+    source.on_next({'msg_type': 'proposal'})
+    assert conflated.received == 0, "disposed source does not receive responses"
@@ -256,10 +256,10 @@ async def test_response_error():
         'req_id': f1.exception().req_id,
         'subscription': {'id': 'A111111'}
     }
+    assert r50_data['req_id'] not in api.pending_requests, 'the request is not pending after its error'
+    extra_response = api.sanity_errors.pipe(op.first(), op.to_future())
     wsconnection.data.append(r50_data) # add back r50 again
-    #will send a `forget` if get a response again
-    await asyncio.sleep(0.1)
-    assert wsconnection.called['send'][-1] == '{"forget": "A111111", "req_id": 2}'
+    assert str(await asyncio.wait_for(extra_response, 0.1)) == 'APIError:Extra response'
     poc_data = {
         'echo_req': {'proposal_open_contract': 1, 'subscribe': 1},
         'msg_type': 'proposal_open_contract',
@@ -300,6 +300,60 @@ async def test_cache():
     wsconnection.clear()
     await api.clear()
 
+@pytest.mark.asyncio
+async def test_send_without_cache():
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection)
+    wsconnection.add_data({'ping': 'pong', 'msg_type': 'ping', 'echo_req': {'ping': 1}})
+    await api.send({'ping': 1}, cache=False)
+    assert not await api.cache.has({'ping': 1}), 'response is not cached'
+    wsconnection.clear()
+    await api.clear()
+
+@pytest.mark.asyncio
+async def test_send_serialized():
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection)
+    wsconnection.add_data({'ping': 'pong', 'msg_type': 'ping', 'echo_req': {'ping': 1}})
+    req_id = api.next_req_id()
+    response = await api.send_serialized(req_id, f'{{"ping": 1, "req_id": {req_id}}}')
+    assert wsconnection.called['send'] == [f'{{"ping": 1, "req_id": {req_id}}}'], 'sent once awaited'
+    assert (await response)['ping'] == 'pong'
+    assert not await api.cache.has({'ping': 1}), 'response is not cached'
+    wsconnection.clear()
+    await api.clear()
+
+@pytest.mark.asyncio
+async def test_hub():
+    class Hub:
+        def __init__(self):
+            self.requests = []
+        async def subscribe(self, request, consumer):
+            self.requests.append((request, consumer))
+            return Subject()
+        def forget(self, subs_id, consumer):
+            return subs_id == 'HUB1'
+        def forget_all(self, types, consumer):
+            self.requests.append((types, consumer))
+            return []
+    hub = Hub()
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection, hub=hub)
+    await api.subscribe({'ticks': 'R_50'})
+    assert hub.requests == [({'ticks': 'R_50'}, api)], 'public stream is subscribed through the hub'
+    await api.subscribe({'proposal_open_contract': 1})
+    assert len(hub.requests) == 1, 'private stream is subscribed on the api connection'
+    assert len(api.subscription_manager.sources) == 1
+    await asyncio.sleep(0.1)
+    sent = len(wsconnection.called['send'])
+    assert (await api.forget('HUB1'))['forget'] == 1
+    assert len(wsconnection.called['send']) == sent, 'hub subscriptions are forgotten by the hub'
+    wsconnection.add_data({'msg_type': 'forget_all', 'forget_all': [], 'echo_req': {'forget_all': ['ticks']}})
+    await api.forget_all('ticks')
+    assert hub.requests[-1] == (('ticks',), api)
+    wsconnection.clear()
+    await api.clear()
+
 @pytest.mark.asyncio
 async def test_can_subscribe_one_source_many_times():
     wsconnection = MockedWs()
@@ -426,4 +480,40 @@ async def test_add_task():
 def add_req_id(response, req_id):
     response['echo_req']['req_id'] = req_id
     response['req_id'] = req_id
-    return response
\ No newline at end of file
+    return response
+
+
+@pytest.mark.asyncio
+async def test_trusted():
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection, trusted=True)
+    assert api.trusted and api.cache.trusted
+    assert not deriv_api.DerivAPI.trusted, 'calls are validated by default'
+    wsconnection.add_data({'ping': 'pong', 'msg_type': 'ping', 'echo_req': {'ping': '1'}})
+    request = {'ping': '1'}
+    await asyncio.wait_for(api.ping(request), 1)
+    assert json.loads(wsconnection.called['send'][-1])['ping'] == '1', 'args are sent as given'
+    assert request == {'ping': '1'}, 'args of the caller are not changed'
+    wsconnection.clear()
+    await api.clear()
+
+
+@pytest.mark.asyncio
+async def test_send_does_not_change_request():
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection)
+    wsconnection.add_data({'ping': 'pong', 'msg_type': 'ping', 'echo_req': {'ping': 1}})
+    request = {'ping': '1'}
+    assert (await asyncio.wait_for(api.ping(request), 1))['ping'] == 'pong'
+    assert request == {'ping': '1'}, 'args of the caller are not changed by the validation'
+    sent = json.loads(wsconnection.called['send'][-1])
+    assert sent == {'ping': 1, 'req_id': sent['req_id']}, 'the req_id is only in the message'
+
+    wsconnection.add_data({'time': 1, 'msg_type': 'time', 'echo_req': {'time': 1}})
+    request = {'time': 1}
+    await asyncio.wait_for(api.send(request), 1)
+    assert request == {'time': 1}, 'send does not add the req_id to the request'
+    assert await api.cache.has({'time': 1}), 'the response is cached under the request'
+    assert not api.pending_requests, 'answered requests are not pending anymore'
+    wsconnection.clear()
+    await api.clear()
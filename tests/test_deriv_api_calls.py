@@ -1,5 +1,10 @@
 import pytest
+import ast
+import copy
+import inspect
+import os
 import re
+from deriv_api import deriv_api_calls
 from deriv_api.deriv_api_calls import *
 
 class DerivedDerivAPICalls(DerivAPICalls):
@@ -35,6 +40,9 @@ def test_parse_parse_args():
     assert parse_args(
         {'config': {'acc': {'type': 'boolean'}}, 'args': {'acc': '0'}, 'method': 'acc', 'needsMethodArg': 1}) == {
                'acc': 0}, "arg is boolean"
+    args = {'acc': '0'}
+    parse_args({'config': {'acc': {'type': 'numeric'}}, 'args': args, 'method': 'acc', 'needsMethodArg': 1})
+    assert args == {'acc': '0'}, "args of the caller are not changed"
 
 def test_validate_args():
     assert re.match('Requires an dict',validate_args({},""))
@@ -55,3 +63,125 @@ def test_validate_args():
     assert re.search("boolean value expected but found <class 'str'>: k4", error_msg)
     error_msg = validate_args(config, {'k1': {}, 'k2': "string", 'k3': 1, 'k4': True, 'k5': 1})
     assert error_msg == ''
+
+
+def generic_validator(method, config):
+    def validator(args):
+        parsed_args = parse_args({'method': method, 'needsMethodArg': '1', 'args': args, 'config': config})
+        error = validate_args(config=config, args=parsed_args)
+        if error:
+            raise ValueError(error)
+        return parsed_args
+    return validator
+
+
+def outcome(validator, args):
+    try:
+        return 'ok', validator(args)
+    except ValueError as err:
+        return 'error', str(err)
+
+
+def test_compile_validator():
+    config = {
+        'k1': {'type': 'dict'},
+        'k2': {'type': 'string', 'required': 1},
+        'k3': {'type': 'numeric'},
+        'k4': {'type': 'boolean'},
+        'k5': {},
+        'acc': {'required': 1}
+    }
+    cases = [{'k2': 1}, {'k1': 1, 'k3': '2.5', 'k4': '3'}, {'k1': {}, 'k2': 's', 'k4': 1, 'k5': [1]},
+             {'k2': 's', 'unknown': 1}, 'value', {'k3': 'abc'}]
+    for args in cases:
+        compiled = compile_validator('acc', config)
+        assert outcome(compiled, copy.deepcopy(args)) == outcome(generic_validator('acc', config),
+                                                                 copy.deepcopy(args)), args
+
+
+def test_compiled_validators_match_generic_validation():
+    values = {'string': [0, 'value', 1.5], 'numeric': ['10', 2.7, 'abc'], None: [{'a': 1}]}
+    for method, config in method_configs.items():
+        full = {}
+        for param, param_config in config.items():
+            full[param] = values[param_config.get('type')][0]
+        required = {param: full[param] for param, param_config in config.items() if param_config.get('required')}
+        cases = [full, required, {}, {'not_a_param': 1}, {**required, 'not_a_param': 1}, 'value']
+        for param, param_config in config.items():
+            for value in values[param_config.get('type')][1:]:
+                cases.append({**required, param: value})
+        for args in cases:
+            given = copy.deepcopy(args)
+            assert outcome(get_validator(method), given) == \
+                   outcome(generic_validator(method, config), copy.deepcopy(args)), (method, args)
+            assert given == args, f'{method} does not change the args of the caller'
+
+
+@pytest.mark.asyncio
+async def test_process_request_with_custom_config():
+    api = DerivedDerivAPICalls()
+    all_args = {'method': 'ping', 'needsMethodArg': '1', 'args': {'ping': '1', 'extra': 1},
+                'config': {'ping': {'type': 'numeric'}, 'extra': {'type': 'string'}}}
+    assert await api.process_request(all_args) == {'ping': 1, 'extra': '1'}, "other configs use parse_args"
+
+
+def test_lazy_methods():
+    assert 'proposal' in dir(DerivAPICalls)
+    assert 'ticks' in dir(DerivedDerivAPICalls())
+    method = DerivAPICalls.proposal
+    assert method is DerivAPICalls.__dict__['proposal'], "generated once, then found directly"
+    assert method.__qualname__ == 'DerivAPICalls.proposal'
+    assert list(inspect.signature(method).parameters) == ['self', 'args', 'trusted']
+    assert 'param args.contract_type {String}' in inspect.getdoc(method)
+    with pytest.raises(AttributeError, match="has no attribute 'no_such_method'"):
+        DerivedDerivAPICalls().no_such_method
+    with pytest.raises(AttributeError):
+        DerivAPICalls.no_such_method
+
+
+def test_stub_declares_all_methods():
+    with open(os.path.join(os.path.dirname(deriv_api_calls.__file__), 'deriv_api_calls.pyi')) as file:
+        tree = ast.parse(file.read())
+    api_calls = next(node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == 'DerivAPICalls')
+    methods = [node.name for node in api_calls.body if isinstance(node, ast.AsyncFunctionDef)]
+    assert methods == ['process_request', *method_configs]
+
+
+def test_stub_matches_runtime_methods():
+    with open(os.path.join(os.path.dirname(deriv_api_calls.__file__), 'deriv_api_calls.pyi')) as file:
+        tree = ast.parse(file.read())
+    api_calls = next(node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == 'DerivAPICalls')
+    for node in api_calls.body:
+        if not isinstance(node, ast.AsyncFunctionDef):
+            continue
+        method = getattr(DerivAPICalls, node.name)
+        assert inspect.iscoroutinefunction(method), node.name
+        parameters = inspect.signature(method).parameters
+        stub_defaults = [None] * (len(node.args.args) - len(node.args.defaults)) + \
+            [ast.literal_eval(default) for default in node.args.defaults]
+        assert [(arg.arg, default) for arg, default in zip(node.args.args, stub_defaults)] == \
+            [(name, None if parameter.default is inspect.Parameter.empty else parameter.default)
+             for name, parameter in parameters.items()], node.name
+        if node.name in method_docs:
+            assert ast.get_docstring(node) == inspect.getdoc(method) == inspect.cleandoc(method_docs[node.name]), \
+                node.name
+
+
+@pytest.mark.asyncio
+async def test_trusted_calls():
+    api = DerivedDerivAPICalls()
+    with pytest.raises(ValueError, match='Required parameters missing: reason'):
+        await api.account_closure({})
+    assert await api.account_closure({'reason': 1}, trusted=True) == {'reason': 1, 'account_closure': 1}, \
+        "args are not parsed nor validated"
+    assert await api.ticks('R_50', trusted=True) == {'ticks': 'R_50'}
+
+    args = {'reason': 1}
+    await api.account_closure(args, trusted=True)
+    assert args == {'reason': 1}, "args of the caller are not changed"
+
+    api.trusted = True
+    request = {'ticks_history': 'R_50', 'end': 'latest', 'count': '10'}
+    assert await api.ticks_history(dict(request)) == request
+    assert await api.ticks_history(dict(request), trusted=False) == {**request, 'count': 10}, \
+        "calls can still be validated"
@@ -8,4 +8,12 @@ def test_app_error_class():
 def test_construction_error_class():
     error = ConstructionError("A error")
     assert isinstance(error, Exception)
-    assert f'{error}' == 'ConstructionError:A error'
\ No newline at end of file
+    assert f'{error}' == 'ConstructionError:A error'
+
+
+def test_response_validation_error_class():
+    response = {'msg_type': 'tick', 'tick': {}}
+    error = ResponseValidationError(response, ['Required fields missing: epoch', 'unexpected fields: x'])
+    assert isinstance(error, Exception)
+    assert f'{error}' == 'ResponseValidationError:tick: Required fields missing: epoch - unexpected fields: x'
+    assert error.response is response
@@ -0,0 +1,86 @@
+import asyncio
+import io
+
+import pytest
+
+from deriv_api.export import TransactionExport
+
+
+class API:
+    def __init__(self, total):
+        self.total = total
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send(self, request, cache=True):
+        assert cache is False, "pages are never cached"
+        self.requests.append(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        offset, limit = request['offset'], request['limit']
+        rows = [{'transaction_id': i, 'amount': -i} for i in range(offset, min(offset + limit, self.total))]
+        msg_type = 'statement' if 'statement' in request else 'profit_table'
+        return {'msg_type': msg_type, msg_type: {'count': len(rows), 'transactions': rows}}
+
+
+@pytest.mark.asyncio
+async def test_export_rows():
+    api = API(25)
+    export = TransactionExport(api, 'statement', {'date_to': 100}, page_size=10, prefetch=3)
+    rows = [row async for row in export]
+    assert [row['transaction_id'] for row in rows] == list(range(25))
+    assert api.requests[0] == {'date_to': 100, 'statement': 1, 'limit': 10, 'offset': 0}
+    assert api.max_in_flight == 3
+    assert export.rows == 25
+    assert export.pages == len(api.requests) == 3, "pages prefetched after the last one are cancelled"
+    assert export.rows_per_second > 0
+
+    api = API(20)
+    pages = [page async for page in TransactionExport(api, 'profit_table', page_size=10, prefetch=1).iter_pages()]
+    assert [len(page) for page in pages] == [10, 10]
+    assert len(api.requests) == 3, "a full last page needs one more page to know it is the last one"
+
+    with pytest.raises(ValueError, match='not a paginated call'):
+        TransactionExport(api, 'ticks_history')
+
+
+@pytest.mark.asyncio
+async def test_columns_and_csv():
+    export = TransactionExport(API(3), 'profit_table', page_size=2)
+    batches = [batch async for batch in export.iter_columns(['transaction_id', 'payout'])]
+    assert batches == [{'transaction_id': [0, 1], 'payout': [None, None]},
+                       {'transaction_id': [2], 'payout': [None]}]
+
+    file = io.StringIO()
+    assert await TransactionExport(API(3), 'statement', page_size=2).write_csv(file) == 3
+    assert file.getvalue().splitlines() == ['transaction_id,amount', '0,0', '1,-1', '2,-2']
+
+
+@pytest.mark.asyncio
+async def test_stopped_export_cancels_prefetches():
+    api = API(100)
+    export = TransactionExport(api, 'statement', page_size=10, prefetch=3)
+    rows = export.__aiter__()
+    assert [(await rows.__anext__())['transaction_id'] for _ in range(11)] == list(range(11))
+    await asyncio.sleep(0)
+    assert api.in_flight == 1, "the next page is prefetched"
+    await rows.aclose()
+    await asyncio.sleep(0)
+    assert api.in_flight == 0, "and cancelled when the consumer stops"
+
+    class File(io.StringIO):
+        def write(self, data):
+            if self.tell():
+                raise OSError('disk full')
+            return super().write(data)
+
+    api = API(100)
+    with pytest.raises(OSError, match='disk full'):
+        await TransactionExport(api, 'statement', page_size=10, prefetch=1).write_csv(File())
+    await asyncio.sleep(0)
+    assert api.in_flight == 0
@@ -0,0 +1,136 @@
+import statistics
+
+import pytest
+from rx.subject import Subject
+
+from deriv_api.indicators import EMA, RSI, Bollinger, Indicator, IndicatorEngine
+
+PRICES = [10.0, 10.5, 10.2, 10.8, 11.1, 10.9, 10.4, 10.6, 11.3, 11.0, 10.7, 10.9]
+
+
+def updates(indicator, prices):
+    indicator.add_slot()
+    return [indicator.update(0, price) for price in prices]
+
+
+def test_ema():
+    with pytest.raises(TypeError):
+        Indicator(2)
+    with pytest.raises(ValueError, match='period should be a positive integer'):
+        EMA(0)
+    values = updates(EMA(3), PRICES)
+    assert values[:2] == [None, None], "warming up"
+    expected = PRICES[0]
+    for price, value in zip(PRICES[1:], values[1:]):
+        expected = expected + 0.5 * (price - expected)
+        if value is not None:
+            assert value == pytest.approx(expected)
+
+
+def test_rsi():
+    period = 4
+    values = updates(RSI(period), PRICES)
+    assert values[:period] == [None] * period
+    changes = [b - a for a, b in zip(PRICES, PRICES[1:])]
+    gain = sum(max(c, 0) for c in changes[:period]) / period
+    loss = sum(max(-c, 0) for c in changes[:period]) / period
+    assert values[period] == pytest.approx(100 - 100 / (1 + gain / loss))
+    for change, value in zip(changes[period:], values[period + 1:]):
+        gain = (gain * (period - 1) + max(change, 0)) / period
+        loss = (loss * (period - 1) + max(-change, 0)) / period
+        assert value == pytest.approx(100 - 100 / (1 + gain / loss))
+    assert updates(RSI(2), [1.0, 2.0, 3.0])[-1] == 100.0, "no loss"
+
+
+def test_bollinger():
+    values = updates(Bollinger(5, 2), PRICES)
+    assert values[:4] == [None] * 4
+    for end, value in zip(range(5, len(PRICES) + 1), values[4:]):
+        window = PRICES[end - 5:end]
+        middle = statistics.mean(window)
+        deviation = 2 * statistics.pstdev(window)
+        assert value == pytest.approx((middle, middle + deviation, middle - deviation))
+
+
+def test_bollinger_large_prices():
+    """Prices far from zero with a small spread, over more updates than a resync period"""
+    prices = [1e9 + (i % 7) * 0.001 for i in range(3000)]
+    values = updates(Bollinger(20, 2), prices)
+    for end in (20, 1024, 1025, 2999, 3000):
+        window = prices[end - 20:end]
+        middle = statistics.mean(window)
+        deviation = 2 * statistics.pstdev(window)
+        assert values[end - 1] == pytest.approx((middle, middle + deviation, middle - deviation), rel=1e-12, abs=1e-6)
+
+
+def test_update_many():
+    single = EMA(3)
+    single.add_slot()
+    single.add_slot()
+    many = EMA(3)
+    many.add_slot()
+    many.add_slot()
+    for price in PRICES:
+        assert many.update_many([0, 1], [price, price * 2]) == [single.update(0, price), single.update(1, price * 2)]
+
+
+@pytest.mark.asyncio
+async def test_indicator_engine():
+    class API:
+        def __init__(self):
+            self.requests = []
+            self.source = Subject()
+            self.sanity_errors = Subject()
+
+        async def subscribe(self, request):
+            self.requests.append(request)
+            return self.source
+
+    engine = IndicatorEngine()
+    ema = engine.stream(EMA(2))
+    assert engine.stream(EMA(2)) is ema, "identical indicators are shared"
+    rsi = engine.stream(RSI(2))
+    ema_updates, rsi_updates = [], []
+    ema.subscribe(ema_updates.append)
+    rsi.subscribe(rsi_updates.append)
+    api = API()
+    await engine.track(api, 'R_50')
+    await engine.track(api, 'R_50')
+    assert api.requests == [{'ticks': 'R_50'}, {'ticks': 'R_50'}]
+    assert len(engine.upstreams) == 1, "the upstream is attached once"
+    for epoch, quote in enumerate([1.0, 2.0, 3.0]):
+        api.source.on_next({'msg_type': 'tick', 'tick': {'symbol': 'R_50', 'epoch': epoch, 'quote': quote}})
+    assert [update['epoch'] for update in ema_updates] == [1, 2]
+    assert ema_updates[0] == {'symbol': 'R_50', 'epoch': 1, 'indicator': ('ema', 2), 'value': pytest.approx(5 / 3)}
+    assert [update['value'] for update in rsi_updates] == [100.0]
+
+    engine.update_many(['R_100', 'R_50'], [3, 3], [5.0, 2.0])
+    assert len(engine.slots) == 2
+    assert ema_updates[-1]['symbol'] == 'R_50', "R_100 is warming up"
+
+    # server candles stream: the indicators are updated with the close of every finished candle
+    for open_time, close in [(60, '1'), (60, '2'), (120, '3')]:
+        engine.on_message({'msg_type': 'ohlc', 'ohlc': {'symbol': 'R_10', 'open_time': open_time, 'close': close}})
+    engine.on_message({'msg_type': 'ohlc', 'ohlc': {'symbol': 'R_10', 'open_time': 180, 'close': '4'}})
+    assert [update['epoch'] for update in ema_updates if update['symbol'] == 'R_10'] == [120]
+    engine.detach('R_50')
+    assert not engine.upstreams
+
+
+def test_source_errors():
+    engine = IndicatorEngine()
+    errors = []
+    engine.errors.subscribe(errors.append)
+    source = Subject()
+    engine.attach(source, 'closed candles')
+    error = Exception('stream failed')
+    source.on_error(error)
+    assert errors == [error], "the error is reported"
+    assert not engine.upstreams, "the failed source is detached"
+    sanity_errors = Subject()
+    reported = []
+    sanity_errors.subscribe(reported.append)
+    source = Subject()
+    engine.attach(source, 'R_50', sanity_errors)
+    source.on_error(error)
+    assert reported == [error] and errors == [error]
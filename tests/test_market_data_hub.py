@@ -0,0 +1,78 @@
+import pytest
+from rx.subject import Subject
+
+from deriv_api.market_data_hub import MarketDataHub, is_public
+
+
+class API:
+    def __init__(self):
+        self.requests = []
+        self.source = Subject()
+
+    async def subscribe(self, request):
+        self.requests.append(request)
+        return self.source
+
+
+def test_is_public():
+    assert is_public({'ticks': 'R_50'})
+    assert is_public({'ticks_history': 'R_50', 'style': 'candles', 'subscribe': 1})
+    assert not is_public({'proposal_open_contract': 1})
+
+
+@pytest.mark.asyncio
+async def test_market_data_hub():
+    api = API()
+    hub = MarketDataHub(api)
+    consumer1, consumer2 = object(), object()
+    source1 = await hub.subscribe({'ticks': 'R_50'}, consumer1)
+    source2 = await hub.subscribe({'ticks': 'R_50'}, consumer2)
+    assert await hub.subscribe({'ticks': 'R_50'}, consumer1) is source1
+    assert api.requests == [{'ticks': 'R_50'}], "one wire subscription per unique request"
+    received1, received2 = [], []
+    subscription1 = source1.subscribe(received1.append)
+    subscription2 = source2.subscribe(received2.append)
+    tick = {'msg_type': 'tick', 'tick': {'symbol': 'R_50', 'quote': 1.5}}
+    api.source.on_next(tick)
+    api.source.on_next(tick)
+    assert received1 == received2 == [tick, tick], "fanned out to every consumer"
+    another_subscription2 = source2.subscribe(lambda response: None)
+    stats = hub.stats()
+    assert stats['wire_subscriptions'] == 1
+    assert stats['consumer_subscriptions'] == 2
+    assert stats['messages'] == 2
+    assert stats['saved_messages'] == 2
+    assert stats['saved_bytes'] == 2 * len('{"msg_type": "tick", "tick": {"symbol": "R_50", "quote": 1.5}}')
+    assert hub.stats()['consumer_subscriptions'] == 2, "counted once per consumer"
+    subscription1.dispose()
+    another_subscription2.dispose()
+    stats = hub.stats()
+    assert stats['consumer_subscriptions'] == 1, "consumers leave once their subscriptions are disposed"
+    assert stats['saved_messages'] == 0
+    subscription2.dispose()
+    assert hub.stats()['wire_subscriptions'] == 0, "stream is removed once no consumer listens to it"
+    await hub.subscribe({'ticks': 'R_50'}, consumer1)
+    assert len(api.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_forget():
+    api = API()
+    hub = MarketDataHub(api)
+    consumer1, consumer2 = object(), object()
+    received1, received2, completed = [], [], []
+    (await hub.subscribe({'ticks': 'R_50'}, consumer1)).subscribe(received1.append,
+                                                                  on_completed=lambda: completed.append(1))
+    (await hub.subscribe({'ticks': 'R_50'}, consumer2)).subscribe(received2.append)
+    tick = {'msg_type': 'tick', 'tick': {'symbol': 'R_50', 'quote': 1.5}, 'subscription': {'id': 'A1'}}
+    api.source.on_next(tick)
+    assert not hub.forget('B1', consumer1), 'unknown subscription'
+    assert hub.forget('A1', consumer1)
+    assert not hub.forget('A1', consumer1), 'already forgotten'
+    assert completed == [1]
+    api.source.on_next(tick)
+    assert received1 == [tick] and received2 == [tick, tick], 'the other consumers keep the stream'
+    assert hub.stats()['consumer_subscriptions'] == 1
+    assert hub.forget_all(['proposal'], consumer2) == []
+    assert hub.forget_all(['ticks'], consumer2) == ['A1']
+    assert hub.stats()['wire_subscriptions'] == 0, 'stream is removed once no consumer listens to it'
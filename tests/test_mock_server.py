@@ -0,0 +1,131 @@
+import asyncio
+import json
+
+import pytest
+
+from benchmarks.mock_server import Client, MockServer
+from deriv_api.response_validation import get_response_validator
+
+PROPOSAL = {'proposal': 1, 'amount': 10, 'basis': 'payout', 'contract_type': 'CALL', 'currency': 'USD',
+            'duration': 5, 'duration_unit': 't', 'symbol': 'R_1'}
+
+
+def sent(client: Client) -> list:
+    """The messages queued for the client"""
+    messages = []
+    while not client.outgoing.empty():
+        messages.append(json.loads(client.outgoing.get_nowait()))
+    return messages
+
+
+def request(server: MockServer, client: Client, message: dict) -> list:
+    server.on_request(client, message)
+    return sent(client)
+
+
+@pytest.mark.asyncio
+async def test_ping_and_errors():
+    server = MockServer(symbols=2, seed=1)
+    client = Client(server, None)
+    assert request(server, client, {'ping': 1, 'req_id': 3, 'passthrough': {'a': 1}}) == [
+        {'echo_req': {'ping': 1, 'req_id': 3, 'passthrough': {'a': 1}}, 'msg_type': 'ping', 'ping': 'pong',
+         'req_id': 3, 'passthrough': {'a': 1}}]
+    [response] = request(server, client, {'website_status': 1, 'req_id': 4})
+    assert response['error']['code'] == 'UnrecognisedRequest' and response['req_id'] == 4
+    [response] = request(server, client, {'ticks': 'R_99'})
+    assert response['msg_type'] == 'tick' and response['error']['code'] == 'InvalidSymbol'
+    server.error_rate = 1
+    [response] = request(server, client, {'ping': 1})
+    assert response['msg_type'] == 'ping' and response['error']['code'] == 'MockError'
+
+
+@pytest.mark.asyncio
+async def test_ticks():
+    server = MockServer(symbols=2, seed=1)
+    client = Client(server, None)
+    [response] = request(server, client, {'ticks': 'R_0'})
+    assert 'subscription' not in response and 'id' not in response['tick']
+    [response] = request(server, client, {'ticks': 'R_0', 'subscribe': 1})
+    subs_id = response['subscription']['id']
+    assert response['tick']['id'] == subs_id and get_response_validator('tick')(response) == []
+    server.step()
+    server.step()
+    ticks = sent(client)
+    assert [tick['subscription']['id'] for tick in ticks] == [subs_id, subs_id], 'only R_0 is subscribed'
+    assert ticks[0]['tick']['quote'] != ticks[1]['tick']['quote']
+
+
+@pytest.mark.asyncio
+async def test_proposal_buy_and_contract():
+    server = MockServer(symbols=2, contract_ticks=3, seed=1)
+    client = Client(server, None)
+    [proposal] = request(server, client, {**PROPOSAL, 'subscribe': 1})
+    assert get_response_validator('proposal')(proposal) == []
+    assert proposal['proposal']['id'] == proposal['subscription']['id']
+    assert proposal['proposal']['ask_price'] == 5.2 and proposal['proposal']['payout'] == 10
+    server.step()
+    [update] = sent(client)
+    assert update['proposal']['id'] == proposal['proposal']['id']
+
+    [response] = request(server, client, {'buy': proposal['proposal']['id'], 'price': 1})
+    assert response['error']['code'] == 'PriceMoved'
+    [response] = request(server, client, {'buy': 'unknown', 'price': 100})
+    assert response['error']['code'] == 'InvalidContractProposal'
+    [bought] = request(server, client, {'buy': proposal['proposal']['id'], 'price': 100})
+    assert get_response_validator('buy')(bought) == [] and bought['buy']['buy_price'] == 5.2
+    contract_id = bought['buy']['contract_id']
+
+    [contract] = request(server, client, {'proposal_open_contract': 1, 'contract_id': contract_id, 'subscribe': 1})
+    assert get_response_validator('proposal_open_contract')(contract) == []
+    assert contract['proposal_open_contract']['status'] == 'open'
+    for _ in range(3):
+        server.step()
+    updates = [message for message in sent(client) if message['msg_type'] == 'proposal_open_contract']
+    assert [update['proposal_open_contract']['is_sold'] for update in updates] == [0, 0, 1]
+    assert updates[-1]['proposal_open_contract']['status'] in ('won', 'lost')
+    assert contract['subscription']['id'] not in client.subscriptions, 'the stream ends with the contract'
+    [response] = request(server, client, {'proposal_open_contract': 1})
+    assert response['proposal_open_contract'] == {}, 'no open contract left'
+
+
+@pytest.mark.asyncio
+async def test_buy_subscribe_with_parameters():
+    server = MockServer(symbols=2, contract_ticks=2, seed=1)
+    client = Client(server, None)
+    parameters = {key: value for key, value in PROPOSAL.items() if key != 'proposal'}
+    [bought] = request(server, client, {'buy': 1, 'price': 100, 'parameters': parameters, 'subscribe': 1})
+    assert bought['msg_type'] == 'buy' and 'subscription' in bought
+    server.step()
+    [update] = sent(client)
+    assert update['msg_type'] == 'proposal_open_contract'
+    assert update['subscription'] == bought['subscription'] and update['echo_req'] == bought['echo_req']
+
+
+@pytest.mark.asyncio
+async def test_forget():
+    server = MockServer(symbols=2, seed=1)
+    client = Client(server, None)
+    [tick] = request(server, client, {'ticks': 'R_0', 'subscribe': 1})
+    request(server, client, {'ticks': 'R_1', 'subscribe': 1})
+    [proposal] = request(server, client, {**PROPOSAL, 'subscribe': 1})
+    assert request(server, client, {'forget': tick['subscription']['id']})[0]['forget'] == 1
+    assert request(server, client, {'forget': tick['subscription']['id']})[0]['forget'] == 0
+    [response] = request(server, client, {'forget_all': ['ticks']})
+    assert len(response['forget_all']) == 1
+    assert list(client.subscriptions) == [proposal['subscription']['id']]
+    [response] = request(server, client, {'forget_all': 'proposal'})
+    assert response['forget_all'] == [proposal['subscription']['id']]
+    server.step()
+    assert sent(client) == [] and all(not streams for streams in server.streams.values())
+
+
+@pytest.mark.asyncio
+async def test_latency():
+    server = MockServer(symbols=1, latency=0.05, seed=1)
+    client = Client(server, None)
+    server.on_request(client, {'ticks': 'R_0', 'subscribe': 1})
+    assert sent(client) == [], 'delayed'
+    await asyncio.sleep(0.1)
+    assert len(sent(client)) == 1
+    server.step()
+    assert len(sent(client)) == 1, 'the stream updates are not delayed'
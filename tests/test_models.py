@@ -0,0 +1,53 @@
+import pytest
+from rx.subject import Subject
+
+from deriv_api.models import ResponseModel, get_model, models, to_model
+
+
+def test_to_model():
+    tick = to_model({'msg_type': 'tick', 'echo_req': {'ticks': 'R_50'},
+                     'tick': {'ask': 100.5, 'bid': 100.3, 'epoch': 1634000000, 'id': 'an-id', 'pip_size': 2,
+                              'quote': 100.4, 'symbol': 'R_50'}})
+    assert type(tick) is get_model('tick')
+    assert type(tick).__name__ == 'Tick'
+    assert (tick.quote, tick.epoch, tick.symbol) == (100.4, 1634000000, 'R_50')
+    assert tick.extra is None
+    assert not hasattr(tick, '__dict__'), "slotted"
+    with pytest.raises(AttributeError):
+        tick.not_a_field = 1
+
+    body = {'contract_id': 1, 'profit': -1.5, 'is_sold': 0, 'audit_details': {'all_ticks': []}, 'new_field': 'x'}
+    contract = to_model({'msg_type': 'proposal_open_contract', 'proposal_open_contract': body})
+    assert contract.profit == -1.5
+    assert contract.sell_price is None, "missing fields are None"
+    assert contract.audit_details == {'all_ticks': []}
+    assert contract.extra == {'new_field': 'x'}, "unknown fields are kept"
+    assert contract.to_dict() == body
+    assert contract == to_model({'msg_type': 'proposal_open_contract', 'proposal_open_contract': dict(body)})
+    assert 'profit=-1.5' in repr(contract)
+
+    with pytest.raises(KeyError):
+        to_model({'msg_type': 'ping', 'ping': 'pong'})
+
+
+def test_from_dict():
+    class Ping(ResponseModel):
+        __slots__ = ('ping', 'req_id')
+        msg_type = 'ping'
+        fields = ('ping', 'req_id')
+
+    ping = Ping.from_dict({'ping': 'pong', 'echo': 1})
+    assert (ping.ping, ping.req_id, ping.extra) == ('pong', None, {'echo': 1})
+    assert Ping.from_dict({'ping': 'pong'}).extra is None
+    body = {'quote': 1.5, 'symbol': 'R_50', 'new_field': 'x'}
+    generated, generic = get_model('tick').from_dict(body), ResponseModel.from_dict.__func__(get_model('tick'), body)
+    assert generated == generic, 'the generated from_dict builds the same model'
+
+
+def test_models_operator():
+    subject = Subject()
+    received = []
+    subject.pipe(models()).subscribe(received.append)
+    subject.on_next({'msg_type': 'balance', 'balance': {'balance': 10000, 'currency': 'USD', 'loginid': 'CR90000'}})
+    assert received[0].balance == 10000
+    assert received[0].loginid == 'CR90000'
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from deriv_api.errors import ResponseError
+from deriv_api.multi_account import MultiAccountTrader
+
+
+class API:
+    def __init__(self):
+        self.requests = []
+
+    async def send(self, request, cache=True):
+        assert cache is False, "trades are never cached"
+        self.requests.append(request)
+        await asyncio.sleep(0.01)
+        method = next(key for key in request if key.endswith('_multiple_accounts'))
+        if 'bad' in request['tokens']:
+            raise ResponseError({'echo_req': request, 'msg_type': method,
+                                 'error': {'code': 'InvalidToken', 'message': 'The token is invalid.'}})
+        result = [{'token': token, 'contract_id': i} if token != 't3' else
+                  {'token': token, 'code': 'InsufficientBalance', 'message_to_client': 'Not enough balance'}
+                  for i, token in enumerate(request['tokens']) if token != 't4']
+        return {'msg_type': method, method: {'result': result}}
+
+
+@pytest.mark.asyncio
+async def test_buy():
+    api = API()
+    trader = MultiAccountTrader(api, ['t0', 't1', 't2', 't3', 't4', 't1', 'bad'], batch_size=4)
+    assert trader.batches() == [['t0', 't1', 't2', 't3'], ['t4', 'bad']], "tokens are deduplicated"
+    results = await trader.buy(price=10.5, parameters={'contract_type': 'CALL', 'symbol': 'R_100'})
+    assert api.requests[0] == {'buy_contract_for_multiple_accounts': '1', 'price': 10.5,
+                               'tokens': ['t0', 't1', 't2', 't3'],
+                               'parameters': {'contract_type': 'CALL', 'symbol': 'R_100'}}
+    assert list(results) == ['t0', 't1', 't2', 't3', 't4', 'bad']
+    assert results['t1'] == {'token': 't1', 'contract_id': 1}
+    assert results['t3']['code'] == 'InsufficientBalance', "the batch failed for the token"
+    assert results['t4']['code'] == 'InvalidToken', "the whole batch failed"
+    assert trader.elapsed > 0
+
+    trader = MultiAccountTrader(api, ['t0', 't4'])
+    results = await trader.buy(price=10, proposal_id='a-proposal-id')
+    assert api.requests[-1]['buy_contract_for_multiple_accounts'] == 'a-proposal-id'
+    assert results['t4']['code'] == 'NoResult'
+    with pytest.raises(ValueError, match='Either proposal_id or parameters'):
+        await trader.buy(price=10)
+
+
+@pytest.mark.asyncio
+async def test_sell():
+    api = API()
+    results = await MultiAccountTrader(api, ['t0', 't1']).sell('CALL_R_100_19.5_1634000000_5T_S0P_0')
+    assert api.requests == [{'sell_contract_for_multiple_accounts': 1, 'price': 0, 'tokens': ['t0', 't1'],
+                             'shortcode': 'CALL_R_100_19.5_1634000000_5T_S0P_0'}]
+    assert results['t0'] == {'token': 't0', 'contract_id': 0}
+    with pytest.raises(ValueError, match='Required parameters missing: shortcode'):
+        await MultiAccountTrader(api, ['t0']).trade('sell_contract_for_multiple_accounts', {'price': 0})
@@ -0,0 +1,80 @@
+import pytest
+from rx.subject import Subject
+
+from deriv_api.portfolio import PortfolioTracker
+
+
+def poc(contract_id, **fields):
+    return {'msg_type': 'proposal_open_contract',
+            'proposal_open_contract': {'contract_id': contract_id, **fields}}
+
+
+def test_portfolio_tracker():
+    portfolio = PortfolioTracker()
+    portfolio.on_update(poc(1, buy_price=10, bid_price=11, profit=1, payout=20, underlying='R_50',
+                            contract_type='CALL'))
+    portfolio.on_update(poc(2, buy_price='5', bid_price='4.5', profit='-0.5', payout='9.5', underlying='R_100',
+                            contract_type='PUT'))
+    portfolio.on_update(poc(3, buy_price=20, bid_price=22, profit=2, payout=39, underlying='R_50',
+                            contract_type='PUT'))
+    assert len(portfolio) == 3
+    assert portfolio.exposure() == 35.0
+    assert portfolio.market_value() == 37.5
+    assert portfolio.unrealized_profit() == 2.5
+    assert portfolio.potential_payout() == 68.5
+    assert portfolio.exposure_by_underlying() == {'R_50': 30.0, 'R_100': 5.0}
+
+    portfolio.on_update(poc(1, bid_price=12, profit=2))
+    assert portfolio.bid_prices[0] == 12.0, "row updated in place"
+    assert len(portfolio) == 3
+
+    portfolio.on_update(poc(1, is_sold=1, profit=3, sell_price=13))
+    assert len(portfolio) == 2
+    assert list(portfolio.contract_ids) == [3, 2], "last row moved to the sold row"
+    assert portfolio.rows == {3: 0, 2: 1}
+    assert portfolio.realized_profit == 3.0
+    assert portfolio.total_profit() == 4.5
+    assert portfolio.profit_by_underlying() == {'R_50': 2.0, 'R_100': -0.5}
+
+    portfolio.on_update(poc(1, is_sold=1, profit=3))
+    assert portfolio.realized_profit == 3.0, "sold contracts are counted once"
+    portfolio.on_update({'msg_type': 'proposal_open_contract', 'proposal_open_contract': {}})
+    portfolio.on_update({'msg_type': 'proposal_open_contract', 'error': {'code': 'InvalidContractId'}})
+    assert len(portfolio) == 2
+
+    portfolio.on_update(poc(2, is_sold=1, profit=-5))
+    assert list(portfolio.contract_ids) == [3]
+    assert portfolio.rows == {3: 0}
+
+
+@pytest.mark.asyncio
+async def test_track():
+    class API:
+        def __init__(self):
+            self.subject = Subject()
+            self.requests = []
+            self.sanity_errors = Subject()
+
+        async def subscribe(self, request):
+            self.requests.append(request)
+            return self.subject
+
+    api = API()
+    portfolio = PortfolioTracker()
+    await portfolio.track(api)
+    await portfolio.track(api)
+    assert api.requests == [{'proposal_open_contract': 1}], "subscribes once to all the open contracts"
+    api.subject.on_next(poc(1, buy_price=10, profit=1))
+    assert portfolio.exposure() == 10.0
+    portfolio.untrack()
+    api.subject.on_next(poc(2, buy_price=10, profit=1))
+    assert len(portfolio) == 1
+
+
+    errors = []
+    api.sanity_errors.subscribe(errors.append)
+    await portfolio.track(api)
+    error = Exception('stream failed')
+    api.subject.on_error(error)
+    assert errors == [error], "the error is reported"
+    assert portfolio.subscription is None, "track subscribes again"
@@ -0,0 +1,34 @@
+import json
+
+import pytest
+
+from deriv_api.prepared_request import PreparedRequest, cache_key, prepare
+from deriv_api.utils import dict_to_cache_key
+
+
+def test_message():
+    args = {'ticks': 'R_50', 'subscribe': 1}
+    request = PreparedRequest(args, 7)
+    assert json.loads(request.message) == {'ticks': 'R_50', 'subscribe': 1, 'req_id': 7}
+    assert request.message is request.message, 'serialized once'
+    assert args == {'ticks': 'R_50', 'subscribe': 1}, 'args are not changed'
+
+    assert json.loads(PreparedRequest({}, 1).message) == {'req_id': 1}
+    request = PreparedRequest({'ping': 1, 'req_id': 3})
+    assert request.req_id == 3, 'the req_id of the args is used'
+    assert json.loads(request.message) == {'ping': 1, 'req_id': 3}
+    assert PreparedRequest({'ping': 1}).req_id is None, 'allocated by the api'
+    assert PreparedRequest({'ping': 1, 'req_id': 3}, 3).req_id == 3
+    with pytest.raises(ValueError, match='req_id 4 does not match the req_id 3'):
+        PreparedRequest({'ping': 1, 'req_id': 3}, 4)
+
+
+def test_cache_key():
+    args = {'ticks': 'R_50', 'subscribe': 1, 'req_id': 2}
+    request = PreparedRequest(args)
+    assert request.cache_key == dict_to_cache_key({'ticks': 'R_50'})
+    assert request.cache_key is request.cache_key, 'computed once'
+    assert cache_key(request) is request.cache_key
+    assert cache_key(args) == request.cache_key
+    assert prepare(request) is request
+    assert prepare(args).args is args, 'args are not copied'
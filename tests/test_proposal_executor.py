@@ -0,0 +1,97 @@
+import asyncio
+import json
+
+import pytest
+from rx.subject import Subject
+
+from deriv_api.errors import ResponseError
+from deriv_api.proposal_executor import ProposalExecutor
+
+PROPOSAL = {'proposal': 1, 'amount': 10, 'basis': 'stake', 'contract_type': 'CALL', 'currency': 'USD',
+            'duration': 5, 'duration_unit': 't', 'symbol': 'R_100'}
+
+
+class API:
+    def __init__(self):
+        self.subject = Subject()
+        self.req_id = 0
+        self.sent = []
+        self.responses = {}
+
+    async def subscribe(self, request):
+        self.request = request
+        return self.subject
+
+    def next_req_id(self):
+        self.req_id += 1
+        return self.req_id
+
+    async def send_serialized(self, req_id, message):
+        self.sent.append(json.loads(message))
+        future = asyncio.get_event_loop().create_future()
+        self.responses[req_id] = future
+        return future
+
+    def proposal(self, proposal_id, payout):
+        self.subject.on_next({'msg_type': 'proposal', 'proposal': {'id': proposal_id, 'payout': payout}})
+
+
+def test_serialize():
+    executor = ProposalExecutor(API(), PROPOSAL, price=10.5, buy_args={'passthrough': {'a': 'b"c'}})
+    assert json.loads(executor.serialize('id"1', 7)) == {'buy': 'id"1', 'price': 10.5, 'req_id': 7,
+                                                         'passthrough': {'a': 'b"c'}}
+    with pytest.raises(ValueError, match='Requires an dict'):
+        ProposalExecutor(API(), PROPOSAL, price=10, buy_args={'no_such_arg': 1})
+
+
+@pytest.mark.asyncio
+async def test_buy_when():
+    api = API()
+    executor = ProposalExecutor(api, PROPOSAL, price=10)
+    await executor.start()
+    assert api.request == PROPOSAL
+    result = executor.buy_when(lambda proposal: proposal['payout'] > 19)
+    api.proposal('p1', 18)
+    api.proposal('p2', 19.5)
+    api.proposal('p3', 20)
+    await asyncio.sleep(0)
+    assert api.sent == [{'buy': 'p2', 'price': 10, 'req_id': 1}], "buys once, on the triggering proposal"
+    api.responses[1].set_result({'msg_type': 'buy', 'buy': {'contract_id': 1}})
+    assert (await result)['buy'] == {'contract_id': 1}
+    stats = executor.latency_stats()
+    assert stats['tick_to_send']['count'] == 1
+    assert stats['round_trip']['count'] == 1
+    assert 0 <= stats['tick_to_send']['last'] <= stats['round_trip']['last']
+
+    task = asyncio.ensure_future(executor.buy_now())
+    await asyncio.sleep(0)
+    assert api.sent[-1] == {'buy': 'p3', 'price': 10, 'req_id': 2}
+    error = ResponseError({'echo_req': api.sent[-1], 'msg_type': 'buy',
+                           'error': {'code': 'InvalidContractProposal', 'message': 'Price moved'}})
+    api.responses[2].set_exception(error)
+    with pytest.raises(ResponseError):
+        await task
+    assert executor.latency_stats()['round_trip']['count'] == 1
+
+    result = executor.buy_when(lambda proposal: True)
+    api.subject.on_error(error)
+    with pytest.raises(ResponseError):
+        await result
+    executor.stop()
+
+
+@pytest.mark.asyncio
+async def test_buy_now_while_pending():
+    api = API()
+    executor = ProposalExecutor(api, PROPOSAL, price=10)
+    await executor.start()
+    result = executor.buy_when(lambda proposal: proposal['payout'] > 19)
+    api.proposal('p1', 18)
+    with pytest.raises(ValueError, match='A buy is already pending'):
+        await executor.buy_now()
+    api.proposal('p2', 20)
+    await asyncio.sleep(0)
+    assert api.sent == [{'buy': 'p2', 'price': 10, 'req_id': 1}]
+    api.responses[1].set_result({'msg_type': 'buy', 'buy': {'contract_id': 1}})
+    assert (await result)['buy'] == {'contract_id': 1}, 'the pending buy is kept'
+    executor.stop()
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from deriv_api.errors import ResponseError
+from deriv_api.proposal_multiplexer import ProposalMultiplexer
+from deriv_api.subscription_manager import SubscriptionManager
+from tests.test_subscription_manager import API
+
+PROPOSAL = {'proposal': 1, 'amount': 10, 'basis': 'stake', 'currency': 'USD', 'symbol': 'R_100', 'duration': 5,
+            'duration_unit': 'm'}
+
+
+def test_can_merge():
+    assert ProposalMultiplexer.can_merge({**PROPOSAL, 'contract_type': 'CALL', 'barrier': '+0.1'})
+    assert not ProposalMultiplexer.can_merge({**PROPOSAL, 'contract_type': 'CALL'}), "barrier is needed"
+    assert not ProposalMultiplexer.can_merge({**PROPOSAL, 'contract_type': 'MULTUP', 'barrier': '+0.1',
+                                              'cancellation': '1h'})
+
+
+@pytest.mark.asyncio
+async def test_proposal_multiplexer():
+    api = API()
+    subscription_manager = SubscriptionManager(api)
+    multiplexer = subscription_manager.enable_proposal_multiplexing()
+    call, put, put_again, other_symbol = await asyncio.gather(
+        subscription_manager.subscribe({**PROPOSAL, 'contract_type': 'CALL', 'barrier': '+0.1'}),
+        subscription_manager.subscribe({**PROPOSAL, 'contract_type': 'PUT', 'barrier': '+0.2'}),
+        subscription_manager.subscribe({**PROPOSAL, 'contract_type': 'PUT', 'barrier': '+0.2'}),
+        subscription_manager.subscribe({**PROPOSAL, 'symbol': 'R_50', 'contract_type': 'PUT', 'barrier': '+0.2'}))
+    assert put is put_again, "identical proposals share their stream"
+    assert api.send_and_get_source_called == 2, "one proposal_array per group of compatible proposals"
+    array_request = {k: v for k, v in PROPOSAL.items() if k != 'proposal'}
+    assert api.send_and_get_source_request[1] == {'proposal_array': 1, **array_request,
+                                                  'contract_type': ['CALL', 'PUT'],
+                                                  'barriers': [{'barrier': '+0.1'}, {'barrier': '+0.2'}],
+                                                  'subscribe': 1}
+    calls, puts, put_errors = [], [], []
+    call_subscription = call.subscribe(calls.append)
+    put.subscribe(puts.append, put_errors.append)
+    other_symbol.subscribe(lambda response: None)
+    assert multiplexer.stats()['proposal_subscriptions'] == 3
+    assert multiplexer.stats()['wire_streams'] == 2
+
+    first_subject = subscription_manager.orig_sources[list(subscription_manager.orig_sources)[0]]
+    first_subject.on_next({
+        'msg_type': 'proposal_array', 'subscription': {'id': 'ARRAY1'},
+        'proposal_array': {'id': 'ARRAY1', 'proposals': {
+            'CALL': [{'ask_price': 5, 'barrier': '+0.1'}, {'ask_price': 4, 'barrier': '+0.2'}],
+            'PUT': [{'ask_price': 6, 'barrier': '+0.1'}, {'error': {'code': 'X', 'message': 'bad barrier'}}]}}})
+    assert calls == [{'echo_req': {**PROPOSAL, 'contract_type': 'CALL', 'barrier': '+0.1'}, 'msg_type': 'proposal',
+                      'proposal': {'ask_price': 5, 'barrier': '+0.1', 'id': 'ARRAY1'},
+                      'subscription': {'id': 'ARRAY1'}}], "array responses are demultiplexed"
+    assert puts == []
+    assert isinstance(put_errors[0], ResponseError), "error of one proposal only stops its stream"
+    assert multiplexer.stats()['array_messages'] == 1
+    assert multiplexer.stats()['proposal_messages'] == 1
+    await asyncio.sleep(0.01)  # wait for the subscription id to be saved
+
+    assert multiplexer.stats()['wire_streams'] == 2, "the failed put consumer left, the call consumer is still there"
+    call_subscription.dispose()
+    assert multiplexer.stats()['wire_streams'] == 1, "array subscription is released with its last consumer"
+    await asyncio.sleep(0.01)
+    assert api.send_request == {1: {'forget': 'ARRAY1'}}
+
+
+@pytest.mark.asyncio
+async def test_merged_proposals_are_registered():
+    api = API()
+    subscription_manager = SubscriptionManager(api)
+    multiplexer = subscription_manager.enable_proposal_multiplexing()
+    call_request = {**PROPOSAL, 'contract_type': 'CALL', 'barrier': '+0.1'}
+    call = await subscription_manager.subscribe(call_request)
+    call_again = await subscription_manager.subscribe(call_request)
+    assert call_again is call, "the same proposal subscribed later reuses the stream"
+    assert api.send_and_get_source_called == 1
+    assert multiplexer.stats()['wire_streams'] == 1 and multiplexer.stats()['proposal_subscriptions'] == 1
+    assert len(subscription_manager.subs_per_msg_type['proposal']) == 1
+
+    calls, completed = [], []
+    call.subscribe(calls.append, on_completed=lambda: completed.append(True))
+    call_subscription = call.subscribe(lambda response: None)
+    call_subscription.dispose()
+    assert await subscription_manager.subscribe(call_request) is call, "a consumer is still there"
+
+    await subscription_manager.forget_all('proposal')
+    assert completed == [True], "forget_all('proposal') ends the merged proposals"
+    assert api.send_request[1] == {'forget_all': ['proposal', 'proposal_array']}
+    assert multiplexer.stats() == {'proposal_subscriptions': 0, 'wire_streams': 0, 'array_messages': 0,
+                                   'proposal_messages': 0}
+    assert subscription_manager.sources == {}
+
+    call = await subscription_manager.subscribe(call_request)
+    assert api.send_and_get_source_called == 2, "a new stream once the previous one is forgotten"
+    call.subscribe(calls.append).dispose()
+    assert await subscription_manager.subscribe(call_request) is not call, \
+        "no dead stream returned after the last consumer left"
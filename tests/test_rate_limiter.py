@@ -0,0 +1,19 @@
+import time
+
+import pytest
+
+from deriv_api.rate_limiter import RateLimiter
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter():
+    with pytest.raises(ValueError, match='rate and period should be positive'):
+        RateLimiter(0)
+    limiter = RateLimiter(20, burst=5)
+    start = time.monotonic()
+    for _ in range(5):
+        await limiter.acquire()
+    assert time.monotonic() - start < 0.05, "burst is not limited"
+    for _ in range(4):
+        await limiter.acquire()
+    assert time.monotonic() - start >= 0.15, "then at most 20 acquisitions per second"
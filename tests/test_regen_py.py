@@ -0,0 +1,80 @@
+import ast
+import importlib.util
+import os
+import shutil
+
+from deriv_api import deriv_api_calls
+from deriv_api.deriv_api_calls import compile_validator, get_validator, method_configs, method_docs
+
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+schema_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schemas')
+
+
+def load_module(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+regen_py = load_module('regen_py', os.path.join(root_dir, 'scripts', 'regen_py.py'))
+
+
+def outcome(validator, args):
+    try:
+        return validator(dict(args))
+    except ValueError as err:
+        return str(err)
+
+
+def test_tables_from_schemas():
+    docs, configs = regen_py.tables_from_schemas(regen_py.load_schemas(schema_dir))
+    assert list(docs) == ['buy', 'ping', 'ticks', 'website_status']
+    for method in docs:
+        assert docs[method] == method_docs[method], f'docs of {method}'
+        assert configs[method] == method_configs[method], f'config of {method}'
+
+    # the generated configs validate like the committed ones
+    requests = [('buy', {'buy': 'abc', 'price': '10.5'}), ('buy', {'price': 10}), ('buy', {'buy': 1, 'price': 'x'}),
+                ('ping', {}), ('ticks', {'ticks': ['R_50', 'R_100'], 'subscribe': True}), ('ticks', {'subscribe': 1}),
+                ('website_status', {'subscribe': '1', 'req_id': 3.0})]
+    for method, args in requests:
+        generated = compile_validator(method, configs[method])
+        assert outcome(generated, args) == outcome(get_validator(method), args), f'{method} {args}'
+
+
+def test_files_are_up_to_date():
+    docs, configs = regen_py.tables_from_module()
+    for path, content in regen_py.render_files(docs, configs).items():
+        with open(path) as file:
+            assert file.read() == content, f'{path} is not the output of scripts/regen_py.py, run it again'
+    assert deriv_api_calls.required_params == regen_py.required_params(method_configs)
+
+
+def test_render_files_from_schemas(tmp_path):
+    package_dir = os.path.join(root_dir, 'deriv_api')
+    for name in ['deriv_api_calls.py', 'subscription_manager.py']:
+        shutil.copy(os.path.join(package_dir, name), tmp_path)
+    docs, configs = regen_py.tables_from_schemas(regen_py.load_schemas(schema_dir))
+    for path, content in regen_py.render_files(docs, configs, str(tmp_path)).items():
+        with open(path, 'w') as file:
+            file.write(content)
+
+    calls = load_module('generated_calls', os.path.join(tmp_path, 'deriv_api_calls.py'))
+    assert list(calls.method_configs) == ['buy', 'ping', 'ticks', 'website_status']
+    assert calls.required_params == {'buy': ('buy', 'price'), 'ping': ('ping',), 'ticks': ('ticks',),
+                                     'website_status': ('website_status',)}
+    assert calls.get_validator('buy')({'buy': 'abc', 'price': '10'}) == {'buy': 'abc', 'price': 10}
+    assert calls.DerivAPICalls.ping.__doc__ == method_docs['ping']
+
+    with open(os.path.join(tmp_path, 'subscription_manager.py')) as file:
+        manager = ast.parse(file.read())
+    streams = next(node.value for node in manager.body
+                   if isinstance(node, ast.Assign) and node.targets[0].id == 'streams_list')
+    assert ast.literal_eval(streams) == ['buy', 'ticks', 'website_status']
+
+    with open(os.path.join(tmp_path, 'deriv_api_calls.pyi')) as file:
+        stub = ast.parse(file.read())
+    calls_class = next(node for node in stub.body if isinstance(node, ast.ClassDef) and node.name == 'DerivAPICalls')
+    assert [node.name for node in calls_class.body if isinstance(node, ast.AsyncFunctionDef)] == \
+           ['process_request', 'buy', 'ping', 'ticks', 'website_status']
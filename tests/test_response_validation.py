@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+from rx.subject import Subject
+
+from deriv_api import deriv_api
+from deriv_api.errors import ResponseValidationError
+from deriv_api.response_validation import ResponseValidator, get_response_validator
+from tests.test_deriv_api import MockedWs
+
+tick = {'echo_req': {'ticks': 'R_50'}, 'msg_type': 'tick',
+        'tick': {'ask': 1.5, 'bid': 1.4, 'epoch': 1634000000, 'id': 'abc', 'pip_size': 2, 'quote': 1.45,
+                 'symbol': 'R_50'}}
+
+
+def test_response_validator():
+    validate = get_response_validator('tick')
+    assert validate(tick) == []
+    assert get_response_validator('tick') is validate, 'compiled once'
+    assert validate({**tick, 'tick': {'epoch': '1634000000', 'quote': 1.45, 'new_field': 1}}) == [
+        'Required fields missing: symbol', "numeric value expected but found <class 'str'>: epoch",
+        'unexpected fields: new_field']
+    assert validate({'msg_type': 'tick', 'tick': []}) == [
+        'echo_req is missing', "dict value expected but found <class 'list'>: tick"]
+    assert validate({'echo_req': {}, 'msg_type': 'tick', 'error': {'code': 'InvalidSymbol', 'message': 'x'}}) == [], \
+        'error responses have no body'
+    assert get_response_validator('proposal_open_contract')(
+        {'echo_req': {}, 'msg_type': 'proposal_open_contract', 'proposal_open_contract': {}}) == [], \
+        'no open contract'
+    assert get_response_validator('ping')({'echo_req': {}, 'msg_type': 'ping', 'ping': 1}) == [
+        "string value expected but found <class 'int'>: ping"]
+    assert get_response_validator('statement')({'echo_req': {}, 'msg_type': 'statement', 'statement': {}}) == [], \
+        'only the envelope is checked without a config'
+
+
+def test_sampling():
+    errors = Subject()
+    reported = []
+    errors.subscribe(reported.append)
+    validator = ResponseValidator(errors, rate=3)
+    bad_tick = {**tick, 'tick': {}}
+    sampled = [validator.check(bad_tick) is not None for _ in range(7)]
+    assert sampled == [True, False, False, True, False, False, True], 'the first one, then one in 3'
+    assert validator.check({'echo_req': {}, 'msg_type': 'ping', 'ping': 'pong'}) == [], 'sampled per msg_type'
+    assert validator.checked == 4 and validator.failed == 3
+    assert len(reported) == 3 and isinstance(reported[0], ResponseValidationError)
+    assert reported[0].violations == ['Required fields missing: epoch, quote, symbol']
+    with pytest.raises(ValueError):
+        ResponseValidator(errors, rate=0)
+
+
+@pytest.mark.asyncio
+async def test_response_validation_in_api():
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection)
+    validator = api.enable_response_validation(rate=1)
+    errors = []
+    api.sanity_errors.subscribe(errors.append)
+    wsconnection.add_data({'ping': 1, 'msg_type': 'ping', 'echo_req': {'ping': 1}})
+    assert (await asyncio.wait_for(api.ping(), 1))['ping'] == 1, 'responses are still delivered'
+    assert validator.checked == 1
+    assert [str(err) for err in errors] == [
+        "ResponseValidationError:ping: string value expected but found <class 'int'>: ping"]
+
+    api.disable_response_validation()
+    wsconnection.add_data({'time': 1, 'msg_type': 'time', 'echo_req': {'time': 1}})
+    await asyncio.wait_for(api.time(), 1)
+    assert validator.checked == 1, 'not validated anymore'
+    wsconnection.clear()
+    await api.clear()
@@ -0,0 +1,33 @@
+import pytest
+
+from deriv_api.ring_buffer import RingBuffer
+
+
+def test_ring_buffer():
+    with pytest.raises(ValueError, match='capacity should be a positive integer'):
+        RingBuffer(0)
+    buffer = RingBuffer(3)
+    assert len(buffer) == 0
+    assert buffer.last().tolist() == []
+    with pytest.raises(IndexError):
+        buffer.latest()
+    for value in [1, 2]:
+        buffer.append(value)
+    assert buffer.last().tolist() == [1.0, 2.0]
+    for value in [3, 4, 5]:
+        buffer.append(value)
+    assert len(buffer) == 3, "size is limited by the capacity"
+    assert buffer.last().tolist() == [3.0, 4.0, 5.0], "oldest values are overwritten"
+    assert buffer.last(2).tolist() == [4.0, 5.0]
+    assert buffer.last(10).tolist() == [3.0, 4.0, 5.0]
+    assert buffer.latest() == 5.0
+    window = buffer.last(1)
+    buffer.append(6)
+    buffer.append(7)
+    buffer.append(8)
+    assert window.tolist() == [8.0], "windows are zero-copy views on the buffer"
+    assert buffer.nbytes == 2 * 3 * 8
+
+    buffer = RingBuffer(2, 'q')
+    buffer.append(1634000000)
+    assert buffer.last().tolist() == [1634000000]
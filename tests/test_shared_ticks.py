@@ -0,0 +1,86 @@
+import asyncio
+import multiprocessing
+
+import pytest
+
+from benchmarks.mock_server import MockServer
+from deriv_api import shared_ticks
+from deriv_api.deriv_api import DerivAPI
+from deriv_api.errors import ResponseError
+from deriv_api.shared_ticks import SharedTickPublisher, SharedTickReader
+
+
+def read_ticks(reader_args, ready, results):
+    reader = SharedTickReader(**reader_args)
+    counts = reader.counts()
+    ready.set()
+    while reader.count('R_50') < 5:
+        reader.wait(counts, timeout=5)
+        counts = reader.counts()
+    epochs, quotes = reader.last('R_50')
+    copies = reader.copy('R_50', 2)
+    results.put((epochs.tolist(), quotes.tolist(), reader.last('R_100')[0].tolist(), epochs.readonly,
+                 copies[0].tolist()))
+    del epochs, quotes
+    reader.close()
+
+
+def test_shared_ticks():
+    with pytest.raises(ValueError, match='capacity should be greater than 1'):
+        SharedTickPublisher(['R_50'], capacity=1)
+    publisher = SharedTickPublisher(['R_50', 'R_100'], capacity=4)
+    ready = multiprocessing.Event()
+    results = multiprocessing.Queue()
+    worker = multiprocessing.Process(target=read_ticks, args=(publisher.reader_args(), ready, results))
+    worker.start()
+    assert ready.wait(5)
+    for i in range(5):
+        publisher.on_tick({'msg_type': 'tick', 'tick': {'symbol': 'R_50', 'epoch': 100 + i, 'quote': 1.5 + i}})
+    epochs, quotes, other_epochs, readonly, copied_epochs = results.get(timeout=5)
+    worker.join(5)
+    assert epochs == [102, 103, 104], "capacity - 1 latest ticks"
+    assert quotes == [3.5, 4.5, 5.5]
+    assert other_epochs == []
+    assert readonly, "workers get read-only views"
+    assert copied_epochs == [103, 104]
+    publisher.close()
+
+
+def test_copy_is_not_torn(mocker):
+    publisher = SharedTickPublisher(['R_50'], capacity=4)
+    buffer = publisher.buffers['R_50']
+    for i in range(3):
+        buffer.append(100 + i, 1.0 + i)
+    copy_array = shared_ticks.array
+    published_during_copy = [2]
+
+    def publish_during_copy(typecode, values):
+        # the publisher writes while the epochs are copied
+        if typecode == 'q' and published_during_copy:
+            for _ in range(published_during_copy.pop()):
+                buffer.append(100 + buffer.count, 1.0 + buffer.count)
+        return copy_array(typecode, values)
+
+    mocker.patch.object(shared_ticks, 'array', publish_during_copy)
+    epochs, quotes = buffer.copy()
+    assert epochs.tolist() == [102, 103, 104] and quotes.tolist() == [3.0, 4.0, 5.0], "copied again"
+    published_during_copy.append(2)
+    epochs, quotes = buffer.copy(1)
+    assert epochs.tolist() == [104] and quotes.tolist() == [5.0], "the latest tick is not overwritten by 2 ticks"
+    publisher.close()
+
+
+@pytest.mark.asyncio
+async def test_track_error():
+    server = MockServer(symbols=1)
+    api = DerivAPI(transport=server.loopback())
+    errors = []
+    api.sanity_errors.subscribe(errors.append)
+    # published under a symbol the server does not know
+    publisher = SharedTickPublisher(['BAD'], capacity=4)
+    await publisher.track(api, 'BAD')
+    assert (await asyncio.wait_for(api.ping(), 1))['ping'] == 'pong', "the error of the stream does not stop the api"
+    assert publisher.subscriptions == {}, "the symbol is untracked"
+    assert isinstance(errors[0], ResponseError) and errors[0].code == 'InvalidSymbol'
+    publisher.close()
+    await api.clear()
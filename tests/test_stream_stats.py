@@ -0,0 +1,49 @@
+import time
+
+from rx.subject import Subject
+
+from deriv_api import stream_stats
+from deriv_api.stream_stats import StreamStats, instrument
+
+
+def test_stream_stats(mocker):
+    stats = StreamStats('ticks')
+    source = Subject()
+    received = []
+
+    def consumer(response):
+        received.append(response)
+        time.sleep(0.002)
+
+    source.pipe(instrument(stats)).subscribe(consumer)
+    now = time.time()
+    source.on_next({'msg_type': 'tick', 'tick': {'epoch': int(now) - 2, 'quote': 1.0}})
+    source.on_next({'msg_type': 'tick', 'tick': {'epoch': int(now) - 1, 'quote': 1.0}})
+    assert len(received) == 2, "messages are passed through"
+    snapshot = stats.snapshot()
+    assert snapshot['msg_type'] == 'ticks'
+    assert snapshot['messages'] == 2
+    assert 1 <= snapshot['server_lag'] < 2
+    assert 2 <= snapshot['max_server_lag'] < 3
+    assert snapshot['mean_dispatch_seconds'] >= 0.002, "time spent by the consumer is recorded"
+    assert snapshot['max_dispatch_seconds'] >= 0.002
+    assert sum(snapshot['inter_arrival_histogram']) == 1, "one interval between two messages"
+    assert sum(snapshot['inter_arrival_histogram'][2:]) == 1, "interval was longer than 2ms"
+    assert snapshot['seconds_since_last_message'] >= 0
+
+    stats.on_message({'msg_type': 'balance', 'balance': {'balance': 100}})
+    assert stats.server_lag == snapshot['server_lag'], "message without epoch does not change the server lag"
+
+    mocker.patch.object(stream_stats, 'HISTOGRAM_WINDOW', 10.0)
+    stats.window_started_at -= 10
+    stats.on_message({'msg_type': 'balance'})
+    assert sum(stats.snapshot()['inter_arrival_histogram']) == 3, "previous window is kept"
+    stats.window_started_at -= 10
+    stats.on_message({'msg_type': 'balance'})
+    assert sum(stats.snapshot()['inter_arrival_histogram']) == 2, "older windows are dropped"
+    stats.window_started_at -= 25
+    stats.on_message({'msg_type': 'balance'})
+    assert sum(stats.snapshot()['inter_arrival_histogram']) == 1, \
+        "the previous window is dropped after more than a window without messages"
+    stats.window_started_at -= 25
+    assert sum(stats.snapshot()['inter_arrival_histogram']) == 0, "silent streams age in the snapshots too"
@@ -112,3 +112,68 @@ async def test_forget_all():
     subscription_manager = SubscriptionManager(api)
     result = await subscription_manager.forget_all("hello")
     assert result == {'forget_all': ["hello"]}
+
+@pytest.mark.asyncio
+async def test_subscribe_conflated():
+    api = API()
+    subscription_manager = SubscriptionManager(api)
+    with pytest.raises(APIError, match='Conflation is only supported for proposal, proposal_open_contract streams'):
+        await subscription_manager.subscribe_conflated({'ticks': 'R_50'})
+    api.mocked_response = {"msg_type": "proposal", 'subscription': {'id': 'ID11111'}}
+    conflated, emit = await asyncio.gather(subscription_manager.subscribe_conflated({'proposal': 1}), api.emit())
+    assert api.send_and_get_source_request[1] == {'proposal': 1, 'subscribe': 1}
+    api.subject.on_next(api.mocked_response)
+    assert (await conflated.get()) == api.mocked_response
+    assert conflated.coalesced == 1, "first response was overwritten by the second one"
+
+@pytest.mark.asyncio
+async def test_sharding():
+    api1 = API()
+    api2 = API()
+    subscription_manager = SubscriptionManager(api1, max_subscriptions=1)
+    api1.mocked_response = {"msg_type": "tick", 'subscription': {'id': 'ID1'}}
+    await asyncio.gather(subscription_manager.subscribe({'ticks': 'R_50'}), api1.emit())
+    with pytest.raises(APIError, match='All connections reached the subscription limit'):
+        await subscription_manager.subscribe({'ticks': 'R_100'})
+    subscription_manager.add_connection(api2)
+    api2.mocked_response = {"msg_type": "tick", 'subscription': {'id': 'ID2'}}
+    await asyncio.gather(subscription_manager.subscribe({'ticks': 'R_100'}), api2.emit())
+    assert api1.send_and_get_source_called == 1
+    assert api2.send_and_get_source_called == 1, "new subscription is sent on the least loaded connection"
+    stats = subscription_manager.connection_stats()
+    assert [s['subscriptions'] for s in stats] == [1, 1]
+    assert [s['messages'] for s in stats] == [1, 1]
+    assert stats[0]['messages_per_second'] > 0
+
+    await subscription_manager.forget('ID2')
+    assert api2.send_request == {1: {'forget': 'ID2'}}, "forget is sent on the connection of the subscription"
+    assert api1.send_called == 0
+    assert [s['subscriptions'] for s in subscription_manager.connection_stats()] == [1, 0]
+
+    result = await subscription_manager.forget_all('ticks')
+    assert result == {'forget_all': ['ticks']}
+    assert api1.send_request[1] == {'forget_all': ['ticks']}
+    assert api2.send_request[2] == {'forget_all': ['ticks']}, "forget_all is sent on every connection"
+    assert [s['subscriptions'] for s in subscription_manager.connection_stats()] == [0, 0]
+
+@pytest.mark.asyncio
+async def test_stats():
+    api = API()
+    subscription_manager = SubscriptionManager(api)
+    api.mocked_response = {"msg_type": "proposal", 'subscription': {'id': 'ID1'}}
+    source = await subscription_manager.subscribe({'proposal': 1})
+    source.subscribe(lambda response: None)
+    await api.emit()
+    api.subject.on_next(api.mocked_response)
+    stats = subscription_manager.stats()
+    assert list(stats.keys()) == [dict_to_cache_key({'proposal': 1})]
+    assert list(stats.values())[0]['msg_type'] == 'proposal'
+    assert list(stats.values())[0]['messages'] == 2
+    assert subscription_manager.stats_by_msg_type() == {'proposal': {'streams': 1, 'messages': 2}}
+    await asyncio.sleep(0.01)  # wait for the subscription id to be saved
+    await subscription_manager.forget('ID1')
+    assert subscription_manager.stats() == {}, "only live streams are reported"
+
+    subscription_manager = SubscriptionManager(api, stats_enabled=False)
+    await asyncio.gather(subscription_manager.subscribe({'proposal': 1}), api.emit())
+    assert subscription_manager.stats() == {}
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+from rx.subject import Subject
+
+from benchmarks.mock_server import MockServer
+from deriv_api.deriv_api import DerivAPI
+from deriv_api.errors import ResponseError
+from deriv_api.tick_store import TickStore, BYTES_PER_TICK
+
+
+def tick(symbol, epoch, quote):
+    return {'msg_type': 'tick', 'tick': {'symbol': symbol, 'epoch': epoch, 'quote': quote, 'id': 'A1'}}
+
+
+def test_tick_store():
+    store = TickStore(capacity=4)
+    for i in range(6):
+        store.on_tick(tick('R_50', 100 + i, 10.5 + i))
+    store.append('R_100', 100, 1.5)
+    epochs, quotes = store.last('R_50')
+    assert epochs.tolist() == [102, 103, 104, 105]
+    assert quotes.tolist() == [12.5, 13.5, 14.5, 15.5]
+    epochs, quotes = store.last('R_50', 2)
+    assert epochs.tolist() == [104, 105]
+    epochs, quotes = store.between('R_50', 103, 104)
+    assert epochs.tolist() == [103, 104]
+    assert quotes.tolist() == [13.5, 14.5]
+    assert store.between('R_50', 0, 10)[0].tolist() == []
+    assert store.last('R_100')[1].tolist() == [1.5], "every symbol has its own buffer"
+    assert store.nbytes == 2 * 4 * BYTES_PER_TICK
+
+
+@pytest.mark.asyncio
+async def test_track():
+    class API:
+        def __init__(self):
+            self.requests = []
+            self.source = Subject()
+
+        async def subscribe(self, request):
+            self.requests.append(request)
+            return self.source
+
+    api = API()
+    store = TickStore(capacity=10)
+    subscription = await store.track(api, 'R_50')
+    assert (await store.track(api, 'R_50')) is subscription, "a symbol is subscribed once"
+    assert api.requests == [{'ticks': 'R_50'}]
+    api.source.on_next(tick('R_50', 100, 1.0))
+    assert store.last('R_50')[0].tolist() == [100]
+    store.untrack('R_50')
+    api.source.on_next(tick('R_50', 101, 1.0))
+    assert len(store.buffers['R_50']) == 1, "untracked symbol does not receive ticks"
+
+
+@pytest.mark.asyncio
+async def test_track_error():
+    api = DerivAPI(transport=MockServer(symbols=1).loopback())
+    errors = []
+    api.sanity_errors.subscribe(errors.append)
+    store = TickStore(capacity=10)
+    await store.track(api, 'BAD')
+    assert (await asyncio.wait_for(api.ping(), 1))['ping'] == 'pong', "the error of the stream does not stop the api"
+    assert 'BAD' not in store.subscriptions, "the symbol is untracked"
+    assert isinstance(errors[0], ResponseError) and errors[0].code == 'InvalidSymbol'
+    await api.clear()
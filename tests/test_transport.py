@@ -0,0 +1,102 @@
+import asyncio
+import json
+
+import pytest
+from websockets.exceptions import ConnectionClosed
+
+from deriv_api import deriv_api
+from deriv_api.errors import APIError, ResponseError
+from benchmarks.mock_server import MockServer
+from deriv_api.transport import LoopbackTransport, Transport, WebsocketTransport
+
+
+@pytest.mark.asyncio
+async def test_loopback_transport():
+    transport = LoopbackTransport()
+    await transport.connect()
+    await transport.send('{"ping": 1}')
+    assert await transport.peer.recv() == '{"ping": 1}'
+    frame = {'msg_type': 'ping'}
+    await transport.peer.send(frame)
+    assert await transport.recv() is frame, 'not copied'
+
+    pending = asyncio.ensure_future(transport.recv())
+    await transport.peer.send('last')
+    await transport.peer.close()
+    assert await pending == 'last', 'the frames sent before closing are received'
+    with pytest.raises(ConnectionClosed):
+        await transport.recv()
+    with pytest.raises(ConnectionClosed):
+        await transport.send('{}')
+    assert [frame async for frame in transport.peer] == []
+    with pytest.raises(ConnectionClosed):
+        await transport.connect()
+
+
+@pytest.mark.asyncio
+async def test_api_over_loopback():
+    transport = LoopbackTransport()
+    api = deriv_api.DerivAPI(transport=transport)
+
+    async def pong():
+        async for message in transport.peer:
+            request = json.loads(message)
+            # half of the responses are handed over parsed
+            response = {'echo_req': request, 'msg_type': 'ping', 'ping': 'pong', 'req_id': request['req_id']}
+            await transport.peer.send(response if request['req_id'] % 2 else json.dumps(response))
+
+    server = asyncio.ensure_future(pong())
+    assert [(await api.ping())['ping'] for _ in range(4)] == ['pong'] * 4
+    assert api.wsconnection is transport
+    await api.clear()
+    assert transport.closed, 'closed by disconnect'
+    await server
+
+
+@pytest.mark.asyncio
+async def test_api_with_mock_server():
+    server = MockServer(symbols=2, contract_ticks=2, seed=1)
+    api = deriv_api.DerivAPI(transport=server.loopback())
+    assert (await api.ping())['ping'] == 'pong'
+
+    ticks = []
+    (await api.subscribe({'ticks': 'R_0'})).subscribe(ticks.append)
+    proposal = await api.proposal({'proposal': 1, 'amount': 10, 'basis': 'payout', 'contract_type': 'CALL',
+                                   'currency': 'USD', 'duration': 2, 'duration_unit': 't', 'symbol': 'R_1'})
+    bought = await api.buy({'buy': proposal['proposal']['id'], 'price': 10})
+    contracts = []
+    (await api.subscribe({'proposal_open_contract': 1, 'contract_id': bought['buy']['contract_id']})).subscribe(
+        contracts.append)
+    # until the server got the subscriptions
+    await asyncio.sleep(0.01)
+    for _ in range(2):
+        server.step()
+    await asyncio.sleep(0.01)
+    assert len(ticks) == 3, 'the first tick, then one per step'
+    assert [contract['proposal_open_contract']['is_sold'] for contract in contracts] == [0, 0, 1]
+
+    server.error_rate = 1
+    with pytest.raises(ResponseError, match='Error injected by the mock server'):
+        await api.ping()
+    await api.clear()
+
+
+@pytest.mark.asyncio
+async def test_websocket_transport(mocker):
+    mocker.patch('deriv_api.deriv_api.DerivAPI.api_connect', return_value='')
+    api = deriv_api.DerivAPI(app_id=1234, endpoint='localhost')
+    assert isinstance(api.transport, WebsocketTransport) and api.transport.url == api.api_url
+    await asyncio.sleep(0.1)
+    await api.clear()
+
+
+@pytest.mark.asyncio
+async def test_websocket_transport_not_connected():
+    with pytest.raises(TypeError):
+        Transport()
+    transport = WebsocketTransport('ws://localhost')
+    with pytest.raises(APIError, match='not connected'):
+        await transport.send('{"ping": 1}')
+    with pytest.raises(APIError, match='not connected'):
+        await transport.recv()
+    await transport.close()